@@ -37,18 +37,15 @@ def ensure_default_configs():
     for filename, default_data in default_configs.items():
         config_path = config_dir / filename
         if not config_path.exists():
-            with open(config_path, 'w') as f:
-                json.dump(default_data, f, indent=2)
+            config_path.write_text(json.dumps(default_data, indent=2))
             logger.info(f"✅ Created default config: {filename}")
         else:
             # Ensure needle_calibrations key exists
             try:
-                with open(config_path, 'r') as f:
-                    data = json.load(f)
+                data = json.loads(config_path.read_bytes())
                 if 'needle_calibrations' not in data:
                     data['needle_calibrations'] = {}
-                    with open(config_path, 'w') as f:
-                        json.dump(data, f, indent=2)
+                    config_path.write_text(json.dumps(data, indent=2))
                     logger.info(f"✅ Updated config with needle_calibrations: {filename}")
             except Exception as e:
                 logger.error(f"❌ Failed to update config {filename}: {e}")
@@ -69,8 +66,7 @@ def get_needle_image_path(default="gauges/needle.svg") -> str:
 def load_gauge_config(config_path: Path) -> Dict[str, Any]:
     """Load gauge config, ensuring it has required structure"""
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = json.loads(config_path.read_bytes())
         if 'needle_calibrations' not in config:
             config['needle_calibrations'] = {}
         return config
@@ -89,8 +85,7 @@ def load_gauge_config(config_path: Path) -> Dict[str, Any]:
 def save_gauge_config(config_path: Path, config: Dict[str, Any]):
     """Save gauge config"""
     try:
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        config_path.write_text(json.dumps(config, indent=2))
         logger.info(f"✅ Saved config: {config_path.name}")
         return True
     except Exception as e:
@@ -9,26 +9,194 @@ Three step process:
 System calculates angles automatically from pixel positions.
 """
 
+import bisect
+import copy
+import functools
+import hashlib
 import json
 import logging
 import math
+import os
+import threading
+import traceback
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import List, Tuple, Optional
+import numpy as np
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Tuple, Optional
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QComboBox, QMessageBox, QGroupBox, QFrame,
-    QSpinBox, QDoubleSpinBox, QToolBox, QLineEdit, QFileDialog
+    QSpinBox, QDoubleSpinBox, QToolBox, QLineEdit, QFileDialog, QInputDialog
+)
+from PyQt5.QtGui import QPixmap, QPainter, QPainterPath, QPen, QColor, QFont, QImage, QImageReader
+from PyQt5.QtCore import (
+    Qt, QSize, QRectF, QLineF, QTimer, QSignalBlocker, QObject, QRunnable, QThreadPool, pyqtSignal,
+    QStringListModel
 )
-from PyQt5.QtGui import QPixmap, QPainter, QPen, QColor, QFont, QImage
-from PyQt5.QtCore import Qt, QSize, QRectF, QTimer
 from PyQt5.QtSvg import QSvgRenderer
-from PIL import Image
 
-logger = logging.getLogger(__name__)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The calibrator has no overlapping opaque sibling widgets, so skip Qt's
+# sibling-region subtraction on geometry changes. Read when the
+# QApplication is created, i.e. in main() or by whoever imports this module.
+os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Project root (parent of src/) and its gauge artwork folder
+_MODULE_ROOT = Path(__file__).parent.parent
+_GAUGES_DIR = _MODULE_ROOT / "gauges"
+
+# Overlay color names -> RGB, plus one shared QColor per RGB value
+_COLOR_MAP = {
+    "red": (255, 0, 0),
+    "green": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "yellow": (255, 255, 0),
+    "cyan": (0, 255, 255),
+    "orange": (255, 165, 0),
+}
+_QCOLOR_CACHE = {rgb: QColor(*rgb) for rgb in _COLOR_MAP.values()}
+
+
+def _dumps(obj) -> bytes:
+    """Serialize config to indented, key-sorted JSON bytes (orjson when available)
+
+    Sorted keys keep the bytes independent of dict insertion order (a
+    renamed needle is re-inserted last), so the write-skip hash and
+    on-disk diffs stay stable; both paths emit the same layout.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False).encode()
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_config_atomic(path: Path, payload: bytes):
+    """Write a config file via a temp file + os.replace so a crash never leaves it half-written"""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _normalize_config(config, gauge_name: str = None) -> dict:
+    """Coerce a parsed gauge config into a dict with a needle_calibrations dict"""
+    if not isinstance(config, dict):
+        config = {"name": gauge_name} if gauge_name else {}
+    if not isinstance(config.setdefault("needle_calibrations", {}), dict):
+        config["needle_calibrations"] = {}
+    return config
+
+
+@contextmanager
+def _signals_off(*widgets):
+    """Block signals of all widgets for the duration of the block (restored even on error)"""
+    blockers = [QSignalBlocker(w) for w in widgets]
+    try:
+        yield
+    finally:
+        for blocker in reversed(blockers):
+            blocker.unblock()
+
+
+def _list_combo() -> QComboBox:
+    """QComboBox backed by a QStringListModel, for lists that _set_combo_items replaces wholesale"""
+    combo = QComboBox()
+    combo.setModel(QStringListModel(combo))
+    return combo
+
+
+def _set_combo_items(combo: QComboBox, items: List[str]):
+    """Replace a _list_combo's items with one model reset (clear() + addItems() is two
+    model updates); an unchanged list only moves the selection back to the first item
+    """
+    model = combo.model()
+    if model.stringList() != items:
+        model.setStringList(items)
+    else:
+        combo.setCurrentIndex(0 if items else -1)
+
+
+def _set_text(label: QLabel, text: str):
+    """setText only when the text differs (an identical setText still repaints)"""
+    if label.text() != text:
+        label.setText(text)
+
+
+@functools.lru_cache(maxsize=4)
+def _list_gauges(dir_str: str) -> frozenset:
+    """File names in a gauges directory, listed once (cache_clear() to rescan)"""
+    try:
+        with os.scandir(dir_str) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _gauges_file_exists(path: Path) -> bool:
+    """exists() for files in the gauges directory, answered from the cached listing.
+
+    A miss rescans once, so files added since the listing was taken are found.
+    """
+    if path.parent != _GAUGES_DIR:
+        return path.exists()
+    if path.name in _list_gauges(str(_GAUGES_DIR)):
+        return True
+    _list_gauges.cache_clear()
+    return path.name in _list_gauges(str(_GAUGES_DIR))
+
+
+@functools.lru_cache(maxsize=64)
+def _project_path(relative: str) -> Path:
+    """Absolute path of a project-relative path such as a preset's bg_image"""
+    return _MODULE_ROOT / relative
+
+
+@functools.lru_cache(maxsize=64)
+def _gauge_bg_path(gauge_name: str) -> Path:
+    """Background image path for a (lower-case) gauge name"""
+    return _GAUGES_DIR / f"{gauge_name}_bg.png"
+
+
+@functools.lru_cache(maxsize=64)
+def _config_path(config_dir: Path, gauge_name: str) -> Path:
+    """Config file path for a gauge name (any case)"""
+    return config_dir / f"{gauge_name.lower()}.json"
+
+
+def _find_needle_image(gauges_dir: Path, needle_id: str, gauge_name: str) -> Optional[Path]:
+    """Locate the needle image for a needle, preferring SVG over PNG"""
+    names = _list_gauges(str(gauges_dir))
+    candidates = (
+        "needle.svg",                # Shared needle
+        f"{needle_id}_needle.svg",
+        f"{gauge_name}_needle.svg",
+        f"{needle_id}_needle.png",
+        f"{gauge_name}_needle.png",
+    )
+    for candidate in candidates:
+        if candidate in names:
+            return gauges_dir / candidate
+    return None
+
+
+@dataclass(slots=True)
 class CalibrationPoint:
     """Calibration point with pixel position and value"""
     x: float
@@ -43,7 +211,7 @@ class CalibrationPoint:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class NeedleType:
     """Needle type = reusable geometry definition from SVG file"""
     type_name: str  # "default", "toyota", etc.
@@ -54,14 +222,21 @@ class NeedleType:
     end_y: float = 0
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            "type_name": self.type_name,
+            "svg_path": self.svg_path,
+            "pivot_x": self.pivot_x,
+            "pivot_y": self.pivot_y,
+            "end_x": self.end_x,
+            "end_y": self.end_y,
+        }
 
     @classmethod
     def from_dict(cls, data):
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class NeedleInstance:
     """Instance = one use of a needle type on a gauge, with its own calibration"""
     instance_id: str  # "instance1", "instance2", etc.
@@ -93,14 +268,12 @@ class NeedleInstance:
 
     @classmethod
     def from_dict(cls, data):
-        data = data.copy()
-        points_data = data.pop("calibration_points", [])
-        instance = cls(**data)
-        instance.calibration_points = [CalibrationPoint.from_dict(p) for p in points_data]
-        return instance
+        fields = {k: v for k, v in data.items() if k != "calibration_points"}
+        points = [CalibrationPoint(**p) for p in data.get("calibration_points", [])]
+        return cls(**fields, calibration_points=points)
 
 
-@dataclass
+@dataclass(slots=True)
 class NeedleCalibration:
     """Complete needle calibration data"""
     needle_id: str
@@ -123,6 +296,13 @@ class NeedleCalibration:
     # Gauge value range
     min_value: float = 0
     max_value: float = 100
+
+    # Keys accepted by from_dict (ignore needle_scale, scale, etc.)
+    _VALID_FIELDS = frozenset({
+        'needle_id', 'needle_image_path', 'gauge_name',
+        'needle_pivot_x', 'needle_pivot_y', 'needle_end_x', 'needle_end_y',
+        'gauge_pivot_x', 'gauge_pivot_y', 'min_value', 'max_value'
+    })
     
     def to_dict(self):
         return {
@@ -142,23 +322,19 @@ class NeedleCalibration:
     
     @classmethod
     def from_dict(cls, data):
-        data = data.copy()
-        points_data = data.pop("calibration_points", [])
-        
-        # Filter to only valid fields (ignore needle_scale, scale, etc.)
-        valid_fields = {
-            'needle_id', 'needle_image_path', 'gauge_name',
-            'needle_pivot_x', 'needle_pivot_y', 'needle_end_x', 'needle_end_y',
-            'gauge_pivot_x', 'gauge_pivot_y', 'min_value', 'max_value'
-        }
-        filtered_data = {k: v for k, v in data.items() if k in valid_fields}
-        
-        calib = cls(**filtered_data)
-        calib.calibration_points = [CalibrationPoint.from_dict(p) for p in points_data]
-        return calib
+        # Filter to only valid fields (calibration_points is handled separately)
+        filtered_data = {k: data[k] for k in data.keys() & cls._VALID_FIELDS}
+        points = [CalibrationPoint(**p) for p in data.get("calibration_points", [])]
+        return cls(**filtered_data, calibration_points=points)
+
+    def clone(self):
+        """Independent copy (own calibration point objects), cheaper than a from_dict round trip"""
+        return replace(self, calibration_points=[
+            CalibrationPoint(p.x, p.y, p.value) for p in self.calibration_points
+        ])
 
 
-@dataclass
+@dataclass(slots=True)
 class VisibilityCondition:
     """Defines when a symbol should be visible"""
     condition_type: str = "always"  # "always", "bool", "threshold"
@@ -168,14 +344,20 @@ class VisibilityCondition:
     value: float = 0.0  # For threshold conditions
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            "condition_type": self.condition_type,
+            "data_key": self.data_key,
+            "show_when": self.show_when,
+            "operator": self.operator,
+            "value": self.value,
+        }
 
     @classmethod
     def from_dict(cls, data):
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     """Visual symbol/icon overlay (warning lights, indicators, etc.)"""
     symbol_id: str
@@ -195,10 +377,30 @@ class Symbol:
     # Layer order
     z_index: int = 0  # Higher = rendered on top
 
+    # Derived: both coordinates set (kept in sync by __post_init__/set_position, not serialized)
+    positioned: bool = field(default=False, init=False, compare=False, repr=False)
+
+    def __post_init__(self):
+        self.positioned = self.position_x > 0 and self.position_y > 0
+
+    def set_position(self, x: float, y: float):
+        self.position_x = x
+        self.position_y = y
+        self.positioned = x > 0 and y > 0
+
     def to_dict(self):
-        data = asdict(self)
-        data["visibility_condition"] = self.visibility_condition.to_dict()
-        return data
+        return {
+            "symbol_id": self.symbol_id,
+            "image_path": self.image_path,
+            "display_name": self.display_name,
+            "position_x": self.position_x,
+            "position_y": self.position_y,
+            "scale": self.scale,
+            "anchor": self.anchor,
+            "visible": self.visible,
+            "visibility_condition": self.visibility_condition.to_dict(),
+            "z_index": self.z_index,
+        }
 
     @classmethod
     def from_dict(cls, data):
@@ -208,90 +410,425 @@ class Symbol:
         return cls(**data, visibility_condition=vis_condition)
 
 
+def _fit_size(src_w: int, src_h: int, box_w: int, box_h: int) -> Tuple[int, int]:
+    """Largest size with the source aspect ratio that fits in the box (as _rescale_source sizes it)"""
+    scale = min(box_w / src_w, box_h / src_h)
+    return int(src_w * scale), int(src_h * scale)
+
+
+def _render_svg(image_path: str) -> Optional[QImage]:
+    """Render an SVG at its default size into a transparent QImage (safe off the GUI thread)"""
+    svg_renderer = QSvgRenderer(image_path)
+    if not svg_renderer.isValid():
+        return None
+
+    svg_size = svg_renderer.defaultSize()
+    width = svg_size.width()
+    height = svg_size.height()
+
+    qimage = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    qimage.fill(Qt.transparent)
+
+    painter = QPainter(qimage)
+    painter.setRenderHint(QPainter.Antialiasing, True)
+    painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+    svg_renderer.render(painter, QRectF(0, 0, width, height))
+    painter.end()
+    return qimage
+
+
+class _ImagePrefetchSignals(QObject):
+    """Tells GUI-thread widgets that a background decode has been published"""
+    finished = pyqtSignal(str)  # image path
+
+
+class _ImagePrefetchJob(QRunnable):
+    """Decode an image off the GUI thread into ImageDisplayWidget's prefetch table.
+
+    Rasters are decoded straight to the size they would be shown at in a
+    box_w x box_h widget; SVGs are rendered at their default size. QImage
+    only - the GUI thread turns results into QPixmaps when it claims them.
+    started/cancelled are guarded by ImageDisplayWidget._prefetch_lock; done
+    is set once the job has published (or given up).
+    """
+
+    def __init__(self, image_path: str, box_w: int, box_h: int):
+        super().__init__()
+        self.image_path = image_path
+        self.box_w = box_w
+        self.box_h = box_h
+        self.started = False
+        self.cancelled = False  # Taken back by the GUI thread before a worker got to it
+        self.done = threading.Event()
+
+    def run(self):
+        image_path = self.image_path
+        with ImageDisplayWidget._prefetch_lock:
+            cancelled = self.cancelled
+            self.started = True
+        if cancelled:
+            ImageDisplayWidget._notify_prefetch(image_path)  # Let async loads re-check the cache
+            return
+
+        result = None
+        try:
+            mtime = os.stat(image_path).st_mtime_ns
+            if image_path.lower().endswith('.svg'):
+                image = _render_svg(image_path)
+                if image is not None:
+                    result = (mtime, (image.width(), image.height()), image)
+            else:
+                reader = QImageReader(image_path)
+                src_size = reader.size()
+                if src_size.isValid():
+                    src = (src_size.width(), src_size.height())
+                    reader.setScaledSize(QSize(*_fit_size(*src, self.box_w, self.box_h)))
+                    image = reader.read()
+                    if not image.isNull():
+                        result = (mtime, src, image)
+        except OSError:
+            pass
+        except Exception as e:
+            logger.warning(f"⚠️ Background decode of {image_path} failed: {e}")
+        finally:
+            # Always publish, or a GUI-thread _peek_prefetched would wait on done for nothing
+            ImageDisplayWidget._finish_prefetch(self, result)
+
+
+class _ConfigWriteSignals(QObject):
+    """Reports background config writes back to the GUI thread"""
+    written = pyqtSignal(object, object, object)  # path, new mtime_ns or None, error message or None
+
+
+class _ConfigWriteJob(QRunnable):
+    """Write an already-serialized config payload off the GUI thread"""
+
+    def __init__(self, path: Path, payload: bytes, signals: _ConfigWriteSignals):
+        super().__init__()
+        self.path = path
+        self.payload = payload
+        self.signals = signals
+
+    def run(self):
+        try:
+            _write_config_atomic(self.path, self.payload)
+            self.signals.written.emit(self.path, self.path.stat().st_mtime_ns, None)
+        except Exception as e:
+            self.signals.written.emit(self.path, None, str(e))
+
+
+class _LoadCalibSignals(QObject):
+    """Delivers background config loads to the GUI thread"""
+    finished = pyqtSignal(object, object, object)  # token, _LoadCalibJob result or None, error message or None
+
+
+class _LoadCalibJob(QRunnable):
+    """Read and parse a gauge config off the GUI thread, building one needle's calibrations.
+
+    The result is (config_file, mtime_ns, digest of the bytes read, config,
+    {calibration key: NeedleCalibration}). The token tells the GUI thread
+    whether a newer load has been started since.
+    """
+
+    def __init__(self, token: int, config_file: Path, needle_id: str, signals: _LoadCalibSignals):
+        super().__init__()
+        self.token = token
+        self.config_file = config_file
+        self.needle_id = needle_id
+        self.signals = signals
+
+    def run(self):
+        result = error = None
+        try:
+            mtime = self.config_file.stat().st_mtime_ns
+            raw = self.config_file.read_bytes()
+            config = _normalize_config(_loads(raw))
+            calibrations = {
+                key: NeedleCalibration.from_dict(cal_data)
+                for key, cal_data in config["needle_calibrations"].items()
+                if cal_data.get("needle_id") == self.needle_id
+            }
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            result = (self.config_file, mtime, digest, config, calibrations)
+        except Exception as e:
+            error = str(e)
+        try:
+            self.signals.finished.emit(self.token, result, error)
+        except RuntimeError:
+            pass  # Calibrator window already deleted
+
+
 class ImageDisplayWidget(QFrame):
     """Widget to display image and handle click events"""
 
-    # Class-level image cache to avoid reloading the same images
-    _image_cache = {}  # {path: PIL.Image}
+    # Class-level LRU image cache to avoid reloading the same images.
+    # Cached pixmaps are shared, not copied: original_image is treated as immutable.
+    _image_cache = OrderedDict()  # {path: QPixmap} (rendered SVGs)
+    IMAGE_CACHE_SIZE = 16
+
+    # Pre-scaled pixmaps so switching images at the same widget size skips resampling
+    _scaled_cache = OrderedDict()  # {(path, width, height): QPixmap}
+    SCALED_CACHE_SIZE = 32
+
+    # Source file mtime and size (raster header) per path; a changed mtime drops cached pixmaps
+    _source_info = {}  # {path: (mtime_ns, (width, height) or None)}
+
+    # Background decodes started by prefetch_images, consumed by the next load of that path
+    _prefetched = {}  # {path: (mtime_ns, (src width, src height), QImage)}
+    _prefetch_pending = {}  # {path: _ImagePrefetchJob queued or running for it}
+    _prefetch_lock = threading.Lock()
+    _prefetch_pool = None  # QThreadPool capped at 2 threads, created with the first widget
+    _prefetch_signals = None  # Shared _ImagePrefetchSignals, lives on the GUI thread
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.original_image = None
+        self.original_image = None  # Source QPixmap at native resolution (SVG only)
+        self._current_path = None  # Path of loaded image, used as scaled cache key
+        self._src_size = None  # (width, height) of source image; None when nothing loaded
         self.scaled_pixmap = None
+        self.scale_factor = 1.0
         self.click_callback = None
         self.drag_callback = None  # For dragging existing points
+        self.drag_finished_callback = None  # Called once when a drag is released
+        self.show_callback = None  # Called each time the widget becomes visible
         self.display_points = []  # List of (x, y, color, label) for overlay
         self.dragging_index = None  # Index of point being dragged
+        self._pt_xy = np.empty((0, 2), dtype=np.int32)  # Screen coords of display_points for hit-testing
+        self._label_font = QFont("Arial", 9, QFont.Bold)
+        self._pen_cache: Dict[Tuple[int, int, int], QPen] = {}
 
         self.setMinimumSize(500, 500)
         self.setStyleSheet("border: 2px solid #333;")
         self.setFrameStyle(QFrame.Panel | QFrame.Sunken)
         self.setMouseTracking(True)  # Enable mouse tracking for cursor changes
+
+        # Hover hit-testing is throttled to ~60 Hz; cursor only changes on transitions
+        self._current_cursor_shape = Qt.ArrowCursor
+        self._hover_pos = (0, 0)
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(16)
+        self._hover_timer.timeout.connect(self._update_hover_cursor)
+
+        # Coalesce bursts of resize events into one rescale
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(30)
+        self._resize_timer.timeout.connect(self._rescale_source)
+
+        # Drag moves repaint the marker immediately but reach drag_callback at most ~30 Hz
+        self._pending_drag = None  # (point_index, original_x, original_y) not yet delivered
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.setInterval(33)
+        self._drag_timer.timeout.connect(self._deliver_drag)
+
+        # Background decodes; an async load waits for its path's finished signal
+        cls = type(self)
+        if cls._prefetch_pool is None:
+            cls._prefetch_pool = QThreadPool()
+            cls._prefetch_pool.setMaxThreadCount(2)
+            cls._prefetch_signals = _ImagePrefetchSignals()
+        cls._prefetch_signals.finished.connect(self._on_prefetch_finished)
+        self._async_load = None  # (image_path, on_loaded) waiting on a background decode
     
     def load_image(self, image_path: str) -> bool:
         """Load image from path (supports PNG and SVG) with caching"""
+        self._async_load = None  # A direct load supersedes any pending async one
         try:
-            if not Path(image_path).exists():
+            try:
+                mtime = os.stat(image_path).st_mtime_ns
+            except FileNotFoundError:
                 self.original_image = None
+                self._current_path = None
+                self._src_size = None
                 self.update()
                 return False
 
+            info = self._source_info.get(image_path)
+            if info is None or info[0] != mtime:
+                # First load, or the file changed on disk since it was cached
+                self._image_cache.pop(image_path, None)
+                self._evict_scaled(image_path)
+                info = (mtime, None)
+                self._source_info[image_path] = info
+
             # Check cache first
             if image_path in self._image_cache:
-                self.original_image = self._image_cache[image_path].copy()
-                self._scale_and_display()
+                self._image_cache.move_to_end(image_path)
+                self.original_image = self._image_cache[image_path]
+                self._current_path = image_path
+                self._src_size = (self.original_image.width(), self.original_image.height())
+                self._rescale_source()
                 return True
 
-            # Not in cache - load from disk
-            # Check if it's an SVG file
-            if image_path.lower().endswith('.svg'):
-                # Render SVG to PIL Image
-                svg_renderer = QSvgRenderer(image_path)
-                if not svg_renderer.isValid():
-                    logger.error(f"Invalid SVG file: {image_path}")
-                    return False
-
-                # Get SVG default size
-                svg_size = svg_renderer.defaultSize()
-                width = svg_size.width()
-                height = svg_size.height()
-
-                # Create QImage with correct format for RGBA
-                qimage = QImage(width, height, QImage.Format_RGBA8888)
-                qimage.fill(Qt.transparent)
-
-                painter = QPainter(qimage)
-                painter.setRenderHint(QPainter.Antialiasing, True)
-                painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
-                svg_renderer.render(painter, QRectF(0, 0, width, height))
-                painter.end()
-
-                # Convert QImage to PIL Image
-                ptr = qimage.constBits()
-                ptr.setsize(qimage.byteCount())
-                pil_image = Image.frombytes('RGBA', (width, height), ptr.asstring())
-                self.original_image = pil_image
-            else:
-                # Load PNG/JPG with PIL
-                self.original_image = Image.open(image_path).convert("RGBA")
+            # PNG/JPG: only read the header here; _rescale_source decodes
+            # straight to the display size instead of full resolution
+            if not image_path.lower().endswith('.svg'):
+                prefetched = self._peek_prefetched(image_path, mtime)
+                if info[1] is None and prefetched:
+                    info = (mtime, prefetched[1])
+                    self._source_info[image_path] = info
+                if info[1] is None:
+                    src_size = QImageReader(image_path).size()
+                    if not src_size.isValid():
+                        logger.error(f"Could not read image: {image_path}")
+                        return False
+                    info = (mtime, (src_size.width(), src_size.height()))
+                    self._source_info[image_path] = info
+                self.original_image = None
+                self._current_path = image_path
+                self._src_size = info[1]
+                self._rescale_source()
+                return True
+
+            # Not in cache - use a prefetched render or render SVG now (no PIL round-trip)
+            prefetched = self._claim_prefetched(image_path, mtime)
+            qimage = prefetched[2] if prefetched else _render_svg(image_path)
+            if qimage is None:
+                logger.error(f"Invalid SVG file: {image_path}")
+                return False
+
+            pixmap = QPixmap.fromImage(qimage)
+
+            self.original_image = pixmap
+            self._current_path = image_path
+            self._src_size = (pixmap.width(), pixmap.height())
 
             # Cache the loaded image
-            self._image_cache[image_path] = self.original_image.copy()
+            self._image_cache[image_path] = self.original_image
+            while len(self._image_cache) > self.IMAGE_CACHE_SIZE:
+                evicted_path, _ = self._image_cache.popitem(last=False)
+                self._evict_scaled(evicted_path)
 
-            self._scale_and_display()
+            self._rescale_source()
             return True
         except Exception as e:
             logger.error(f"Error loading image: {e}")
-            import traceback
             traceback.print_exc()
             return False
 
+    @classmethod
+    def _evict_scaled(cls, image_path: str):
+        """Drop all pre-scaled pixmaps derived from image_path"""
+        for key in [k for k in cls._scaled_cache if k[0] == image_path]:
+            del cls._scaled_cache[key]
+
     @classmethod
     def clear_image_cache(cls):
         """Clear the image cache (useful if images change on disk)"""
         cls._image_cache.clear()
+        cls._scaled_cache.clear()
+        cls._source_info.clear()
+        with cls._prefetch_lock:
+            cls._prefetched.clear()
         logger.info("🗑️ Image cache cleared")
 
+    def prefetch_images(self, image_paths: List[str]) -> List[str]:
+        """Decode images in the background so a later load_image of them is instant.
+
+        Paths already cached (or pre-scaled for this size), already being
+        decoded, or missing are skipped. Rasters are decoded for the
+        widget's current size. Returns the paths that were queued.
+        """
+        box_w = self.width() - 4
+        box_h = self.height() - 4
+        if box_w <= 0 or box_h <= 0:
+            return []
+
+        cls = type(self)
+        jobs = []
+        with cls._prefetch_lock:
+            for image_path in image_paths:
+                info = cls._source_info.get(image_path)
+                if info is not None and info[1] is not None and \
+                        (image_path, *_fit_size(*info[1], box_w, box_h)) in cls._scaled_cache:
+                    continue
+                if (image_path in cls._image_cache or image_path in cls._prefetched
+                        or image_path in cls._prefetch_pending or not os.path.exists(image_path)):
+                    continue
+                job = cls._prefetch_pending[image_path] = _ImagePrefetchJob(image_path, box_w, box_h)
+                jobs.append(job)
+
+        for job in jobs:
+            cls._prefetch_pool.start(job)
+        return [job.image_path for job in jobs]
+
+    def load_image_async(self, image_path: str, on_loaded):
+        """Load an image, decoding it on the prefetch pool if that is needed.
+
+        on_loaded(success) is called right away when the image can be shown
+        without a decode (or cannot be decoded in the background), otherwise
+        from the event loop once the worker is done. A later load_image or
+        load_image_async call supersedes a pending one.
+        """
+        queued = self.prefetch_images([image_path])
+        if not queued and image_path not in self._prefetch_pending:
+            on_loaded(self.load_image(image_path))
+            return
+        self._async_load = (image_path, on_loaded)
+
+    def _on_prefetch_finished(self, image_path: str):
+        """Finish a pending load_image_async once its decode is published"""
+        if self._async_load is None or self._async_load[0] != image_path:
+            return
+        on_loaded = self._async_load[1]
+        on_loaded(self.load_image(image_path))
+
+    @classmethod
+    def _finish_prefetch(cls, job: _ImagePrefetchJob, result):
+        """Publish a background decode (called from the worker thread)"""
+        image_path = job.image_path
+        with cls._prefetch_lock:
+            if result is not None:
+                cls._prefetched[image_path] = result
+            if cls._prefetch_pending.get(image_path) is job:
+                del cls._prefetch_pending[image_path]
+        job.done.set()
+        cls._notify_prefetch(image_path)
+
+    @classmethod
+    def _notify_prefetch(cls, image_path: str):
+        """Tell widgets (on the GUI thread) that a background decode of image_path is over"""
+        try:
+            cls._prefetch_signals.finished.emit(image_path)
+        except RuntimeError:
+            pass  # Signals object already torn down at interpreter exit; nobody to notify
+
+    PREFETCH_WAIT_S = 1.0  # Longest the GUI thread waits on a running decode before doing it itself
+
+    @classmethod
+    def _peek_prefetched(cls, image_path: str, mtime: int):
+        """Prefetched (mtime, size, QImage) for a path, or None to decode it synchronously
+
+        A job still queued behind others is taken back rather than waited on;
+        one already running gets PREFETCH_WAIT_S to finish.
+        """
+        with cls._prefetch_lock:
+            job = cls._prefetch_pending.get(image_path)
+            if job is not None and not job.started:
+                job.cancelled = True
+                del cls._prefetch_pending[image_path]
+                return None
+        if job is not None and not job.done.wait(cls.PREFETCH_WAIT_S):
+            logger.warning(f"⚠️ Background decode of {image_path} is slow, decoding it here instead")
+            return None
+        with cls._prefetch_lock:
+            result = cls._prefetched.get(image_path)
+            if result is not None and result[0] != mtime:
+                del cls._prefetched[image_path]  # File changed since it was decoded
+                result = None
+        return result
+
+    @classmethod
+    def _claim_prefetched(cls, image_path: str, mtime: int):
+        """Like _peek_prefetched, but removes the entry (its pixmap gets cached instead)"""
+        result = cls._peek_prefetched(image_path, mtime)
+        if result is not None:
+            with cls._prefetch_lock:
+                cls._prefetched.pop(image_path, None)
+        return result
+
     def set_click_callback(self, callback):
         """Set callback: callback(original_x, original_y)"""
         self.click_callback = callback
@@ -299,33 +836,101 @@ class ImageDisplayWidget(QFrame):
     def set_drag_callback(self, callback):
         """Set drag callback: callback(point_index, original_x, original_y)"""
         self.drag_callback = callback
+
+    def set_drag_finished_callback(self, callback):
+        """Set drag finished callback: callback() after the dragged point is released"""
+        self.drag_finished_callback = callback
+
+    def set_show_callback(self, callback):
+        """Set show callback: callback() when the widget is shown"""
+        self.show_callback = callback
     
-    def add_display_point(self, x: float, y: float, color: str = "red", label: str = "", point_type: str = None):
-        """Add point to display overlay"""
-        color_map = {
-            "red": (255, 0, 0),
-            "green": (0, 255, 0),
-            "blue": (0, 0, 255),
-            "yellow": (255, 255, 0),
-            "cyan": (0, 255, 255),
-            "orange": (255, 165, 0),
-        }
-        self.display_points.append({
+    @staticmethod
+    def make_display_point(x: float, y: float, color: str = "red", label: str = "", point_type: str = None,
+                           owner: str = None, calib_index: int = None) -> dict:
+        """Build an overlay point (screen position is filled in once it is displayed)"""
+        return {
             "x": x, "y": y,
-            "color": color_map.get(color, (255, 0, 0)),
+            "sx": 0, "sy": 0,  # Screen position, refreshed when scale_factor changes
+            "color": _COLOR_MAP.get(color, (255, 0, 0)),
             "label": label,
-            "point_type": point_type  # 'needle_pivot', 'needle_end', 'gauge_pivot', or 'calibration'
-        })
-        self._scale_and_display()
+            "point_type": point_type,  # 'needle_pivot', 'needle_end', 'gauge_pivot', or 'calibration'
+            "owner": owner,  # Calibration set / symbol the marker belongs to
+            "calib_index": calib_index  # Index into the owner's calibration_points (calibration markers)
+        }
+
+    def add_display_point(self, x: float, y: float, color: str = "red", label: str = "", point_type: str = None,
+                          owner: str = None, calib_index: int = None) -> dict:
+        """Add point to display overlay"""
+        point = self.make_display_point(x, y, color, label, point_type, owner, calib_index)
+        point["sx"], point["sy"] = self._to_screen(x, y)
+        self.display_points.append(point)
+        self._rebuild_hit_cache()
+        self.update()
+        return point
+
+    def set_display_points(self, points: List[dict]):
+        """Replace the whole overlay at once (one hit-cache rebuild, one repaint)"""
+        self.display_points = list(points)
+        self._refresh_screen_coords()
+        self.update()
     
+    def update_display_point(self, point: dict, **fields) -> bool:
+        """Change fields of a displayed point in place (color by name, like add_display_point).
+
+        Returns False if the point is no longer part of the overlay.
+        """
+        if not any(p is point for p in self.display_points):
+            return False
+        if "color" in fields:
+            fields["color"] = _COLOR_MAP.get(fields["color"], (255, 0, 0))
+        point.update(fields)
+        if "x" in fields or "y" in fields:
+            point["sx"], point["sy"] = self._to_screen(point["x"], point["y"])
+            self._rebuild_hit_cache()
+        self.update()
+        return True
+
+    def remove_display_points(self, points: List[dict]):
+        """Remove specific overlay points (matched by identity) in one pass"""
+        doomed = {id(point) for point in points}
+        self.display_points = [point for point in self.display_points if id(point) not in doomed]
+        self._rebuild_hit_cache()
+        self.update()
+
     def clear_display_points(self):
         """Clear all overlay points"""
         self.display_points = []
-        self._scale_and_display()
+        self._rebuild_hit_cache()
+        self.update()
+
+    def _to_screen(self, x: float, y: float) -> Tuple[int, int]:
+        """Convert original image coords to widget coords (image drawn at +2, +2)"""
+        return int(x * self.scale_factor) + 2, int(y * self.scale_factor) + 2
+
+    def _refresh_screen_coords(self):
+        """Recompute sx/sy for every display point after a scale change"""
+        for point in self.display_points:
+            point["sx"], point["sy"] = self._to_screen(point["x"], point["y"])
+        self._rebuild_hit_cache()
+
+    def _rebuild_hit_cache(self):
+        """Rebuild the screen-space coordinate array used by hit-testing"""
+        if not self.display_points:
+            self._pt_xy = np.empty((0, 2), dtype=np.int32)
+            return
+        self._pt_xy = np.array(
+            [(p["sx"], p["sy"]) for p in self.display_points],
+            dtype=np.int32
+        )
     
-    def _scale_and_display(self):
-        """Scale image to widget maintaining aspect ratio"""
-        if not self.original_image:
+    def _rescale_source(self):
+        """Scale source image to widget maintaining aspect ratio.
+
+        Only needed when the source image or widget size changes; overlay
+        point changes just repaint.
+        """
+        if self._src_size is None:
             self.scaled_pixmap = None
             self.update()
             return
@@ -337,49 +942,76 @@ class ImageDisplayWidget(QFrame):
             return
         
         # Calculate scale to fit widget while maintaining aspect ratio
-        img_w, img_h = self.original_image.size
-        scale_w = widget_width / img_w
-        scale_h = widget_height / img_h
-        scale = min(scale_w, scale_h)  # Use smaller scale to fit without distortion
-        
-        # Calculate new dimensions
-        new_w = int(img_w * scale)
-        new_h = int(img_h * scale)
-        
-        # Resize maintaining aspect ratio
-        pil_scaled = self.original_image.resize(
-            (new_w, new_h),
-            Image.Resampling.LANCZOS
-        )
-        
-        # Convert to QPixmap
-        qimg = QImage(pil_scaled.tobytes(), pil_scaled.width, pil_scaled.height,
-                      QImage.Format_RGBA8888)
-        self.scaled_pixmap = QPixmap.fromImage(qimg)
+        img_w, img_h = self._src_size
+        scale = min(widget_width / img_w, widget_height / img_h)  # Fit without distortion
+        new_w, new_h = int(img_w * scale), int(img_h * scale)
+        
+        # Resize maintaining aspect ratio (reuse a cached result at this size)
+        key = (self._current_path, new_w, new_h)
+        cached = self._scaled_cache.get(key)
+        if cached is not None:
+            self._scaled_cache.move_to_end(key)
+            self.scaled_pixmap = cached
+        else:
+            if self.original_image is not None:
+                self.scaled_pixmap = self.original_image.scaled(
+                    new_w, new_h, Qt.IgnoreAspectRatio, Qt.SmoothTransformation
+                )
+            else:
+                # Raster source: use a prefetched decode at this size, or let the
+                # decoder produce the target size directly
+                prefetched = self._claim_prefetched(self._current_path, self._source_info[self._current_path][0])
+                if prefetched and prefetched[2].size() == QSize(new_w, new_h):
+                    image = prefetched[2]
+                else:
+                    reader = QImageReader(self._current_path)
+                    reader.setScaledSize(QSize(new_w, new_h))
+                    image = reader.read()
+                    if image.isNull():
+                        logger.error(f"Could not decode image: {self._current_path}: {reader.errorString()}")
+                        return
+                self.scaled_pixmap = QPixmap.fromImage(image)
+            self._scaled_cache[key] = self.scaled_pixmap
+            while len(self._scaled_cache) > self.SCALED_CACHE_SIZE:
+                self._scaled_cache.popitem(last=False)
         
         # Store scale factor for coordinate conversion
-        self.scale_factor = scale
+        if scale != self.scale_factor:
+            self.scale_factor = scale
+            self._refresh_screen_coords()
         
         self.update()
     
+    def _get_pen(self, rgb: Tuple[int, int, int]) -> QPen:
+        """Return the cached 2px overlay pen for a color"""
+        pen = self._pen_cache.get(rgb)
+        if pen is None:
+            pen = self._pen_cache[rgb] = QPen(_QCOLOR_CACHE.get(rgb) or QColor(*rgb), 2)
+        return pen
+
     def resizeEvent(self, event):
         """Handle resize"""
         super().resizeEvent(event)
-        self._scale_and_display()
+        self._resize_timer.start()
+
+    def showEvent(self, event):
+        """Notify owner so deferred overlay work can be flushed"""
+        super().showEvent(event)
+        if self.show_callback:
+            self.show_callback()
     
     def _find_closest_point_index(self, x: float, y: float, threshold: int = 15) -> int:
         """Find closest display point within threshold distance. Returns -1 if none found."""
-        for i, point in enumerate(self.display_points):
-            px = int(point["x"] * self.scale_factor) + 2
-            py = int(point["y"] * self.scale_factor) + 2
-            dist = ((x - px) ** 2 + (y - py) ** 2) ** 0.5
-            if dist <= threshold:
-                return i
-        return -1
+        if len(self._pt_xy) == 0:
+            return -1
+        d = self._pt_xy - np.array([x, y], dtype=np.int32)
+        dist2 = np.einsum('ij,ij->i', d, d)
+        i = int(dist2.argmin())
+        return i if dist2[i] <= threshold * threshold else -1
     
     def mousePressEvent(self, event):
         """Handle mouse click - checks for existing points to drag first"""
-        if not self.original_image:
+        if self._src_size is None:
             return
         
         # Convert widget coordinates to original image coordinates
@@ -392,7 +1024,7 @@ class ImageDisplayWidget(QFrame):
         point_index = self._find_closest_point_index(click_x, click_y, threshold=15)
         if point_index >= 0 and self.drag_callback:
             self.dragging_index = point_index
-            self.setCursor(Qt.ClosedHandCursor)
+            self._set_cursor_shape(Qt.ClosedHandCursor)
             return
         
         # Otherwise, treat as new click
@@ -404,14 +1036,14 @@ class ImageDisplayWidget(QFrame):
         orig_y = int(click_y / self.scale_factor)
         
         # Clamp to image bounds
-        orig_x = max(0, min(orig_x, self.original_image.width - 1))
-        orig_y = max(0, min(orig_y, self.original_image.height - 1))
+        orig_x = max(0, min(orig_x, self._src_size[0] - 1))
+        orig_y = max(0, min(orig_y, self._src_size[1] - 1))
         
         self.click_callback(orig_x, orig_y)
     
     def mouseMoveEvent(self, event):
         """Handle mouse move - update cursor and drag if dragging"""
-        if not self.original_image:
+        if self._src_size is None:
             return
         
         border = 2
@@ -424,25 +1056,55 @@ class ImageDisplayWidget(QFrame):
             orig_y = int(click_y / self.scale_factor)
             
             # Clamp to image bounds
-            orig_x = max(0, min(orig_x, self.original_image.width - 1))
-            orig_y = max(0, min(orig_y, self.original_image.height - 1))
+            orig_x = max(0, min(orig_x, self._src_size[0] - 1))
+            orig_y = max(0, min(orig_y, self._src_size[1] - 1))
             
-            self.drag_callback(self.dragging_index, orig_x, orig_y)
+            if self.dragging_index < len(self.display_points):
+                point = self.display_points[self.dragging_index]
+                point["x"], point["y"] = orig_x, orig_y
+                point["sx"], point["sy"] = self._to_screen(orig_x, orig_y)
+            self._pending_drag = (self.dragging_index, orig_x, orig_y)
+            if not self._drag_timer.isActive():
+                self._drag_timer.start()
             self.update()
         else:
-            # Update cursor based on proximity to existing points
-            point_index = self._find_closest_point_index(click_x, click_y, threshold=15)
-            if point_index >= 0:
-                self.setCursor(Qt.OpenHandCursor)
-            else:
-                self.setCursor(Qt.CrossCursor)
+            # Update cursor based on proximity to existing points (throttled)
+            self._hover_pos = (click_x, click_y)
+            if not self._hover_timer.isActive():
+                self._hover_timer.start()
+    
+    def _update_hover_cursor(self):
+        """Hit-test the last hover position and update the cursor"""
+        if self.dragging_index is not None or self._src_size is None:
+            return
+        point_index = self._find_closest_point_index(*self._hover_pos, threshold=15)
+        self._set_cursor_shape(Qt.OpenHandCursor if point_index >= 0 else Qt.CrossCursor)
     
+    def _set_cursor_shape(self, shape):
+        """Set cursor only when the shape actually changes"""
+        if shape != self._current_cursor_shape:
+            self.setCursor(shape)
+            self._current_cursor_shape = shape
+    
+    def _deliver_drag(self):
+        """Pass the latest drag position to drag_callback (drag timer slot)"""
+        self._drag_timer.stop()
+        pending, self._pending_drag = self._pending_drag, None
+        if pending is None:
+            return
+        self._rebuild_hit_cache()
+        if self.drag_callback:
+            self.drag_callback(*pending)
+
     def mouseReleaseEvent(self, event):
         """Handle mouse release - end dragging"""
         if self.dragging_index is not None:
+            self._deliver_drag()
             self.dragging_index = None
-            self.setCursor(Qt.ArrowCursor)
+            self._set_cursor_shape(Qt.ArrowCursor)
             self.update()
+            if self.drag_finished_callback:
+                self.drag_finished_callback()
     
     def paintEvent(self, event):
         """Paint image and overlay"""
@@ -454,29 +1116,30 @@ class ImageDisplayWidget(QFrame):
         painter = QPainter(self)
         painter.drawPixmap(2, 2, self.scaled_pixmap)
         
-        # Draw display points
+        # Draw display points, batched per color so each group needs one setPen
         if self.display_points:
+            groups = {}  # {color: (crosshair lines, circles path, labels)}
+            size = 15
             for point in self.display_points:
-                x = int(point["x"] * self.scale_factor) + 2
-                y = int(point["y"] * self.scale_factor) + 2
-                color = point["color"]
-                label = point["label"]
-                
-                # Draw crosshair
-                painter.setPen(QPen(QColor(*color), 2))
-                size = 15
-                painter.drawLine(x - size, y, x + size, y)
-                painter.drawLine(x, y - size, x, y + size)
-                
-                # Draw circle
-                painter.setPen(QPen(QColor(*color), 2))
-                painter.drawEllipse(x - 8, y - 8, 16, 16)
-                
-                # Draw label
-                if label:
-                    painter.setFont(QFont("Arial", 9, QFont.Bold))
-                    painter.setPen(QColor(*color))
-                    painter.drawText(x + 20, y - 10, label)
+                x = point["sx"]
+                y = point["sy"]
+                group = groups.get(point["color"])
+                if group is None:
+                    group = groups[point["color"]] = ([], QPainterPath(), [])
+                lines, circles, labels = group
+                lines.append(QLineF(x - size, y, x + size, y))
+                lines.append(QLineF(x, y - size, x, y + size))
+                circles.addEllipse(x - 8, y - 8, 16, 16)
+                if point["label"]:
+                    labels.append((x + 20, y - 10, point["label"]))
+
+            painter.setFont(self._label_font)
+            for color, (lines, circles, labels) in groups.items():
+                painter.setPen(self._get_pen(color))
+                painter.drawLines(lines)
+                painter.drawPath(circles)
+                for lx, ly, label in labels:
+                    painter.drawText(lx, ly, label)
 
 
 class GaugeCalibratorV2(QMainWindow):
@@ -497,6 +1160,19 @@ class GaugeCalibratorV2(QMainWindow):
         "Speedometer": ["main"],
         "Fuel": ["fuel", "water"],
     }
+
+    # Visibility threshold operators: config name <-> combo text
+    OPERATOR_SYMBOLS = {"less_than": "<", "greater_than": ">", "equals": "="}
+    SYMBOL_OPERATORS = {symbol: name for name, symbol in OPERATOR_SYMBOLS.items()}
+
+    # Visibility modes in visibility_type_combo order, with the (key, bool, threshold)
+    # control groups each one shows
+    VISIBILITY_MODES = (
+        ("always", (False, False, False)),
+        ("bool", (True, True, False)),
+        ("threshold", (True, False, True)),
+    )
+    VISIBILITY_MODE_INDEX = {mode: i for i, (mode, _) in enumerate(VISIBILITY_MODES)}
     
     def __init__(self):
         super().__init__()
@@ -508,7 +1184,14 @@ class GaugeCalibratorV2(QMainWindow):
 
         # Track calibration sets for current needle
         self.calibration_sets = {}  # {set_name: NeedleCalibration}
+        self._sorted_set_names: List[str] = []  # Combo order, kept in step with calibration_sets
+        # {config_file: {calibration key: (source dict, pristine NeedleCalibration)}}
+        self._cal_intern: Dict[Path, Dict[str, Tuple[dict, NeedleCalibration]]] = {}
+        self._set_order = {}  # {set_name: ordinal}, rebuilt in _update_calibration_set_combo
+        self._marker_cache: Dict[str, Tuple[tuple, list]] = {}  # {marker owner: (change key, markers)}
+        self._redraw_dirty = False  # A redraw was skipped while the image widget was hidden
         self.current_set_name = "set1"
+        self._loaded_needle: Optional[Tuple[str, str]] = None  # (gauge, needle) last loaded by on_needle_changed
         self.next_color_index = 0
 
         # Track symbols (warning lights, indicators, etc.)
@@ -516,9 +1199,41 @@ class GaugeCalibratorV2(QMainWindow):
         self.current_symbol_id = None
         self.positioning_symbol = False  # Flag for symbol positioning mode
 
+        # Last gauge click waiting for "Add Point" (None until the user clicks)
+        self.last_click_x: Optional[float] = None
+        self.last_click_y: Optional[float] = None
+        self._pending_marker: Optional[dict] = None  # Yellow overlay point at the last click
+        self.calib_summary_label: Optional[QLabel] = None  # Created with the points section
+
         # Use absolute path based on project root (parent of src/)
-        self.config_dir = Path(__file__).parent.parent / "config"
+        self.config_dir = _MODULE_ROOT / "config"
         self.config_dir.mkdir(exist_ok=True)
+
+        # In-memory working copy of each config file: {path: (mtime_ns or None, config)}.
+        # Edits go into these dicts; dirty ones are written back by _flush_config.
+        self._config_cache: Dict[Path, Tuple[Optional[int], dict]] = {}
+        self._dirty_configs = set()  # Paths with in-memory edits not yet on disk
+        self._last_write_hash = {}  # {config_file: digest of the payload last read or written}
+
+        # Autosave writes run here; one thread keeps writes to a file in order
+        self._write_pool = QThreadPool(self)
+        self._write_pool.setMaxThreadCount(1)
+        self._write_signals = _ConfigWriteSignals(self)
+        self._write_signals.written.connect(self._on_config_written)
+        self._writes_in_flight: Dict[Path, int] = {}
+
+        # Configs that have to be read from disk are parsed on the global pool
+        self._load_signals = _LoadCalibSignals(self)
+        self._load_signals.finished.connect(self._on_calibration_loaded)
+        self._load_token = 0  # Bumped per load; completions carrying an older token are dropped
+        self._load_pending = False  # current_calibration is a placeholder until the load arrives
+
+        self._autosave_timer = QTimer(self)
+        self._autosave_timer.setInterval(750)  # Coalesces bursts of edits (drags, clicks) into one write
+        self._autosave_timer.setSingleShot(True)
+        self._autosave_timer.timeout.connect(self._do_autosave)
+        self._autosave_suspended = False
+        self._autosave_dirty = False  # Set by _schedule_autosave, cleared once flushed
         
         # Load existing needles from config files
         self._load_existing_needles_from_config()
@@ -527,35 +1242,172 @@ class GaugeCalibratorV2(QMainWindow):
 
         # Load symbols after UI is set up
         self._load_symbols()
-
-        self._autosave_timer = QTimer(self)
-        self._autosave_timer.setInterval(500)
-        self._autosave_timer.setSingleShot(True)
-        self._autosave_timer.timeout.connect(self._autosave_current_calibration)
-        self._autosave_suspended = False
     
     def _load_existing_needles_from_config(self):
         """Load needle names from existing config files"""
         for gauge_name in ["Tachometer", "Speedometer", "Fuel"]:
-            config_file = self.config_dir / f"{gauge_name.lower()}.json"
-            if config_file.exists():
-                try:
-                    with open(config_file, 'r') as f:
-                        config = json.load(f)
-
-                    # Get all needle IDs from needle_calibrations
-                    if 'needle_calibrations' in config:
-                        needle_ids = list(config['needle_calibrations'].keys())
-                        if needle_ids:
-                            # Update NEEDLE_TYPES with loaded needles
-                            self.NEEDLE_TYPES[gauge_name] = needle_ids
-                            logger.info(f"📋 Loaded needles for {gauge_name}: {needle_ids}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Could not load needles from {gauge_name}: {e}")
+            config_file = self._config_file(gauge_name)
+            try:
+                config = self._get_config(config_file)
+
+                # Get all needle IDs from needle_calibrations
+                needle_ids = list(config['needle_calibrations'].keys())
+                if needle_ids:
+                    # Update NEEDLE_TYPES with loaded needles
+                    self.NEEDLE_TYPES[gauge_name] = needle_ids
+                    logger.info(f"📋 Loaded needles for {gauge_name}: {needle_ids}")
+            except Exception as e:
+                logger.warning(f"⚠️ Could not load needles from {gauge_name}: {e}")
+
+    def _config_file(self, gauge_name: str) -> Path:
+        """Path of a gauge's config file"""
+        return _config_path(self.config_dir, gauge_name)
+
+    def _get_config(self, config_file: Path, gauge_name: str = None) -> dict:
+        """In-memory config for a gauge file, loaded on first use.
+
+        The returned dict is the working copy: mutate it, then call
+        _mark_config_dirty (autosave writes it) or _flush_config. It is
+        re-read only if the file changed on disk and has no unsaved edits.
+        A missing (or non-object) file starts as an empty config named
+        gauge_name; "needle_calibrations" is always a dict.
+        """
+        config = self._cached_config(config_file, gauge_name)
+        if config is not None:
+            return config
+
+        try:
+            mtime = config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime is None:
+            config = _normalize_config(None, gauge_name)
+        else:
+            raw = config_file.read_bytes()
+            config = _normalize_config(_loads(raw), gauge_name)
+            # Saving the config unchanged reproduces these bytes - no need to write them back
+            self._last_write_hash[config_file] = hashlib.blake2b(raw, digest_size=16).digest()
+        self._config_cache[config_file] = (mtime, config)
+        return config
+
+    def _cached_config(self, config_file: Path, gauge_name: str = None) -> Optional[dict]:
+        """The cached config if it has unsaved edits or still matches the file on disk, else None"""
+        cached = self._config_cache.get(config_file)
+        if not cached:
+            return None
+        if config_file in self._dirty_configs:
+            return cached[1]
+        try:
+            mtime = config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if cached[0] != mtime:
+            return None
+        config = cached[1]
+        if mtime is None and gauge_name:
+            # Started empty by a caller that didn't know the gauge name
+            config.setdefault("name", gauge_name)
+        return config
+
+    @contextmanager
+    def _editing_config(self, config_file: Path, gauge_name: str = None, flush: bool = True):
+        """Yield a gauge's in-memory config to edit, then write it now (flush) or leave it to autosave.
+
+        If the block raises, its partial edits are rolled back: a config
+        with no other unsaved edits is re-read from disk on next use, one
+        with pending edits is restored from a snapshot taken on entry.
+        """
+        config = self._get_config(config_file, gauge_name)
+        snapshot = copy.deepcopy(config) if config_file in self._dirty_configs else None
+        try:
+            yield config
+        except BaseException:
+            if snapshot is None:
+                if self._writes_in_flight:
+                    self._write_pool.waitForDone()  # So the re-read sees our last write
+                self._config_cache.pop(config_file, None)
+            else:
+                config.clear()
+                config.update(snapshot)
+            raise
+        if flush:
+            self._flush_config(config_file)
+        else:
+            self._mark_config_dirty(config_file)
+
+    def _mark_config_dirty(self, config_file: Path):
+        """Queue a config whose in-memory copy was edited for the next autosave"""
+        self._dirty_configs.add(config_file)
+
+    def _flush_config(self, config_file: Path, background: bool = False):
+        """Write the in-memory copy of a config file, skipping unchanged payloads.
+
+        With background=True the write is queued on the config write pool
+        and its result arrives in _on_config_written; otherwise it happens
+        now (after any queued writes) so callers can report errors.
+        """
+        config = self._config_cache[config_file][1]
+        payload = _dumps(config)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        self._dirty_configs.discard(config_file)
+        if self._last_write_hash.get(config_file) == digest and self._writes_in_flight.get(config_file):
+            return  # Already on its way to disk
+        try:
+            mtime = config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        unchanged_on_disk = mtime is not None and mtime == self._config_cache[config_file][0]
+        if unchanged_on_disk and self._last_write_hash.get(config_file) == digest:
+            return
+        self._last_write_hash[config_file] = digest
+        if background:
+            self._writes_in_flight[config_file] = self._writes_in_flight.get(config_file, 0) + 1
+            self._write_pool.start(_ConfigWriteJob(config_file, payload, self._write_signals))
+            return
+        if self._writes_in_flight:
+            self._write_pool.waitForDone()
+        try:
+            _write_config_atomic(config_file, payload)
+        except Exception:
+            self._last_write_hash.pop(config_file, None)
+            self._dirty_configs.add(config_file)
+            raise
+        self._config_cache[config_file] = (config_file.stat().st_mtime_ns, config)
+
+    def _on_config_written(self, config_file: Path, mtime: Optional[int], error: Optional[str]):
+        """Record the outcome of a background config write (GUI thread)"""
+        in_flight = self._writes_in_flight.get(config_file, 1) - 1
+        if in_flight:
+            self._writes_in_flight[config_file] = in_flight
+        else:
+            self._writes_in_flight.pop(config_file, None)
+        if error is not None:
+            logger.warning(f"⚠️ Could not write {config_file.name}: {error}")
+            # Retried with the next flush
+            self._last_write_hash.pop(config_file, None)
+            self._dirty_configs.add(config_file)
+            return
+        cached = self._config_cache.get(config_file)
+        if cached and not in_flight and config_file not in self._dirty_configs:
+            try:
+                current = config_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                return
+            if current == mtime:
+                # Still our own write, so the cached copy matches the file
+                self._config_cache[config_file] = (mtime, cached[1])
+
+    def _flush_dirty_configs(self):
+        """Queue a background write for every config with pending in-memory edits"""
+        for config_file in list(self._dirty_configs):
+            try:
+                self._flush_config(config_file, background=True)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not write {config_file.name}: {e}")
 
     def _scan_needle_types(self):
         """Scan gauges/ folder for available needle SVG files"""
-        gauges_dir = Path(__file__).parent.parent / "gauges"
+        gauges_dir = _GAUGES_DIR
         needle_types = []
 
         if not gauges_dir.exists():
@@ -589,8 +1441,18 @@ class GaugeCalibratorV2(QMainWindow):
         left_layout.addWidget(QLabel("Image Display"))
         self.image_widget = ImageDisplayWidget()
         self.image_widget.set_drag_callback(self.on_point_dragged)
+        self.image_widget.set_drag_finished_callback(self._schedule_autosave)
+        self.image_widget.set_show_callback(self._flush_deferred_redraw)
         left_layout.addWidget(self.image_widget)
 
+        # Non-blocking step/confirmation messages (errors still use dialogs)
+        self._toast_label = QLabel()
+        self._toast_label.setStyleSheet("color: #2e7d32; font-weight: bold;")
+        self._toast_timer = QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.timeout.connect(self._toast_label.clear)
+        left_layout.addWidget(self._toast_label)
+
         # Right: Controls (using QToolBox for collapsible sections)
         right_layout = QVBoxLayout()
 
@@ -603,7 +1465,14 @@ class GaugeCalibratorV2(QMainWindow):
         self.tool_box.addItem(self._create_needle_geometry_section(), "3. Needle Geometry (2 clicks)")
         self.tool_box.addItem(self._create_gauge_pivot_section(), "4. Gauge Pivot Location")
         self.tool_box.addItem(self._create_calibration_points_section(), "5. Calibration Marks")
-        self.tool_box.addItem(self._create_symbols_section(), "6. Symbols (Warning Lights & Indicators)")
+        # Symbols page is built on first open (see _ensure_symbols_section)
+        self._symbols_page = QWidget()
+        symbols_page_layout = QVBoxLayout()
+        symbols_page_layout.setContentsMargins(0, 0, 0, 0)
+        self._symbols_page.setLayout(symbols_page_layout)
+        self._symbols_section_built = False
+        self.tool_box.addItem(self._symbols_page, "6. Symbols (Warning Lights & Indicators)")
+        self.tool_box.currentChanged.connect(self._on_tool_box_page_changed)
 
         right_layout.addWidget(self.tool_box)
 
@@ -665,8 +1534,8 @@ class GaugeCalibratorV2(QMainWindow):
         layout.addWidget(self.gauge_combo)
 
         layout.addWidget(QLabel("Needle:"))
-        self.needle_combo = QComboBox()
-        self.needle_combo.currentTextChanged.connect(self.on_needle_changed)
+        self.needle_combo = _list_combo()
+        self.needle_combo.currentTextChanged.connect(self._on_needle_combo_changed)
         layout.addWidget(self.needle_combo)
 
         # Current needle indicator
@@ -697,7 +1566,7 @@ class GaugeCalibratorV2(QMainWindow):
 
         # Current set selector
         layout.addWidget(QLabel("Select Calibration Set:"))
-        self.calibration_set_combo = QComboBox()
+        self.calibration_set_combo = _list_combo()
         self.calibration_set_combo.currentTextChanged.connect(self.on_calibration_set_changed)
         layout.addWidget(self.calibration_set_combo)
 
@@ -750,18 +1619,22 @@ class GaugeCalibratorV2(QMainWindow):
         # Keep spinbox attributes for internal state tracking but don't display them
         self.needle_pivot_x_spin = QSpinBox()
         self.needle_pivot_x_spin.setRange(0, 2000)
+        self.needle_pivot_x_spin.setKeyboardTracking(False)
         self.needle_pivot_x_spin.setVisible(False)  # Hidden
 
         self.needle_pivot_y_spin = QSpinBox()
         self.needle_pivot_y_spin.setRange(0, 2000)
+        self.needle_pivot_y_spin.setKeyboardTracking(False)
         self.needle_pivot_y_spin.setVisible(False)  # Hidden
 
         self.needle_end_x_spin = QSpinBox()
         self.needle_end_x_spin.setRange(0, 2000)
+        self.needle_end_x_spin.setKeyboardTracking(False)
         self.needle_end_x_spin.setVisible(False)  # Hidden
 
         self.needle_end_y_spin = QSpinBox()
         self.needle_end_y_spin.setRange(0, 2000)
+        self.needle_end_y_spin.setKeyboardTracking(False)
         self.needle_end_y_spin.setVisible(False)  # Hidden
 
         layout.addStretch()
@@ -791,10 +1664,12 @@ class GaugeCalibratorV2(QMainWindow):
         # Keep spinbox attributes for internal state tracking but don't display them
         self.gauge_pivot_x_spin = QSpinBox()
         self.gauge_pivot_x_spin.setRange(0, 2000)
+        self.gauge_pivot_x_spin.setKeyboardTracking(False)
         self.gauge_pivot_x_spin.setVisible(False)  # Hidden
 
         self.gauge_pivot_y_spin = QSpinBox()
         self.gauge_pivot_y_spin.setRange(0, 2000)
+        self.gauge_pivot_y_spin.setKeyboardTracking(False)
         self.gauge_pivot_y_spin.setVisible(False)  # Hidden
 
         layout.addStretch()
@@ -812,6 +1687,7 @@ class GaugeCalibratorV2(QMainWindow):
         point_input_layout.addWidget(QLabel("Value:"))
         self.point_value_spin = QDoubleSpinBox()
         self.point_value_spin.setRange(-500, 20000)
+        self.point_value_spin.setKeyboardTracking(False)
         self.point_value_spin.setValue(0)
         point_input_layout.addWidget(self.point_value_spin)
 
@@ -840,6 +1716,24 @@ class GaugeCalibratorV2(QMainWindow):
         widget.setLayout(layout)
         return widget
 
+    def _toast(self, message: str, ms: int = 3000):
+        """Show a transient message under the image instead of a modal dialog"""
+        self._toast_label.setText(message)
+        self._toast_timer.start(ms)
+
+    def _on_tool_box_page_changed(self, index: int):
+        """Build lazily constructed sections the first time their page opens"""
+        if self.tool_box.widget(index) is self._symbols_page:
+            self._ensure_symbols_section()
+
+    def _ensure_symbols_section(self):
+        """Create the symbols section widgets once and sync them with loaded symbols"""
+        if self._symbols_section_built:
+            return
+        self._symbols_section_built = True
+        self._symbols_page.layout().addWidget(self._create_symbols_section())
+        self._update_symbol_combo()
+
     def _create_symbols_section(self):
         """Create symbols (warning lights & indicators) section"""
         widget = QWidget()
@@ -852,7 +1746,7 @@ class GaugeCalibratorV2(QMainWindow):
 
         # Symbol selection
         layout.addWidget(QLabel("Choose Symbol to Position:"))
-        self.symbol_combo = QComboBox()
+        self.symbol_combo = _list_combo()
         self.symbol_combo.currentTextChanged.connect(self.on_symbol_changed)
         layout.addWidget(self.symbol_combo)
 
@@ -861,6 +1755,7 @@ class GaugeCalibratorV2(QMainWindow):
         self.symbol_display_name_edit = QLineEdit()
         self.symbol_display_name_edit.setPlaceholderText("e.g., Check Engine, Oil Pressure, etc.")
         self.symbol_display_name_edit.textChanged.connect(self.on_symbol_display_name_changed)
+        self.symbol_display_name_edit.editingFinished.connect(self._log_symbol_display_name)
         layout.addWidget(self.symbol_display_name_edit)
 
         # Add/Delete symbol buttons
@@ -894,6 +1789,7 @@ class GaugeCalibratorV2(QMainWindow):
         layout.addWidget(QLabel("Scale:"))
         self.symbol_scale_spin = QDoubleSpinBox()
         self.symbol_scale_spin.setRange(0.1, 5.0)
+        self.symbol_scale_spin.setKeyboardTracking(False)
         self.symbol_scale_spin.setSingleStep(0.1)
         self.symbol_scale_spin.setValue(1.0)
         self.symbol_scale_spin.valueChanged.connect(self.on_symbol_scale_changed)
@@ -906,35 +1802,49 @@ class GaugeCalibratorV2(QMainWindow):
         self.visibility_type_combo.currentIndexChanged.connect(self.on_visibility_type_changed)
         layout.addWidget(self.visibility_type_combo)
 
-        # Data key input
-        layout.addWidget(QLabel("Data Key (e.g., high_beam):"))
+        # Per-mode control groups, shown/hidden as a whole by _show_visibility_controls
+        # Data key input (bool and threshold modes)
+        self._key_group = QWidget()
+        key_layout = QVBoxLayout()
+        key_layout.setContentsMargins(0, 0, 0, 0)
+        key_layout.addWidget(QLabel("Data Key (e.g., high_beam):"))
         self.visibility_key_input = QLineEdit()
         self.visibility_key_input.setPlaceholderText("telemetry_data_key")
         self.visibility_key_input.textChanged.connect(self.on_visibility_key_changed)
-        self.visibility_key_input.setEnabled(False)
-        layout.addWidget(self.visibility_key_input)
+        key_layout.addWidget(self.visibility_key_input)
+        self._key_group.setLayout(key_layout)
+        self._key_group.setVisible(False)
+        layout.addWidget(self._key_group)
 
         # Bool condition
+        self._bool_group = QWidget()
+        bool_layout = QVBoxLayout()
+        bool_layout.setContentsMargins(0, 0, 0, 0)
         self.visibility_bool_combo = QComboBox()
         self.visibility_bool_combo.addItems(["Show when True", "Show when False"])
         self.visibility_bool_combo.currentIndexChanged.connect(self.on_visibility_bool_changed)
-        self.visibility_bool_combo.setEnabled(False)
-        layout.addWidget(self.visibility_bool_combo)
+        bool_layout.addWidget(self.visibility_bool_combo)
+        self._bool_group.setLayout(bool_layout)
+        self._bool_group.setVisible(False)
+        layout.addWidget(self._bool_group)
 
         # Threshold condition
+        self._threshold_group = QWidget()
         threshold_layout = QHBoxLayout()
+        threshold_layout.setContentsMargins(0, 0, 0, 0)
         self.visibility_operator_combo = QComboBox()
         self.visibility_operator_combo.addItems(["<", ">", "="])
         self.visibility_operator_combo.currentTextChanged.connect(self.on_visibility_operator_changed)
-        self.visibility_operator_combo.setEnabled(False)
         threshold_layout.addWidget(self.visibility_operator_combo)
 
         self.visibility_value_spin = QDoubleSpinBox()
         self.visibility_value_spin.setRange(-10000, 10000)
+        self.visibility_value_spin.setKeyboardTracking(False)
         self.visibility_value_spin.valueChanged.connect(self.on_visibility_value_changed)
-        self.visibility_value_spin.setEnabled(False)
         threshold_layout.addWidget(self.visibility_value_spin)
-        layout.addLayout(threshold_layout)
+        self._threshold_group.setLayout(threshold_layout)
+        self._threshold_group.setVisible(False)
+        layout.addWidget(self._threshold_group)
 
         # Save symbols button
         save_symbols_btn = QPushButton("💾 Save Symbols")
@@ -947,6 +1857,7 @@ class GaugeCalibratorV2(QMainWindow):
 
     def on_gauge_changed(self, gauge_name: str):
         """Handle gauge selection - auto-load everything"""
+        self._flush_pending_autosave()
 
         # Check for unsaved changes first
         if self.current_calibration and self.has_unsaved_changes:
@@ -960,12 +1871,11 @@ class GaugeCalibratorV2(QMainWindow):
                 self.save_gauge_configuration()
             elif reply == QMessageBox.Cancel:
                 # Revert gauge selection
-                self.gauge_combo.blockSignals(True)
-                prev_gauge_names = list(self.GAUGE_PRESETS.keys())
-                if self.current_calibration.gauge_name in prev_gauge_names:
-                    prev_index = prev_gauge_names.index(self.current_calibration.gauge_name)
-                    self.gauge_combo.setCurrentIndex(prev_index)
-                self.gauge_combo.blockSignals(False)
+                with _signals_off(self.gauge_combo):
+                    prev_gauge_names = list(self.GAUGE_PRESETS.keys())
+                    if self.current_calibration.gauge_name in prev_gauge_names:
+                        prev_index = prev_gauge_names.index(self.current_calibration.gauge_name)
+                        self.gauge_combo.setCurrentIndex(prev_index)
                 return
 
             self.has_unsaved_changes = False
@@ -973,10 +1883,8 @@ class GaugeCalibratorV2(QMainWindow):
         # Update needle dropdown
         needles = self.NEEDLE_TYPES.get(gauge_name, ["main"])
 
-        self.needle_combo.blockSignals(True)
-        self.needle_combo.clear()
-        self.needle_combo.addItems(needles)
-        self.needle_combo.blockSignals(False)
+        with _signals_off(self.needle_combo):
+            _set_combo_items(self.needle_combo, needles)
 
         # Create new calibration for this gauge
         preset = self.GAUGE_PRESETS.get(gauge_name, {"min": 0, "max": 100})
@@ -994,9 +1902,24 @@ class GaugeCalibratorV2(QMainWindow):
         # Auto-load first needle
         self.on_needle_changed(needles[0])
 
+        # Warm up images the user is likely to switch to next
+        self._prefetch_neighbor_images(gauge_name, needles)
+
         # Reload symbols for this gauge
         self._load_symbols()
 
+    def _prefetch_neighbor_images(self, gauge_name: str, needles: List[str]):
+        """Background-decode this gauge's needle images and the other gauges' backgrounds"""
+        paths = []
+        for needle_id in needles:
+            needle_path = _find_needle_image(_GAUGES_DIR, needle_id, gauge_name.lower())
+            if needle_path is not None:
+                paths.append(str(needle_path))
+        for other_name, preset in self.GAUGE_PRESETS.items():
+            if other_name != gauge_name and preset.get("bg_image"):
+                paths.append(str(_project_path(preset["bg_image"])))
+        self.image_widget.prefetch_images(list(dict.fromkeys(paths)))
+
     def auto_load_default_gauge(self):
         """Auto-load tachometer gauge + needle + calibration on first load"""
         try:
@@ -1018,21 +1941,28 @@ class GaugeCalibratorV2(QMainWindow):
         if not bg_image:
             return
 
-        gauge_path = Path(__file__).parent.parent / bg_image
-        if gauge_path.exists():
-            success = self.image_widget.load_image(str(gauge_path))
-            if success:
-                # Set callback for gauge clicks (pivot, calibration points)
-                self.image_widget.set_click_callback(self.on_gauge_click)
-                logger.info(f"✅ Auto-loaded gauge: {gauge_path.name}")
-                # Redraw existing calibration points if any
-                if self.calibration_sets:
-                    self._redraw_all_points()
-            else:
-                logger.warning(f"⚠️ Failed to load gauge: {gauge_path}")
+        gauge_path = _project_path(bg_image)
+        if _gauges_file_exists(gauge_path):
+            # Decoded off the GUI thread when not cached; the rest of the gauge
+            # switch carries on meanwhile
+            self.image_widget.load_image_async(
+                str(gauge_path), lambda success: self._on_gauge_image_loaded(gauge_path, success)
+            )
         else:
             logger.warning(f"⚠️ Gauge image not found: {gauge_path}")
 
+    def _on_gauge_image_loaded(self, gauge_path: Path, success: bool):
+        """Finish an auto-loaded gauge background once it is displayed"""
+        if success:
+            # Set callback for gauge clicks (pivot, calibration points)
+            self.image_widget.set_click_callback(self.on_gauge_click)
+            logger.info("✅ Auto-loaded gauge: %s", gauge_path.name)
+            # Redraw existing calibration points if any
+            if self.calibration_sets:
+                self._redraw_all_points()
+        else:
+            logger.warning(f"⚠️ Failed to load gauge: {gauge_path}")
+
     def _auto_load_needle_image(self, needle_id: str):
         """Auto-load needle image for selected needle"""
         if not self.current_calibration:
@@ -1041,32 +1971,18 @@ class GaugeCalibratorV2(QMainWindow):
         gauge_name = self.current_calibration.gauge_name.lower()
 
         # Try standard paths (prefer SVG over PNG)
-        gauges_dir = Path(__file__).parent.parent / "gauges"
-
-        # Check for needle.svg (shared needle)
-        needle_path = gauges_dir / "needle.svg"
-        if not needle_path.exists():
-            # Try needle ID with SVG
-            needle_path = gauges_dir / f"{needle_id}_needle.svg"
-        if not needle_path.exists():
-            # Try gauge name with SVG
-            needle_path = gauges_dir / f"{gauge_name}_needle.svg"
-        if not needle_path.exists():
-            # Fall back to PNG
-            needle_path = gauges_dir / f"{needle_id}_needle.png"
-        if not needle_path.exists():
-            needle_path = gauges_dir / f"{gauge_name}_needle.png"
-
-        if needle_path.exists():
+        needle_path = _find_needle_image(_GAUGES_DIR, needle_id, gauge_name)
+
+        if needle_path is not None:
             success = self.image_widget.load_image(str(needle_path))
             if success:
                 self.current_calibration.needle_image_path = str(needle_path)
                 self.image_widget.set_click_callback(self.on_needle_pivot_click)
-                logger.info(f"✅ Auto-loaded needle: {needle_path.name}")
+                logger.info("✅ Auto-loaded needle: %s", needle_path.name)
             else:
                 logger.warning(f"⚠️ Failed to load needle: {needle_path}")
         else:
-            logger.info(f"ℹ️ No needle image found for {needle_id}, will need to load manually")
+            logger.info("ℹ️ No needle image found for %s, will need to load manually", needle_id)
 
     def _auto_load_configuration(self):
         """Auto-load saved calibration from config file"""
@@ -1076,60 +1992,71 @@ class GaugeCalibratorV2(QMainWindow):
         gauge_name = self.current_calibration.gauge_name.lower()
         needle_id = self.current_calibration.needle_id
 
-        # Load all calibration sets for this needle
-        self.load_calibration_sets_for_needle(gauge_name, needle_id)
+        # Load all calibration sets for this needle; a load from disk finishes in _on_calibration_loaded
+        if self.load_calibration_sets_for_needle(gauge_name, needle_id):
+            self._show_loaded_calibration()
 
+    def _show_loaded_calibration(self):
+        """Show the calibration sets just loaded for the current needle, or a blank slate"""
         # Update UI with first set's values
         if self.calibration_sets:
             self._update_ui_from_calibration()
-            logger.info(f"✅ Auto-loaded {len(self.calibration_sets)} calibration set(s): {gauge_name}/{needle_id}")
-
-    def _update_ui_from_calibration(self):
-        """Update all UI elements from current_calibration"""
-        if not self.current_calibration:
-            return
+            cal = self.current_calibration
+            logger.info("✅ Auto-loaded %d calibration set(s): %s/%s", len(self.calibration_sets), cal.gauge_name.lower(), cal.needle_id)
 
-        # Update step 1 (needle geometry)
-        self.needle_pivot_x_spin.blockSignals(True)
-        self.needle_pivot_y_spin.blockSignals(True)
-        self.needle_end_x_spin.blockSignals(True)
-        self.needle_end_y_spin.blockSignals(True)
+        # If auto-load didn't find anything, reset UI
+        if (self.current_calibration.needle_pivot_x == 0 and
+            self.current_calibration.gauge_pivot_x == 0 and
+            not self.current_calibration.calibration_points):
 
-        self.needle_pivot_x_spin.setValue(int(self.current_calibration.needle_pivot_x))
-        self.needle_pivot_y_spin.setValue(int(self.current_calibration.needle_pivot_y))
-        self.needle_end_x_spin.setValue(int(self.current_calibration.needle_end_x))
-        self.needle_end_y_spin.setValue(int(self.current_calibration.needle_end_y))
-
-        self.needle_pivot_x_spin.blockSignals(False)
-        self.needle_pivot_y_spin.blockSignals(False)
-        self.needle_end_x_spin.blockSignals(False)
-        self.needle_end_y_spin.blockSignals(False)
+            self.needle_pivot_label.setText("Pivot: Not set")
+            self.needle_end_label.setText("End: Not set")
+            self.gauge_pivot_label.setText("Not set")
+            # Update summary label
+            if self.calib_summary_label is not None:
+                self.calib_summary_label.setText("0 calibration points")
 
-        # Update step 2 (gauge pivot)
-        self.gauge_pivot_x_spin.blockSignals(True)
-        self.gauge_pivot_y_spin.blockSignals(True)
+            # Reset spinboxes to zero
+            self._apply_values([
+                (self.needle_pivot_x_spin, 0), (self.needle_pivot_y_spin, 0),
+                (self.needle_end_x_spin, 0), (self.needle_end_y_spin, 0),
+                (self.gauge_pivot_x_spin, 0), (self.gauge_pivot_y_spin, 0),
+            ])
 
-        self.gauge_pivot_x_spin.setValue(int(self.current_calibration.gauge_pivot_x))
-        self.gauge_pivot_y_spin.setValue(int(self.current_calibration.gauge_pivot_y))
+    def _update_ui_from_calibration(self, redraw: bool = True):
+        """Update all UI elements from current_calibration (redraw=False leaves the overlay to the caller)"""
+        if not self.current_calibration:
+            return
 
-        self.gauge_pivot_x_spin.blockSignals(False)
-        self.gauge_pivot_y_spin.blockSignals(False)
+        # Update step 1 (needle geometry) and step 2 (gauge pivot) in one pass
+        cal = self.current_calibration
+        self._apply_values([
+            (self.needle_pivot_x_spin, int(cal.needle_pivot_x)),
+            (self.needle_pivot_y_spin, int(cal.needle_pivot_y)),
+            (self.needle_end_x_spin, int(cal.needle_end_x)),
+            (self.needle_end_y_spin, int(cal.needle_end_y)),
+            (self.gauge_pivot_x_spin, int(cal.gauge_pivot_x)),
+            (self.gauge_pivot_y_spin, int(cal.gauge_pivot_y)),
+        ])
 
         # Update labels
         if self.current_calibration.needle_pivot_x > 0:
-            self.needle_pivot_label.setText(
+            _set_text(
+                self.needle_pivot_label,
                 f"✓ Pivot: ({int(self.current_calibration.needle_pivot_x)}, "
                 f"{int(self.current_calibration.needle_pivot_y)})"
             )
 
         if self.current_calibration.needle_end_x > 0:
-            self.needle_end_label.setText(
+            _set_text(
+                self.needle_end_label,
                 f"✓ End: ({int(self.current_calibration.needle_end_x)}, "
                 f"{int(self.current_calibration.needle_end_y)})"
             )
 
         if self.current_calibration.gauge_pivot_x > 0:
-            self.gauge_pivot_label.setText(
+            _set_text(
+                self.gauge_pivot_label,
                 f"✓ ({int(self.current_calibration.gauge_pivot_x)}, "
                 f"{int(self.current_calibration.gauge_pivot_y)})"
             )
@@ -1138,132 +2065,260 @@ class GaugeCalibratorV2(QMainWindow):
         self._refresh_calibration_table()
 
         # Redraw points on image
-        self._redraw_all_points()
+        if redraw:
+            self._redraw_all_points()
 
-    def _redraw_all_points(self):
-        """Redraw all calibration points for all sets with color coding"""
+    def _apply_values(self, pairs):
+        """Set (spinbox, value) pairs with signals blocked, skipping spinboxes already at their value"""
+        with _signals_off(*(spin for spin, _ in pairs)):
+            for spin, value in pairs:
+                if spin.value() != value:
+                    spin.setValue(value)
+
+    def _redraw_all_points(self, only: Optional[set] = None):
+        """Redraw calibration points for all sets with color coding.
+
+        Markers are cached per set/symbol under a change key; only owners
+        whose key changed get their markers rebuilt, and the full overlay
+        is handed to the image widget in one call. With only, sets outside
+        it (and symbols) reuse their cached markers without a key check.
+        Skipped while the image widget is hidden and flushed once it shows.
+        """
         if not self.calibration_sets:
             return
+        if not self.image_widget.isVisible():
+            self._redraw_dirty = True
+            return
+        self._redraw_dirty = False
 
-        self.image_widget.clear_display_points()
+        make_point = self.image_widget.make_display_point
+        cache = self._marker_cache
+        live = {}
+        markers = []
 
         # Draw points from all calibration sets (with different colors)
         for set_name, calibration in self.calibration_sets.items():
+            if only is not None and set_name not in only and set_name in cache:
+                live[set_name] = cache[set_name]
+                markers.extend(cache[set_name][1])
+                continue
+
             # Get color for this set
-            color_index = list(self.calibration_sets.keys()).index(set_name)
-            color = self.CALIBRATION_SET_COLORS[color_index % len(self.CALIBRATION_SET_COLORS)]
+            color = self._set_color(set_name)
 
             # Determine if this is the active set
             is_active = (set_name == self.current_set_name)
 
-            # Draw needle geometry (only for active set)
-            if is_active:
-                if calibration.needle_pivot_x > 0:
-                    self.image_widget.add_display_point(
-                        calibration.needle_pivot_x, calibration.needle_pivot_y,
-                        color=color, label="Pivot", point_type="needle_pivot"
-                    )
-
-                if calibration.needle_end_x > 0:
-                    self.image_widget.add_display_point(
-                        calibration.needle_end_x, calibration.needle_end_y,
-                        color=color, label="End", point_type="needle_end"
-                    )
-
-            # Draw gauge pivot (for all sets)
-            if calibration.gauge_pivot_x > 0:
-                display_color = color if is_active else "gray"
-                label = f"Pivot" if is_active else f"Pivot ({set_name})"
-                self.image_widget.add_display_point(
-                    calibration.gauge_pivot_x, calibration.gauge_pivot_y,
-                    color=display_color, label=label, point_type="gauge_pivot"
-                )
-
-            # Draw calibration points (all sets, color-coded)
-            for i, point in enumerate(calibration.calibration_points):
+            key = (
+                calibration.gauge_pivot_x, calibration.gauge_pivot_y,
+                calibration.needle_pivot_x, calibration.needle_pivot_y,
+                calibration.needle_end_x, calibration.needle_end_y,
+                tuple((p.x, p.y, p.value) for p in calibration.calibration_points),
+                is_active, color
+            )
+            cached = cache.get(set_name)
+            if cached is None or cached[0] != key:
+                set_markers = []
+
+                # Draw needle geometry (only for active set)
+                if is_active:
+                    if calibration.needle_pivot_x > 0:
+                        set_markers.append(make_point(
+                            calibration.needle_pivot_x, calibration.needle_pivot_y,
+                            color=color, label="Pivot", point_type="needle_pivot", owner=set_name
+                        ))
+
+                    if calibration.needle_end_x > 0:
+                        set_markers.append(make_point(
+                            calibration.needle_end_x, calibration.needle_end_y,
+                            color=color, label="End", point_type="needle_end", owner=set_name
+                        ))
+
+                # Set-level display attributes, shared by every marker below
                 display_color = color if is_active else "gray"
-                label = f"{point.value}"
-                if not is_active:
-                    label = f"{set_name}: {point.value}"
-
-                self.image_widget.add_display_point(
-                    point.x, point.y,
-                    color=display_color, label=label, point_type="calibration"
-                )
+                prefix = "" if is_active else f"{set_name}: "
+
+                # Draw gauge pivot (for all sets)
+                if calibration.gauge_pivot_x > 0:
+                    label = "Pivot" if is_active else f"Pivot ({set_name})"
+                    set_markers.append(make_point(
+                        calibration.gauge_pivot_x, calibration.gauge_pivot_y,
+                        color=display_color, label=label, point_type="gauge_pivot", owner=set_name
+                    ))
+
+                # Draw calibration points (all sets, color-coded)
+                for calib_index, point in enumerate(calibration.calibration_points):
+                    set_markers.append(make_point(
+                        point.x, point.y,
+                        color=display_color, label=prefix + str(point.value),
+                        point_type="calibration", owner=set_name, calib_index=calib_index
+                    ))
+
+                cached = (key, set_markers)
+            live[set_name] = cached
+            markers.extend(cached[1])
 
         # Draw symbols for current gauge
-        self._redraw_symbol_markers()
+        self._redraw_symbol_markers(live, markers, reuse_cached=only is not None)
+
+        self._marker_cache = live
+        self.image_widget.set_display_points(markers)
+
+    def _replace_overlay(self, points=()):
+        """Show points built outside _redraw_all_points (its per-set marker cache no longer matches)"""
+        self._marker_cache = {}
+        self.image_widget.set_display_points(points)
+
+    def _show_gauge_points(self):
+        """Overlay the current calibration's gauge pivot and calibration points in one update"""
+        cal = self.current_calibration
+        make_point = self.image_widget.make_display_point
+        points = []
+        if cal.gauge_pivot_x > 0:
+            points.append(make_point(cal.gauge_pivot_x, cal.gauge_pivot_y, "blue", "GAUGE PIVOT", "gauge_pivot"))
+        points.extend(
+            make_point(pt.x, pt.y, "green", f"{pt.value}", "calibration", calib_index=calib_index)
+            for calib_index, pt in enumerate(cal.calibration_points)
+        )
+        self._replace_overlay(points)
+
+    def _flush_deferred_redraw(self):
+        """Run a redraw that was skipped while the image widget was hidden"""
+        if self._redraw_dirty:
+            self._redraw_all_points()
 
-    def _redraw_symbol_markers(self):
-        """Redraw position markers for all symbols"""
+    def _redraw_symbol_markers(self, live: dict, markers: list, reuse_cached: bool = False):
+        """Collect position markers for all symbols, rebuilding only moved ones"""
         if not self.symbols:
             return
 
+        make_point = self.image_widget.make_display_point
+        marker_cache = self._marker_cache
         for symbol_id, symbol in self.symbols.items():
-            if symbol.position_x > 0 and symbol.position_y > 0:
-                self.image_widget.add_display_point(
-                    symbol.position_x,
-                    symbol.position_y,
-                    color="magenta",
-                    label=symbol_id,
-                    point_type="symbol"
-                )
-
-    def load_calibration_sets_for_needle(self, gauge_name: str, needle_id: str):
-        """Load all calibration sets for a needle from config"""
-        config_file = self.config_dir / f"{gauge_name.lower()}.json"
-
-        if not config_file.exists():
-            # Start with default set
-            self.calibration_sets = {
-                "set1": NeedleCalibration(
-                    needle_id=needle_id,
-                    needle_image_path="",
-                    gauge_name=gauge_name
-                )
-            }
-            self._update_calibration_set_combo()
-            return
+            owner = f"symbol:{symbol_id}"
+            key = (symbol.position_x, symbol.position_y)
+            cached = marker_cache.get(owner)
+            if cached is None or (not reuse_cached and cached[0] != key):
+                symbol_markers = []
+                if symbol.positioned:
+                    symbol_markers.append(make_point(
+                        symbol.position_x,
+                        symbol.position_y,
+                        color="magenta",
+                        label=symbol_id,
+                        point_type="symbol",
+                        owner=owner
+                    ))
+                cached = (key, symbol_markers)
+            live[owner] = cached
+            markers.extend(cached[1])
+
+    def load_calibration_sets_for_needle(self, gauge_name: str, needle_id: str) -> bool:
+        """Load all calibration sets for a needle from config.
+
+        Served from the in-memory config when it is current. Otherwise the
+        file is read and parsed by a _LoadCalibJob and the sets arrive in
+        _on_calibration_loaded; returns False while that load is pending.
+        """
+        config_file = self._config_file(gauge_name)
+        self._load_token += 1
+        self._load_pending = False
 
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-
-            needle_calibrations = config.get("needle_calibrations", {})
-            self.calibration_sets = {}
-
-            # Find all calibrations for this needle (look for needle_id matching)
-            for key, cal_data in needle_calibrations.items():
-                if cal_data.get("needle_id") == needle_id:
-                    set_name = cal_data.get("calibration_set", "set1")
-                    self.calibration_sets[set_name] = NeedleCalibration.from_dict(cal_data)
-
-            if not self.calibration_sets:
-                # No sets found, create default
-                self.calibration_sets["set1"] = NeedleCalibration(
-                    needle_id=needle_id,
-                    needle_image_path="",
-                    gauge_name=gauge_name
-                )
+            config = self._cached_config(config_file)
+            if config is None and config_file.exists():
+                self._load_pending = True
+                QThreadPool.globalInstance().start(
+                    _LoadCalibJob(self._load_token, config_file, needle_id, self._load_signals))
+                return False
 
-            self._update_calibration_set_combo()
+            # A gauge without a config file yet reads as an empty config
+            if config is None:
+                config = self._get_config(config_file)
+            self._apply_calibration_sets(config_file, config, gauge_name, needle_id)
 
         except Exception as e:
             logger.error(f"Failed to load calibration sets: {e}")
+        return True
+
+    def _apply_calibration_sets(self, config_file: Path, config: dict, gauge_name: str, needle_id: str):
+        """Make a needle's calibrations in config the current calibration sets"""
+        # Calibrations built from the same config entry are reused (as copies,
+        # since the UI edits them in place) until that entry is replaced
+        pristine = self._cal_intern.setdefault(config_file, {})
+
+        needle_calibrations = config.get("needle_calibrations", {})
+        self.calibration_sets = {}
+
+        # Find all calibrations for this needle (look for needle_id matching)
+        for key, cal_data in needle_calibrations.items():
+            if cal_data.get("needle_id") == needle_id:
+                set_name = cal_data.get("calibration_set", "set1")
+                entry = pristine.get(key)
+                if entry is None or entry[0] is not cal_data:
+                    entry = pristine[key] = (cal_data, NeedleCalibration.from_dict(cal_data))
+                self.calibration_sets[set_name] = entry[1].clone()
 
-    def _update_calibration_set_combo(self):
-        """Update calibration set dropdown"""
-        self.calibration_set_combo.blockSignals(True)
-        self.calibration_set_combo.clear()
-        self.calibration_set_combo.addItems(sorted(self.calibration_sets.keys()))
+        if not self.calibration_sets:
+            # No sets found, create default
+            self.calibration_sets["set1"] = NeedleCalibration(
+                needle_id=needle_id,
+                needle_image_path="",
+                gauge_name=gauge_name
+            )
+
+        self._sorted_set_names = sorted(self.calibration_sets)
+        self._update_calibration_set_combo()
 
-        if self.current_set_name in self.calibration_sets:
-            self.calibration_set_combo.setCurrentText(self.current_set_name)
+    def _on_calibration_loaded(self, token: int, result: Optional[tuple], error: Optional[str]):
+        """Install a background config load and show its calibration sets (GUI thread)"""
+        if token != self._load_token:
+            return  # A newer gauge/needle switch superseded this load
+        self._load_pending = False
+        if error is not None:
+            logger.error(f"Failed to load calibration sets: {error}")
+            return
+
+        config_file, mtime, digest, config, calibrations = result
+        cached = self._cached_config(config_file)
+        if cached is None:
+            self._config_cache[config_file] = (mtime, config)
+            self._last_write_hash[config_file] = digest
+            pristine = self._cal_intern.setdefault(config_file, {})
+            for key, cal in calibrations.items():
+                pristine[key] = (config["needle_calibrations"][key], cal)
         else:
-            self.current_set_name = list(self.calibration_sets.keys())[0]
-            self.calibration_set_combo.setCurrentText(self.current_set_name)
+            config = cached  # Edited or re-read on the GUI thread while the job ran
 
-        self.calibration_set_combo.blockSignals(False)
+        self._autosave_suspended = True
+        try:
+            self._apply_calibration_sets(config_file, config, self.current_calibration.gauge_name.lower(),
+                                         self.current_calibration.needle_id)
+            self._show_loaded_calibration()
+        finally:
+            self._autosave_suspended = False
+
+    def _set_color(self, set_name: str) -> str:
+        """Color assigned to a calibration set by its position in calibration_sets"""
+        index = self._set_order.get(set_name)
+        if index is None:
+            self._set_order = {name: i for i, name in enumerate(self.calibration_sets)}
+            index = self._set_order.get(set_name, 0)
+        return self.CALIBRATION_SET_COLORS[index % len(self.CALIBRATION_SET_COLORS)]
+
+    def _update_calibration_set_combo(self):
+        """Update calibration set dropdown"""
+        self._set_order = {name: i for i, name in enumerate(self.calibration_sets)}
+        with _signals_off(self.calibration_set_combo):
+            if len(self._sorted_set_names) != len(self.calibration_sets):
+                self._sorted_set_names = sorted(self.calibration_sets)
+            _set_combo_items(self.calibration_set_combo, self._sorted_set_names)
+
+            if self.current_set_name in self.calibration_sets:
+                self.calibration_set_combo.setCurrentText(self.current_set_name)
+            else:
+                self.current_set_name = list(self.calibration_sets.keys())[0]
+                self.calibration_set_combo.setCurrentText(self.current_set_name)
 
         # Update current calibration
         self.current_calibration = self.calibration_sets[self.current_set_name]
@@ -1272,18 +2327,26 @@ class GaugeCalibratorV2(QMainWindow):
         """Handle calibration set change"""
         if set_name not in self.calibration_sets:
             return
+        if set_name == self.current_set_name and self.current_calibration is self.calibration_sets[set_name]:
+            return  # Reselected the active set, nothing to refresh
 
+        previous_set = self.current_set_name
         self.current_set_name = set_name
         self.current_calibration = self.calibration_sets[set_name]
 
-        # Update UI
-        self._update_ui_from_calibration()
+        # Update UI; only the old and new active sets change appearance
+        self._update_ui_from_calibration(redraw=False)
+        self._recolor_active_set(previous_set)
 
         # Update color indicator
-        color = self.CALIBRATION_SET_COLORS[list(self.calibration_sets.keys()).index(set_name) % len(self.CALIBRATION_SET_COLORS)]
+        color = self._set_color(set_name)
         self.set_color_label.setText(f"Set Color: {color.capitalize()}")
         self.set_color_label.setStyleSheet(f"color: {color}; font-weight: bold; font-size: 11pt;")
 
+    def _recolor_active_set(self, previous_set: str):
+        """Rebuild markers of the previously and newly active sets, reusing all others"""
+        self._redraw_all_points(only={previous_set, self.current_set_name})
+
     def add_calibration_set(self):
         """Add new calibration set for current needle"""
         # Generate new set name
@@ -1311,6 +2374,7 @@ class GaugeCalibratorV2(QMainWindow):
         )
 
         self.calibration_sets[new_set_name] = new_cal
+        bisect.insort(self._sorted_set_names, new_set_name)
         self.current_set_name = new_set_name
         self.current_calibration = new_cal
 
@@ -1320,8 +2384,8 @@ class GaugeCalibratorV2(QMainWindow):
         self.set_color_label.setText(f"Set Color: {color.capitalize()}")
         self.set_color_label.setStyleSheet(f"color: {color}; font-weight: bold; font-size: 11pt;")
 
-        logger.info(f"✅ Added new calibration set: {new_set_name} ({color})")
-        QMessageBox.information(self, "Set Added", f"Added calibration set '{new_set_name}' with color {color}")
+        logger.info("✅ Added new calibration set: %s (%s)", new_set_name, color)
+        self._toast(f"Added calibration set '{new_set_name}' with color {color}")
 
     def delete_calibration_set(self):
         """Delete current calibration set"""
@@ -1337,6 +2401,7 @@ class GaugeCalibratorV2(QMainWindow):
 
         if reply == QMessageBox.Yes:
             del self.calibration_sets[self.current_set_name]
+            self._sorted_set_names.remove(self.current_set_name)
 
             # Switch to first remaining set
             self.current_set_name = list(self.calibration_sets.keys())[0]
@@ -1344,11 +2409,18 @@ class GaugeCalibratorV2(QMainWindow):
 
             self._update_calibration_set_combo()
 
-            logger.info(f"🗑️ Deleted calibration set")
-            QMessageBox.information(self, "Deleted", "Calibration set deleted")
+            logger.info("🗑️ Deleted calibration set")
+            self._toast("Calibration set deleted")
+
+    def _on_needle_combo_changed(self, needle_name: str):
+        """Needle combo slot - ignores reselecting the needle that is already loaded"""
+        if self.current_calibration and self._loaded_needle == (self.gauge_combo.currentText(), needle_name):
+            return
+        self.on_needle_changed(needle_name)
 
     def on_needle_changed(self, needle_name: str):
         """Handle needle selection - auto-load needle image and calibration"""
+        self._flush_pending_autosave()
         self._autosave_suspended = True
         try:
             gauge_name = self.gauge_combo.currentText()
@@ -1366,51 +2438,17 @@ class GaugeCalibratorV2(QMainWindow):
             # Don't auto-load needle image - user loads manually for Step 1
             # self._auto_load_needle_image(needle_name)
 
-            # Auto-load calibration config
+            # Auto-load calibration config (resets the UI if nothing is found)
             self._auto_load_configuration()
 
-            # If auto-load didn't find anything, reset UI
-            if (self.current_calibration.needle_pivot_x == 0 and
-                self.current_calibration.gauge_pivot_x == 0 and
-                not self.current_calibration.calibration_points):
-
-                self.needle_pivot_label.setText("Pivot: Not set")
-                self.needle_end_label.setText("End: Not set")
-                self.gauge_pivot_label.setText("Not set")
-                # Update summary label
-                if hasattr(self, 'calib_summary_label'):
-                    self.calib_summary_label.setText("0 calibration points")
-
-                # Reset spinboxes to zero
-                self.needle_pivot_x_spin.blockSignals(True)
-                self.needle_pivot_y_spin.blockSignals(True)
-                self.needle_end_x_spin.blockSignals(True)
-                self.needle_end_y_spin.blockSignals(True)
-                self.gauge_pivot_x_spin.blockSignals(True)
-                self.gauge_pivot_y_spin.blockSignals(True)
-
-                self.needle_pivot_x_spin.setValue(0)
-                self.needle_pivot_y_spin.setValue(0)
-                self.needle_end_x_spin.setValue(0)
-                self.needle_end_y_spin.setValue(0)
-                self.gauge_pivot_x_spin.setValue(0)
-                self.gauge_pivot_y_spin.setValue(0)
-
-                self.needle_pivot_x_spin.blockSignals(False)
-                self.needle_pivot_y_spin.blockSignals(False)
-                self.needle_end_x_spin.blockSignals(False)
-                self.needle_end_y_spin.blockSignals(False)
-                self.gauge_pivot_x_spin.blockSignals(False)
-                self.gauge_pivot_y_spin.blockSignals(False)
-
             # Reset point type selector to step 1a
-            self.point_type_combo.blockSignals(True)
-            self.point_type_combo.setCurrentIndex(0)
-            self.point_type_combo.blockSignals(False)
+            with _signals_off(self.point_type_combo):
+                self.point_type_combo.setCurrentIndex(0)
 
             # Track which needle point we're waiting for (pivot or end)
             self.waiting_for_needle_pivot = True
             self.waiting_for_needle_end = False
+            self._loaded_needle = (gauge_name, needle_name)
         finally:
             self._autosave_suspended = False
     
@@ -1481,35 +2519,22 @@ class GaugeCalibratorV2(QMainWindow):
         gauge_name = self.current_calibration.gauge_name.lower()
         needle_id = self.current_calibration.needle_id
         
-        # Try standard paths (prefer SVG over PNG)
-        gauges_dir = Path(__file__).parent.parent / "gauges"
-        
-        # Check for needle.svg (shared needle)
-        needle_path = gauges_dir / "needle.svg"
-        if not needle_path.exists():
-            # Try needle ID with SVG
-            needle_path = gauges_dir / f"{needle_id}_needle.svg"
-        if not needle_path.exists():
-            # Try gauge name with SVG
-            needle_path = gauges_dir / f"{gauge_name}_needle.svg"
-        if not needle_path.exists():
-            # Fall back to PNG
-            needle_path = gauges_dir / f"{needle_id}_needle.png"
-        if not needle_path.exists():
-            needle_path = gauges_dir / f"{gauge_name}_needle.png"
-        
-        if not needle_path.exists():
+        # Try standard paths (prefer SVG over PNG); explicit loads rescan the folder
+        _list_gauges.cache_clear()
+        needle_path = _find_needle_image(_GAUGES_DIR, needle_id, gauge_name)
+        
+        if needle_path is None:
             QMessageBox.warning(self, "Error", f"Needle image not found. Expected: gauges/needle.svg or {needle_id}_needle.png")
             return
         
         if self.image_widget.load_image(str(needle_path)):
             self.current_calibration.needle_image_path = str(needle_path)
-            self.image_widget.clear_display_points()
+            self._replace_overlay()
             self.image_widget.set_click_callback(self.on_needle_pivot_click)
             
             status = f"Ready: click needle pivot point on {needle_path.name}"
             self.needle_pivot_label.setText(status)
-            QMessageBox.information(self, "Step 1", "Click the PIVOT POINT on the needle image")
+            self._toast("Step 1: click the PIVOT POINT on the needle image")
             self._schedule_autosave()
     
     def on_needle_pivot_click(self, x: float, y: float):
@@ -1523,14 +2548,12 @@ class GaugeCalibratorV2(QMainWindow):
             self.current_calibration.needle_pivot_y = y
             
             self.image_widget.add_display_point(x, y, "red", "PIVOT", "needle_pivot")
-            self.needle_pivot_label.setText(f"✓ Pivot: ({int(x)}, {int(y)})")
+            _set_text(self.needle_pivot_label, f"✓ Pivot: ({int(x)}, {int(y)})")
             
             self.waiting_for_needle_pivot = False
             self.waiting_for_needle_end = True
             
-            QMessageBox.information(self, "Step 1a Complete", 
-                                  f"Pivot set at ({int(x)}, {int(y)})\n\n"
-                                  f"Now click the NEEDLE TIP/END POINT")
+            self._toast(f"Pivot set at ({int(x)}, {int(y)}) - now click the NEEDLE TIP/END POINT")
             self._schedule_autosave()
         
         elif self.waiting_for_needle_end:
@@ -1539,19 +2562,17 @@ class GaugeCalibratorV2(QMainWindow):
             self.current_calibration.needle_end_y = y
             
             self.image_widget.add_display_point(x, y, "blue", "END", "needle_end")
-            self.needle_end_label.setText(f"✓ End: ({int(x)}, {int(y)})")
+            _set_text(self.needle_end_label, f"✓ End: ({int(x)}, {int(y)})")
             
             self.waiting_for_needle_end = False
             
             # Draw line from pivot to end to show needle
             pivot_x = self.current_calibration.needle_pivot_x
             pivot_y = self.current_calibration.needle_pivot_y
-            length = ((x - pivot_x)**2 + (y - pivot_y)**2) ** 0.5
+            length = math.hypot(x - pivot_x, y - pivot_y)
             
-            QMessageBox.information(self, "Step 1 Complete",
-                                  f"End point set at ({int(x)}, {int(y)})\n"
-                                  f"Needle length: {length:.1f} pixels\n\n"
-                                  f"Ready to save or continue to Step 2")
+            self._toast(f"End point set at ({int(x)}, {int(y)}), needle length {length:.1f} px - "
+                        f"ready to save or continue to Step 2")
             self._schedule_autosave()
 
     def reset_needle_geometry(self):
@@ -1584,7 +2605,7 @@ class GaugeCalibratorV2(QMainWindow):
             self._redraw_all_points()
 
             logger.info("✅ Reset needle geometry")
-            QMessageBox.information(self, "Reset Complete", "Needle geometry cleared. Click 'Load Needle Image' to set new pivot and end points.")
+            self._toast("Needle geometry cleared. Click 'Load Needle Image' to set new pivot and end points.")
 
     def reset_gauge_pivot(self):
         """Reset gauge pivot to allow re-clicking"""
@@ -1609,7 +2630,7 @@ class GaugeCalibratorV2(QMainWindow):
             self._redraw_all_points()
 
             logger.info("✅ Reset gauge pivot")
-            QMessageBox.information(self, "Reset Complete", "Gauge pivot cleared. Click on the gauge image to set new pivot point.")
+            self._toast("Gauge pivot cleared. Click on the gauge image to set new pivot point.")
 
     def load_gauge_image(self):
         """Load gauge background image"""
@@ -1618,32 +2639,18 @@ class GaugeCalibratorV2(QMainWindow):
             return
         
         gauge_name = self.current_calibration.gauge_name.lower()
-        gauge_path = Path(__file__).parent.parent / "gauges" / f"{gauge_name}_bg.png"
+        gauge_path = _gauge_bg_path(gauge_name)
         
-        if not gauge_path.exists():
+        if not _gauges_file_exists(gauge_path):
             QMessageBox.warning(self, "Error", f"Gauge image not found: {gauge_path}")
             return
         
         if self.image_widget.load_image(str(gauge_path)):
-            self.image_widget.clear_display_points()
-            
-            # First show gauge pivot location
-            if self.current_calibration.gauge_pivot_x > 0:
-                self.image_widget.add_display_point(
-                    self.current_calibration.gauge_pivot_x,
-                    self.current_calibration.gauge_pivot_y,
-                    "blue", "GAUGE PIVOT", "gauge_pivot"
-                )
-            
-            # Show existing calibration points
-            for point in self.current_calibration.calibration_points:
-                self.image_widget.add_display_point(
-                    point.x, point.y, "green", f"{point.value}", "calibration"
-                )
+            # Show gauge pivot location and existing calibration points
+            self._show_gauge_points()
             
             self.image_widget.set_click_callback(self.on_gauge_click)
-            QMessageBox.information(self, "Gauge Image Loaded", 
-                                  "Click to set gauge pivot or add calibration points")
+            self._toast("Gauge image loaded - click to set gauge pivot or add calibration points")
     
     def on_gauge_click(self, x: float, y: float):
         """Handle click on gauge image - set pivot or calibration point"""
@@ -1651,19 +2658,19 @@ class GaugeCalibratorV2(QMainWindow):
             # First click sets gauge pivot
             self.current_calibration.gauge_pivot_x = x
             self.current_calibration.gauge_pivot_y = y
-            self.gauge_pivot_label.setText(f"✓ Gauge Pivot: ({int(x)}, {int(y)})")
+            _set_text(self.gauge_pivot_label, f"✓ Gauge Pivot: ({int(x)}, {int(y)})")
             
             self.image_widget.add_display_point(x, y, "blue", "GAUGE PIVOT", "gauge_pivot")
-            QMessageBox.information(self, "Success", 
-                                  f"Gauge pivot set at ({int(x)}, {int(y)})\nNow add calibration points")
+            self._toast(f"Gauge pivot set at ({int(x)}, {int(y)}) - now add calibration points")
             self._schedule_autosave()
         else:
             # Store last click location for next "Add Point" button press
             self.last_click_x = x
             self.last_click_y = y
-            self.image_widget.add_display_point(x, y, "yellow", "pending", "calibration")
-            QMessageBox.information(self, "Point Captured",
-                                  f"Click location: ({int(x)}, {int(y)})\nNow enter value and press Add Point")
+            # Re-clicks move the one pending marker instead of stacking new ones
+            if self._pending_marker is None or not self.image_widget.update_display_point(self._pending_marker, x=x, y=y):
+                self._pending_marker = self.image_widget.add_display_point(x, y, "yellow", "pending", "calibration")
+            self._toast(f"Point captured at ({int(x)}, {int(y)}) - enter its value and press Add Point")
     
     def on_point_dragged(self, point_index: int, x: float, y: float):
         """Handle dragging an existing point"""
@@ -1673,60 +2680,42 @@ class GaugeCalibratorV2(QMainWindow):
         point_info = self.image_widget.display_points[point_index]
         point_type = point_info.get("point_type")
         
-        # Update the point in display_points
+        # Update the point in display_points (its cached marker list is now stale)
         point_info["x"] = x
         point_info["y"] = y
+        self._marker_cache.pop(point_info.get("owner"), None)
         
         # Update corresponding calibration data
         if point_type == "needle_pivot":
             self.current_calibration.needle_pivot_x = x
             self.current_calibration.needle_pivot_y = y
-            self.needle_pivot_x_spin.blockSignals(True)
-            self.needle_pivot_y_spin.blockSignals(True)
-            self.needle_pivot_x_spin.setValue(int(x))
-            self.needle_pivot_y_spin.setValue(int(y))
-            self.needle_pivot_x_spin.blockSignals(False)
-            self.needle_pivot_y_spin.blockSignals(False)
-            self.needle_pivot_label.setText(f"✓ Pivot: ({int(x)}, {int(y)})")
+            self._apply_values([(self.needle_pivot_x_spin, int(x)), (self.needle_pivot_y_spin, int(y))])
+            _set_text(self.needle_pivot_label, f"✓ Pivot: ({int(x)}, {int(y)})")
             
         elif point_type == "needle_end":
             self.current_calibration.needle_end_x = x
             self.current_calibration.needle_end_y = y
-            self.needle_end_x_spin.blockSignals(True)
-            self.needle_end_y_spin.blockSignals(True)
-            self.needle_end_x_spin.setValue(int(x))
-            self.needle_end_y_spin.setValue(int(y))
-            self.needle_end_x_spin.blockSignals(False)
-            self.needle_end_y_spin.blockSignals(False)
-            self.needle_end_label.setText(f"✓ End: ({int(x)}, {int(y)})")
+            self._apply_values([(self.needle_end_x_spin, int(x)), (self.needle_end_y_spin, int(y))])
+            _set_text(self.needle_end_label, f"✓ End: ({int(x)}, {int(y)})")
             
         elif point_type == "gauge_pivot":
             self.current_calibration.gauge_pivot_x = x
             self.current_calibration.gauge_pivot_y = y
-            self.gauge_pivot_x_spin.blockSignals(True)
-            self.gauge_pivot_y_spin.blockSignals(True)
-            self.gauge_pivot_x_spin.setValue(int(x))
-            self.gauge_pivot_y_spin.setValue(int(y))
-            self.gauge_pivot_x_spin.blockSignals(False)
-            self.gauge_pivot_y_spin.blockSignals(False)
-            self.gauge_pivot_label.setText(f"✓ ({int(x)}, {int(y)})")
+            self._apply_values([(self.gauge_pivot_x_spin, int(x)), (self.gauge_pivot_y_spin, int(y))])
+            _set_text(self.gauge_pivot_label, f"✓ ({int(x)}, {int(y)})")
             
         elif point_type == "calibration":
-            # Find which calibration point this is and update it
-            # Count calibration points up to this display point
-            calib_index = 0
-            display_index = 0
-            for i, dp in enumerate(self.image_widget.display_points):
-                if i == point_index:
-                    break
-                if dp.get("point_type") == "calibration":
-                    calib_index += 1
+            # Markers carry the index of the calibration point they were built from
+            owner = point_info.get("owner")
+            calib_index = point_info.get("calib_index")
             
-            if calib_index < len(self.current_calibration.calibration_points):
+            if owner not in (None, self.current_set_name) or calib_index is None:
+                pass  # Inactive set or pending marker, not a point of the calibration being edited
+            elif calib_index < len(self.current_calibration.calibration_points):
                 self.current_calibration.calibration_points[calib_index].x = x
                 self.current_calibration.calibration_points[calib_index].y = y
                 self._refresh_calibration_table()
-        self._schedule_autosave()
+        # Autosave is scheduled once the drag is released
     
     def add_calibration_point(self):
         """Add calibration point from last click and entered value"""
@@ -1734,7 +2723,7 @@ class GaugeCalibratorV2(QMainWindow):
             QMessageBox.warning(self, "Error", "Select gauge first")
             return
         
-        if not hasattr(self, 'last_click_x'):
+        if self.last_click_x is None:
             QMessageBox.warning(self, "Error", "Click on gauge image first")
             return
         
@@ -1744,34 +2733,47 @@ class GaugeCalibratorV2(QMainWindow):
         
         self._refresh_calibration_table()
         
-        # Update display
-        self.image_widget.clear_display_points()
-        self.image_widget.add_display_point(
-            self.current_calibration.gauge_pivot_x,
-            self.current_calibration.gauge_pivot_y,
-            "blue", "GAUGE PIVOT", "gauge_pivot"
-        )
-        for pt in self.current_calibration.calibration_points:
-            self.image_widget.add_display_point(pt.x, pt.y, "green", f"{pt.value}", "calibration")
+        # Update display: the pending marker becomes the new point's marker
+        pending, self._pending_marker = self._pending_marker, None
+        promoted = pending is not None and (pending["x"], pending["y"]) == (point.x, point.y) and \
+            self.image_widget.update_display_point(
+                pending, color="green", label=f"{value}",
+                calib_index=len(self.current_calibration.calibration_points) - 1
+            )
+        if promoted:
+            self._marker_cache.pop(self.current_set_name, None)
+        else:
+            self._show_gauge_points()
         self._schedule_autosave()
     
     def _refresh_calibration_table(self):
         """Update calibration summary label"""
-        if not hasattr(self, 'calib_summary_label'):
+        if self.calib_summary_label is None:
             return
 
         num_points = len(self.current_calibration.calibration_points)
-        self.calib_summary_label.setText(f"{num_points} calibration point{'s' if num_points != 1 else ''}")
+        _set_text(self.calib_summary_label, f"{num_points} calibration point{'s' if num_points != 1 else ''}")
     
+    def _drop_calibration_markers(self, first_index: int):
+        """Remove the active set's calibration markers from first_index on, leaving the rest of the overlay"""
+        cached = self._marker_cache.pop(self.current_set_name, None)
+        if cached is None or self._redraw_dirty:
+            self._redraw_all_points()
+            return
+        self.image_widget.remove_display_points([
+            marker for marker in cached[1]
+            if marker["point_type"] == "calibration" and marker["calib_index"] >= first_index
+        ])
+
     def delete_last_calibration_point(self):
         """Delete the last calibration point"""
         if not self.current_calibration or not self.current_calibration.calibration_points:
-            QMessageBox.information(self, "No Points", "No calibration points to delete")
+            self._toast("No calibration points to delete")
             return
 
         deleted_point = self.current_calibration.calibration_points.pop()
         self._refresh_calibration_table()
-        self._redraw_all_points()
+        self._drop_calibration_markers(len(self.current_calibration.calibration_points))
         logger.info(f"🗑️ Deleted calibration point at value {deleted_point.value}")
         self._schedule_autosave()
 
@@ -1789,7 +2791,7 @@ class GaugeCalibratorV2(QMainWindow):
         if reply == QMessageBox.Yes:
             self.current_calibration.calibration_points.clear()
             self._refresh_calibration_table()
-            self._redraw_all_points()
+            self._drop_calibration_markers(0)
             logger.info("🗑️ Cleared all calibration points")
             self._schedule_autosave()
 
@@ -1821,27 +2823,7 @@ class GaugeCalibratorV2(QMainWindow):
         # Load or create gauge config
         try:
             gauge_name = self.current_calibration.gauge_name.lower()
-            config_file = self.config_dir / f"{gauge_name}.json"
-            
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                # Handle old format: if it has "needles" instead of "needle_calibrations", migrate it
-                if "needles" in config and "needle_calibrations" not in config:
-                    config["needle_calibrations"] = {}
-                # Ensure config is a dict
-                if not isinstance(config, dict):
-                    config = {"name": self.current_calibration.gauge_name, "needle_calibrations": {}}
-            else:
-                config = {"name": self.current_calibration.gauge_name, "needle_calibrations": {}}
-            
-            # Ensure needle_calibrations key exists
-            if "needle_calibrations" not in config:
-                config["needle_calibrations"] = {}
-            
-            # Ensure it's a dict
-            if not isinstance(config["needle_calibrations"], dict):
-                config["needle_calibrations"] = {}
+            config_file = self._config_file(gauge_name)
             
             # Save ONLY needle geometry, no gauge/calibration points
             needle_config = {
@@ -1859,10 +2841,8 @@ class GaugeCalibratorV2(QMainWindow):
                 "max_value": self.current_calibration.max_value,
             }
             
-            config["needle_calibrations"][self.current_calibration.needle_id] = needle_config
-            
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            with self._editing_config(config_file, self.current_calibration.gauge_name) as config:
+                config["needle_calibrations"][self.current_calibration.needle_id] = needle_config
             
             QMessageBox.information(self, "Success", 
                                   f"✓ Needle configuration saved!\n\n"
@@ -1873,7 +2853,6 @@ class GaugeCalibratorV2(QMainWindow):
                                   f"{int(self.current_calibration.needle_end_y)})\n"
                                   f"File: {config_file}")
         except Exception as e:
-            import traceback
             error_details = traceback.format_exc()
             QMessageBox.critical(self, "Error", 
                                f"Failed to save 'needle_calibrations':\n\n{e}\n\n{error_details}")
@@ -1895,47 +2874,22 @@ class GaugeCalibratorV2(QMainWindow):
         # Load or create gauge config
         try:
             gauge_name = self.current_calibration.gauge_name.lower()
-            config_file = self.config_dir / f"{gauge_name}.json"
-
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                # Handle old format: if it has "needles" instead of "needle_calibrations", migrate it
-                if "needles" in config and "needle_calibrations" not in config:
-                    config["needle_calibrations"] = {}
-                # Ensure config is a dict
-                if not isinstance(config, dict):
-                    config = {"name": self.current_calibration.gauge_name, "needle_calibrations": {}}
-            else:
-                config = {"name": self.current_calibration.gauge_name, "needle_calibrations": {}}
-
-            # Ensure needle_calibrations key exists
-            if "needle_calibrations" not in config:
-                config["needle_calibrations"] = {}
-
-            # Ensure it's a dict
-            if not isinstance(config["needle_calibrations"], dict):
-                config["needle_calibrations"] = {}
+            config_file = self._config_file(gauge_name)
 
             # Save all calibration sets for current needle
-            for set_name, calibration in self.calibration_sets.items():
-                # Generate key: needle_id_setname (e.g., "main_set1")
-                key = f"{calibration.needle_id}_{set_name}"
-
-                cal_dict = calibration.to_dict()
-                cal_dict["calibration_set"] = set_name
+            colors = self.CALIBRATION_SET_COLORS
+            with self._editing_config(config_file, self.current_calibration.gauge_name) as config:
+                for color_index, (set_name, calibration) in enumerate(self.calibration_sets.items()):
+                    # Generate key: needle_id_setname (e.g., "main_set1")
+                    key = f"{calibration.needle_id}_{set_name}"
 
-                # Assign color if not present
-                color_index = list(self.calibration_sets.keys()).index(set_name)
-                cal_dict["calibration_set_color"] = self.CALIBRATION_SET_COLORS[
-                    color_index % len(self.CALIBRATION_SET_COLORS)
-                ]
+                    cal_dict = calibration.to_dict()
+                    cal_dict["calibration_set"] = set_name
 
-                config["needle_calibrations"][key] = cal_dict
+                    # Color follows the set's position, same as _set_color
+                    cal_dict["calibration_set_color"] = colors[color_index % len(colors)]
 
-            # Write config
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+                    config["needle_calibrations"][key] = cal_dict
 
             self.has_unsaved_changes = False
 
@@ -1949,14 +2903,12 @@ class GaugeCalibratorV2(QMainWindow):
                 f"Sets: {', '.join(self.calibration_sets.keys())}"
             )
         except KeyError as e:
-            import traceback
             error_details = traceback.format_exc()
             QMessageBox.critical(self, "Error",
                                f"KeyError saving configuration:\n\nMissing key: {e}\n\n"
                                f"This usually means the JSON file structure is corrupted.\n\n"
                                f"{error_details}")
         except Exception as e:
-            import traceback
             error_details = traceback.format_exc()
             QMessageBox.critical(self, "Error",
                                f"Failed to save configuration:\n\n{e}\n\n{error_details}")
@@ -1974,17 +2926,15 @@ class GaugeCalibratorV2(QMainWindow):
         self._autosave_suspended = True
         try:
             gauge_name = self.current_calibration.gauge_name.lower()
-            config_file = self.config_dir / f"{gauge_name}.json"
-            
-            if not config_file.exists():
+            config_file = self._config_file(gauge_name)
+            config = self._get_config(config_file)
+
+            if not config["needle_calibrations"]:
                 QMessageBox.information(self, "New Gauge", f"No existing configuration for {gauge_name}.\n\nThis is a new gauge - start calibrating!")
                 return
             
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-            
             needle_id = self.current_calibration.needle_id
-            if "needle_calibrations" not in config or needle_id not in config["needle_calibrations"]:
+            if needle_id not in config["needle_calibrations"]:
                 QMessageBox.information(self, "New Needle", f"No existing calibration for {needle_id}.\n\nThis is a new needle - start calibrating!")
                 return
             
@@ -1995,26 +2945,15 @@ class GaugeCalibratorV2(QMainWindow):
             self._refresh_calibration_table()
             
             # Update spinboxes with loaded values
-            self.needle_pivot_x_spin.blockSignals(True)
-            self.needle_pivot_y_spin.blockSignals(True)
-            self.needle_end_x_spin.blockSignals(True)
-            self.needle_end_y_spin.blockSignals(True)
-            self.gauge_pivot_x_spin.blockSignals(True)
-            self.gauge_pivot_y_spin.blockSignals(True)
-            
-            self.needle_pivot_x_spin.setValue(int(self.current_calibration.needle_pivot_x))
-            self.needle_pivot_y_spin.setValue(int(self.current_calibration.needle_pivot_y))
-            self.needle_end_x_spin.setValue(int(self.current_calibration.needle_end_x))
-            self.needle_end_y_spin.setValue(int(self.current_calibration.needle_end_y))
-            self.gauge_pivot_x_spin.setValue(int(self.current_calibration.gauge_pivot_x))
-            self.gauge_pivot_y_spin.setValue(int(self.current_calibration.gauge_pivot_y))
-            
-            self.needle_pivot_x_spin.blockSignals(False)
-            self.needle_pivot_y_spin.blockSignals(False)
-            self.needle_end_x_spin.blockSignals(False)
-            self.needle_end_y_spin.blockSignals(False)
-            self.gauge_pivot_x_spin.blockSignals(False)
-            self.gauge_pivot_y_spin.blockSignals(False)
+            cal = self.current_calibration
+            self._apply_values([
+                (self.needle_pivot_x_spin, int(cal.needle_pivot_x)),
+                (self.needle_pivot_y_spin, int(cal.needle_pivot_y)),
+                (self.needle_end_x_spin, int(cal.needle_end_x)),
+                (self.needle_end_y_spin, int(cal.needle_end_y)),
+                (self.gauge_pivot_x_spin, int(cal.gauge_pivot_x)),
+                (self.gauge_pivot_y_spin, int(cal.gauge_pivot_y)),
+            ])
             
             self.needle_pivot_label.setText(
                 f"✓ Pivot: ({int(self.current_calibration.needle_pivot_x)}, "
@@ -2031,45 +2970,53 @@ class GaugeCalibratorV2(QMainWindow):
             
             QMessageBox.information(self, "Loaded", f"Configuration loaded for {needle_id}\n\n{len(self.current_calibration.calibration_points)} calibration points found")
         except Exception as e:
-            import traceback
             error_details = traceback.format_exc()
             QMessageBox.critical(self, "Error", f"Failed to load:\n\n{e}\n\n{error_details}")
         finally:
             self._autosave_suspended = False
 
     def _schedule_autosave(self):
+        """Mark the calibration dirty and (re)start the coalescing autosave timer"""
         if self._autosave_suspended or not self.current_calibration:
             return
+        self._autosave_dirty = True
         self._autosave_timer.start()
 
-    def _autosave_current_calibration(self):
-        if self._autosave_suspended or not self.current_calibration:
-            return
+    def _flush_pending_autosave(self):
+        """Run a scheduled autosave now, before the current calibration is replaced"""
+        if self._autosave_timer.isActive():
+            self._autosave_timer.stop()
+            self._do_autosave()
 
-        try:
-            gauge_name = self.current_calibration.gauge_name.lower()
-            config_file = self.config_dir / f"{gauge_name}.json"
-
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                if "needles" in config and "needle_calibrations" not in config:
-                    config["needle_calibrations"] = {}
-                if not isinstance(config, dict):
-                    config = {"name": self.current_calibration.gauge_name, "needle_calibrations": {}}
-            else:
-                config = {"name": self.current_calibration.gauge_name, "needle_calibrations": {}}
+    def _do_autosave(self):
+        """Stage the current calibration into its config and flush dirty configs (autosave timer slot)"""
+        if self._autosave_suspended:
+            return
 
-            if "needle_calibrations" not in config or not isinstance(config["needle_calibrations"], dict):
-                config["needle_calibrations"] = {}
+        # While a load is pending current_calibration is a placeholder, not the stored calibration
+        if self._autosave_dirty and self.current_calibration and not self._load_pending:
+            try:
+                gauge_name = self.current_calibration.gauge_name.lower()
+                config_file = self._config_file(gauge_name)
+                config = self._get_config(config_file, self.current_calibration.gauge_name)
+                entry = self.current_calibration.to_dict()
+                calibrations = config["needle_calibrations"]
+                # A drag that ended where it started leaves nothing to write
+                if calibrations.get(self.current_calibration.needle_id) != entry:
+                    calibrations[self.current_calibration.needle_id] = entry
+                    self._mark_config_dirty(config_file)
+                self._autosave_dirty = False
+            except Exception as e:
+                logger.warning(f"⚠️ Autosave failed: {e}")
 
-            config["needle_calibrations"][self.current_calibration.needle_id] = \
-                self.current_calibration.to_dict()
+        self._flush_dirty_configs()
 
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-        except Exception as e:
-            logger.warning(f"⚠️ Autosave failed: {e}")
+    def closeEvent(self, event):
+        """Write any edits still waiting on the autosave timer before closing"""
+        self._autosave_timer.stop()
+        self._do_autosave()
+        self._write_pool.waitForDone()
+        super().closeEvent(event)
     
     def reset_current_gauge(self):
         """Reset current gauge calibration"""
@@ -2101,12 +3048,11 @@ class GaugeCalibratorV2(QMainWindow):
             self.gauge_pivot_label.setText("Not set")
 
             # Update calibration summary
-            if hasattr(self, 'calib_summary_label'):
+            if self.calib_summary_label is not None:
                 self.calib_summary_label.setText("0 calibration points")
 
             # Refresh display
-            self.image_widget.clear_display_points()
-            self.image_widget.update()
+            self._replace_overlay()
             
             logger.info("🔄 Gauge calibration reset")
             QMessageBox.information(self, "Reset", "Gauge calibration has been reset")
@@ -2115,25 +3061,23 @@ class GaugeCalibratorV2(QMainWindow):
         """Add a new needle to current gauge"""
         gauge_name = self.gauge_combo.currentText()
         
+        needle_list = self.NEEDLE_TYPES.setdefault(gauge_name, ["main"])
+
         # Find next available needle number
-        existing_needles = self.NEEDLE_TYPES.get(gauge_name, ["main"])
+        taken = set(needle_list)
         needle_num = 1
-        while f"needle_{needle_num}" in existing_needles:
+        while f"needle_{needle_num}" in taken:
             needle_num += 1
         
         new_needle_name = f"needle_{needle_num}"
         
         # Add to needle types
-        if gauge_name not in self.NEEDLE_TYPES:
-            self.NEEDLE_TYPES[gauge_name] = ["main"]
-        
-        self.NEEDLE_TYPES[gauge_name].append(new_needle_name)
+        needle_list.append(new_needle_name)
         
         # Update needle combo
-        self.needle_combo.blockSignals(True)
-        self.needle_combo.addItem(new_needle_name)
-        self.needle_combo.setCurrentText(new_needle_name)
-        self.needle_combo.blockSignals(False)
+        with _signals_off(self.needle_combo):
+            self.needle_combo.addItem(new_needle_name)
+            self.needle_combo.setCurrentText(new_needle_name)
         
         # Persist the needle to config file
         self._persist_needle_to_config(gauge_name, new_needle_name)
@@ -2143,43 +3087,33 @@ class GaugeCalibratorV2(QMainWindow):
     
     def _persist_needle_to_config(self, gauge_name, needle_name):
         """Save a new needle entry to the config file"""
-        config_file = self.config_dir / f"{gauge_name.lower()}.json"
-        
-        # Load existing config or create new
-        if config_file.exists():
-            try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-            except:
-                config = {}
-        else:
-            config = {}
+        config_file = self._config_file(gauge_name)
         
-        # Ensure needle_calibrations section exists
-        if 'needle_calibrations' not in config:
-            config['needle_calibrations'] = {}
+        try:
+            config = self._get_config(config_file)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read {config_file.name}, not persisting {needle_name}: {e}")
+            return
         
         # Add new needle with empty calibration (will be filled when user calibrates)
         if needle_name not in config['needle_calibrations']:
-            config['needle_calibrations'][needle_name] = {
-                "pivot_x": 0,
-                "pivot_y": 0,
-                "end_x": 0,
-                "end_y": 0,
-                "calibration_points": [],
-                "scale": 1.0
-            }
-            
-            # Save config
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-            
-            logger.info(f"💾 Persisted {needle_name} to {config_file.name}")
+            # Written with the next autosave flush (or save/close), so
+            # adding several needles in a row costs one write
+            with self._editing_config(config_file, flush=False) as config:
+                config['needle_calibrations'][needle_name] = {
+                    "pivot_x": 0,
+                    "pivot_y": 0,
+                    "end_x": 0,
+                    "end_y": 0,
+                    "calibration_points": [],
+                    "scale": 1.0
+                }
+            self._autosave_timer.start()
+
+            logger.info(f"💾 Queued {needle_name} for {config_file.name}")
     
     def rename_needle(self):
         """Rename the currently selected needle"""
-        from PyQt5.QtWidgets import QInputDialog
-        
         gauge_name = self.gauge_combo.currentText()
         old_needle_name = self.needle_combo.currentText()
         
@@ -2198,53 +3132,46 @@ class GaugeCalibratorV2(QMainWindow):
             return
         
         # Check if name already exists
-        if new_name in self.NEEDLE_TYPES.get(gauge_name, []):
+        needle_list = self.NEEDLE_TYPES.get(gauge_name, [])
+        if new_name in needle_list:
             QMessageBox.warning(self, "Name Exists", f"Needle '{new_name}' already exists!")
             return
         
         # Update in-memory needle types
-        needle_list = self.NEEDLE_TYPES.get(gauge_name, [])
-        if old_needle_name in needle_list:
-            idx = needle_list.index(old_needle_name)
-            needle_list[idx] = new_name
+        try:
+            needle_list[needle_list.index(old_needle_name)] = new_name
+        except ValueError:
+            pass
         
         # Update config file
-        config_file = self.config_dir / f"{gauge_name.lower()}.json"
-        if config_file.exists():
-            try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                
-                # Rename in needle_calibrations
-                if 'needle_calibrations' in config:
-                    if old_needle_name in config['needle_calibrations']:
-                        config['needle_calibrations'][new_name] = config['needle_calibrations'].pop(old_needle_name)
-                        
-                        # Update needle_id field if it exists
-                        if 'needle_id' in config['needle_calibrations'][new_name]:
-                            config['needle_calibrations'][new_name]['needle_id'] = new_name
-                        
-                        # Save
-                        with open(config_file, 'w') as f:
-                            json.dump(config, f, indent=2)
-                        
-                        logger.info(f"✏️ Renamed '{old_needle_name}' to '{new_name}'")
-                
-                # Update combo box
-                self.needle_combo.blockSignals(True)
-                self.needle_combo.clear()
-                self.needle_combo.addItems(needle_list)
+        config_file = self._config_file(gauge_name)
+        try:
+            # Rename in needle_calibrations (no write if the needle was never saved)
+            if old_needle_name in self._get_config(config_file)['needle_calibrations']:
+                with self._editing_config(config_file) as config:
+                    calibration = config['needle_calibrations'].pop(old_needle_name)
+                    config['needle_calibrations'][new_name] = calibration
+
+                    # Update needle_id field if it exists
+                    if 'needle_id' in calibration:
+                        calibration['needle_id'] = new_name
+                self._cal_intern.pop(config_file, None)
+
+                logger.info(f"✏️ Renamed '{old_needle_name}' to '{new_name}'")
+            
+            # Update combo box
+            with _signals_off(self.needle_combo):
+                _set_combo_items(self.needle_combo, needle_list)
                 self.needle_combo.setCurrentText(new_name)
-                self.needle_combo.blockSignals(False)
-                
-                # Update current calibration
-                if self.current_calibration and self.current_calibration.needle_id == old_needle_name:
-                    self.current_calibration.needle_id = new_name
-                
-                QMessageBox.information(self, "Renamed", f"Renamed to '{new_name}'")
-            except Exception as e:
-                logger.error(f"❌ Failed to rename needle: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to rename: {e}")
+            
+            # Update current calibration
+            if self.current_calibration and self.current_calibration.needle_id == old_needle_name:
+                self.current_calibration.needle_id = new_name
+            
+            QMessageBox.information(self, "Renamed", f"Renamed to '{new_name}'")
+        except Exception as e:
+            logger.error(f"❌ Failed to rename needle: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to rename: {e}")
     
     def delete_needle(self):
         """Delete the currently selected needle"""
@@ -2276,37 +3203,27 @@ class GaugeCalibratorV2(QMainWindow):
         needle_list.remove(needle_name)
         
         # Remove from config file
-        config_file = self.config_dir / f"{gauge_name.lower()}.json"
-        if config_file.exists():
-            try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                
-                # Delete from needle_calibrations
-                if 'needle_calibrations' in config:
-                    if needle_name in config['needle_calibrations']:
-                        del config['needle_calibrations'][needle_name]
-                        
-                        # Save
-                        with open(config_file, 'w') as f:
-                            json.dump(config, f, indent=2)
-                        
-                        logger.info(f"🗑️ Deleted needle '{needle_name}' from {gauge_name}")
-                
-                # Update combo box to first remaining needle
-                self.needle_combo.blockSignals(True)
-                self.needle_combo.clear()
-                self.needle_combo.addItems(needle_list)
-                self.needle_combo.blockSignals(False)
-                
-                # Switch to first needle
-                if needle_list:
-                    self.on_needle_changed(needle_list[0])
-                
-                QMessageBox.information(self, "Deleted", f"Deleted '{needle_name}'")
-            except Exception as e:
-                logger.error(f"❌ Failed to delete needle: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to delete: {e}")
+        config_file = self._config_file(gauge_name)
+        try:
+            # Delete from needle_calibrations (no write if the needle was never saved)
+            if needle_name in self._get_config(config_file)['needle_calibrations']:
+                with self._editing_config(config_file) as config:
+                    del config['needle_calibrations'][needle_name]
+
+                logger.info(f"🗑️ Deleted needle '{needle_name}' from {gauge_name}")
+            
+            # Update combo box to first remaining needle
+            with _signals_off(self.needle_combo):
+                _set_combo_items(self.needle_combo, needle_list)
+            
+            # Switch to first needle
+            if needle_list:
+                self.on_needle_changed(needle_list[0])
+            
+            QMessageBox.information(self, "Deleted", f"Deleted '{needle_name}'")
+        except Exception as e:
+            logger.error(f"❌ Failed to delete needle: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to delete: {e}")
 
     # ========== Symbol Management Methods ==========
 
@@ -2319,30 +3236,21 @@ class GaugeCalibratorV2(QMainWindow):
             return
 
         gauge_name = self.current_calibration.gauge_name.lower()
-        config_file = self.config_dir / f"{gauge_name}.json"
-
-        if not config_file.exists():
-            logger.info(f"No config file found for {gauge_name} - starting fresh")
-            self.symbols = {}
-            self._update_symbol_combo()
-            return
+        config_file = self._config_file(gauge_name)
 
         try:
-            with open(config_file, 'r') as f:
-                data = json.load(f)
+            data = self._get_config(config_file)
 
-            self.symbols = {}
-            for symbol_id, symbol_data in data.get("symbols", {}).items():
-                self.symbols[symbol_id] = Symbol.from_dict(symbol_data)
+            self.symbols = {
+                symbol_id: Symbol.from_dict(symbol_data)
+                for symbol_id, symbol_data in data.get("symbols", {}).items()
+            }
 
-            if self.symbols:
-                self.current_symbol_id = list(self.symbols.keys())[0]
-            else:
-                self.current_symbol_id = None
+            self.current_symbol_id = next(iter(self.symbols), None)
 
             self._update_symbol_combo()
 
-            logger.info(f"✅ Loaded {len(self.symbols)} symbol(s) for {gauge_name}")
+            logger.info("✅ Loaded %d symbol(s) for %s", len(self.symbols), gauge_name)
 
         except Exception as e:
             logger.error(f"Failed to load symbols for {gauge_name}: {e}")
@@ -2352,27 +3260,32 @@ class GaugeCalibratorV2(QMainWindow):
 
     def _update_symbol_combo(self):
         """Update symbol dropdown"""
-        self.symbol_combo.blockSignals(True)
-        self.symbol_combo.clear()
-
-        if self.symbols:
-            sorted_symbols = sorted(self.symbols.keys())
-            self.symbol_combo.addItems(sorted_symbols)
-            logger.info(f"📋 Symbol dropdown updated with: {sorted_symbols}")
-
-            if self.current_symbol_id and self.current_symbol_id in self.symbols:
-                self.symbol_combo.setCurrentText(self.current_symbol_id)
-                logger.info(f"🎯 Selected symbol: {self.current_symbol_id}")
-            elif sorted_symbols:
-                # Select first symbol if current is None or not in list
-                self.current_symbol_id = sorted_symbols[0]
-                self.symbol_combo.setCurrentText(self.current_symbol_id)
-                logger.info(f"🎯 Auto-selected first symbol: {self.current_symbol_id}")
-        else:
-            self.current_symbol_id = None
-            logger.info("📋 Symbol dropdown cleared (no symbols)")
+        if not self._symbols_section_built:
+            # No widgets yet - just keep the selection valid and the markers current
+            if self.current_symbol_id not in self.symbols:
+                self.current_symbol_id = min(self.symbols) if self.symbols else None
+            if self.current_symbol_id:
+                self._redraw_all_points()
+            return
+
+        with _signals_off(self.symbol_combo):
+            sorted_symbols = sorted(self.symbols)
+            _set_combo_items(self.symbol_combo, sorted_symbols)
 
-        self.symbol_combo.blockSignals(False)
+            if self.symbols:
+                logger.info("📋 Symbol dropdown updated with: %s", sorted_symbols)
+
+                if self.current_symbol_id and self.current_symbol_id in self.symbols:
+                    self.symbol_combo.setCurrentText(self.current_symbol_id)
+                    logger.info("🎯 Selected symbol: %s", self.current_symbol_id)
+                elif sorted_symbols:
+                    # Select first symbol if current is None or not in list
+                    self.current_symbol_id = sorted_symbols[0]
+                    self.symbol_combo.setCurrentText(self.current_symbol_id)
+                    logger.info("🎯 Auto-selected first symbol: %s", self.current_symbol_id)
+            else:
+                self.current_symbol_id = None
+                logger.info("📋 Symbol dropdown cleared (no symbols)")
 
         # Trigger UI update for the selected symbol
         if self.current_symbol_id:
@@ -2426,13 +3339,12 @@ class GaugeCalibratorV2(QMainWindow):
         if reply == QMessageBox.Yes:
             del self.symbols[self.current_symbol_id]
 
-            if self.symbols:
-                self.current_symbol_id = list(self.symbols.keys())[0]
-            else:
-                self.current_symbol_id = None
+            self.current_symbol_id = next(iter(self.symbols), None)
 
+            # Selecting the next symbol redraws the overlay; with none left, redraw here
             self._update_symbol_combo()
-            self._redraw_all_points()
+            if self.current_symbol_id is None:
+                self._redraw_all_points()
 
             logger.info(f"🗑️ Deleted symbol")
 
@@ -2444,7 +3356,7 @@ class GaugeCalibratorV2(QMainWindow):
 
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Select Symbol Image",
-            str(Path(__file__).parent.parent / "symbols"),
+            str(_MODULE_ROOT / "symbols"),
             "Images (*.png *.svg *.jpg)"
         )
 
@@ -2462,8 +3374,8 @@ class GaugeCalibratorV2(QMainWindow):
         # Load gauge image if not already loaded
         if not hasattr(self.image_widget, 'image') or self.image_widget.image is None:
             gauge_name = self.gauge_combo.currentText().lower()
-            gauge_path = Path(__file__).parent.parent / "gauges" / f"{gauge_name}_bg.png"
-            if gauge_path.exists():
+            gauge_path = _gauge_bg_path(gauge_name)
+            if _gauges_file_exists(gauge_path):
                 self.image_widget.load_image(str(gauge_path))
             else:
                 QMessageBox.warning(self, "Error", "Please load gauge image first (Step 4)")
@@ -2473,11 +3385,7 @@ class GaugeCalibratorV2(QMainWindow):
         self.image_widget.set_click_callback(self.on_symbol_position_click)
         self.positioning_symbol = True
 
-        QMessageBox.information(
-            self,
-            "Position Symbol",
-            f"Click on the gauge where you want to place {self.current_symbol_id}"
-        )
+        self._toast(f"Click on the gauge where you want to place {self.current_symbol_id}")
 
     def on_symbol_position_click(self, x: float, y: float):
         """Handle click when positioning a symbol"""
@@ -2485,8 +3393,7 @@ class GaugeCalibratorV2(QMainWindow):
             return
 
         # Update symbol position
-        self.symbols[self.current_symbol_id].position_x = x
-        self.symbols[self.current_symbol_id].position_y = y
+        self.symbols[self.current_symbol_id].set_position(x, y)
 
         # Update position label
         self.symbol_position_label.setText(f"✓ Position: ({int(x)}, {int(y)})")
@@ -2502,11 +3409,7 @@ class GaugeCalibratorV2(QMainWindow):
         self.image_widget.set_click_callback(self.on_gauge_click)
 
         logger.info(f"✅ Positioned {self.current_symbol_id} at ({int(x)}, {int(y)})")
-        QMessageBox.information(
-            self,
-            "Position Set",
-            f"{self.current_symbol_id} positioned at ({int(x)}, {int(y)})"
-        )
+        self._toast(f"{self.current_symbol_id} positioned at ({int(x)}, {int(y)})")
 
     def on_symbol_changed(self, symbol_id: str):
         """Handle symbol selection change"""
@@ -2516,40 +3419,32 @@ class GaugeCalibratorV2(QMainWindow):
         self.current_symbol_id = symbol_id
         symbol = self.symbols[symbol_id]
 
-        # Update display name field
-        self.symbol_display_name_edit.blockSignals(True)
-        self.symbol_display_name_edit.setText(symbol.display_name if symbol.display_name else "")
-        self.symbol_display_name_edit.blockSignals(False)
-
         # Update position label
         if symbol.position_x > 0 and symbol.position_y > 0:
             self.symbol_position_label.setText(f"✓ Position: ({int(symbol.position_x)}, {int(symbol.position_y)})")
         else:
             self.symbol_position_label.setText("Position: Not set")
 
-        # Update UI with symbol data
-        self.symbol_scale_spin.blockSignals(True)
-        self.symbol_scale_spin.setValue(symbol.scale)
-        self.symbol_scale_spin.blockSignals(False)
-
-        # Update visibility condition UI
+        # Show the symbol's values; blocked so the edit handlers don't write
+        # them straight back into the symbol and flag unsaved changes
         vis = symbol.visibility_condition
-        if vis.condition_type == "always":
-            self.visibility_type_combo.setCurrentIndex(0)
-        elif vis.condition_type == "bool":
-            self.visibility_type_combo.setCurrentIndex(1)
-        else:
-            self.visibility_type_combo.setCurrentIndex(2)
+        type_index = self.VISIBILITY_MODE_INDEX.get(vis.condition_type, 2)
+        with _signals_off(
+            self.symbol_display_name_edit, self.symbol_scale_spin,
+            self.visibility_type_combo, self.visibility_key_input, self.visibility_bool_combo,
+            self.visibility_operator_combo, self.visibility_value_spin,
+        ):
+            self.symbol_display_name_edit.setText(symbol.display_name if symbol.display_name else "")
+            self.symbol_scale_spin.setValue(symbol.scale)
 
-        self.visibility_key_input.setText(vis.data_key)
-        self.visibility_bool_combo.setCurrentIndex(0 if vis.show_when else 1)
+            self.visibility_type_combo.setCurrentIndex(type_index)
+            self.visibility_key_input.setText(vis.data_key)
+            self.visibility_bool_combo.setCurrentIndex(0 if vis.show_when else 1)
 
-        # Map operator symbols
-        operator_map = {"less_than": "<", "greater_than": ">", "equals": "="}
-        operator_symbol = operator_map.get(vis.operator, "<")
-        self.visibility_operator_combo.setCurrentText(operator_symbol)
+            self.visibility_operator_combo.setCurrentText(self.OPERATOR_SYMBOLS.get(vis.operator, "<"))
 
-        self.visibility_value_spin.setValue(vis.value)
+            self.visibility_value_spin.setValue(vis.value)
+        self._show_visibility_controls(type_index)
 
         self._redraw_all_points()
 
@@ -2558,10 +3453,16 @@ class GaugeCalibratorV2(QMainWindow):
         if not self.current_symbol_id or self.current_symbol_id not in self.symbols:
             return
 
-        # Update the symbol's display name
+        # Update the symbol's display name (logged once editing finishes, not per keystroke)
         self.symbols[self.current_symbol_id].display_name = text
         self.has_unsaved_changes = True
-        logger.info(f"✏️ Updated display name for {self.current_symbol_id}: '{text}'")
+
+    def _log_symbol_display_name(self):
+        """Log the display name once the user is done typing it"""
+        symbol = self.symbols.get(self.current_symbol_id)
+        if symbol is not None and self.symbol_display_name_edit.isModified():
+            self.symbol_display_name_edit.setModified(False)
+            logger.info("✏️ Updated display name for %s: '%s'", self.current_symbol_id, symbol.display_name)
 
     def on_symbol_scale_changed(self, value):
         """Handle symbol scale change"""
@@ -2577,28 +3478,18 @@ class GaugeCalibratorV2(QMainWindow):
             return
 
         # Update visibility condition type
-        if index == 0:
-            condition_type = "always"
-            self.visibility_key_input.setEnabled(False)
-            self.visibility_bool_combo.setEnabled(False)
-            self.visibility_operator_combo.setEnabled(False)
-            self.visibility_value_spin.setEnabled(False)
-        elif index == 1:
-            condition_type = "bool"
-            self.visibility_key_input.setEnabled(True)
-            self.visibility_bool_combo.setEnabled(True)
-            self.visibility_operator_combo.setEnabled(False)
-            self.visibility_value_spin.setEnabled(False)
-        else:
-            condition_type = "threshold"
-            self.visibility_key_input.setEnabled(True)
-            self.visibility_bool_combo.setEnabled(False)
-            self.visibility_operator_combo.setEnabled(True)
-            self.visibility_value_spin.setEnabled(True)
+        self._show_visibility_controls(index)
 
+        condition_type = self.VISIBILITY_MODES[min(index, 2)][0]
         self.symbols[self.current_symbol_id].visibility_condition.condition_type = condition_type
         self.has_unsaved_changes = True
 
+    def _show_visibility_controls(self, index: int):
+        """Show only the controls used by the visibility mode at this combo index"""
+        shown = self.VISIBILITY_MODES[min(index, 2)][1]
+        for group, visible in zip((self._key_group, self._bool_group, self._threshold_group), shown):
+            group.setVisible(visible)
+
     def on_visibility_key_changed(self, text):
         """Handle visibility data key change"""
         if not self.current_symbol_id:
@@ -2621,9 +3512,7 @@ class GaugeCalibratorV2(QMainWindow):
         if not self.current_symbol_id:
             return
 
-        # Map symbols to operator names
-        operator_map = {"<": "less_than", ">": "greater_than", "=": "equals"}
-        operator = operator_map.get(symbol, "less_than")
+        operator = self.SYMBOL_OPERATORS.get(symbol, "less_than")
 
         self.symbols[self.current_symbol_id].visibility_condition.operator = operator
         self.has_unsaved_changes = True
@@ -2643,26 +3532,12 @@ class GaugeCalibratorV2(QMainWindow):
             return
 
         gauge_name = self.current_calibration.gauge_name.lower()
-        config_file = self.config_dir / f"{gauge_name}.json"
+        config_file = self._config_file(gauge_name)
 
         try:
-            # Load existing config
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-            else:
-                config = {}
-
-            # Update symbols in config
-            symbols_config = {}
-            for symbol_id, symbol in self.symbols.items():
-                symbols_config[symbol_id] = symbol.to_dict()
-
-            config["symbols"] = symbols_config
-
-            # Save back to file
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Only the "symbols" key of the in-memory config changes; one write
+            with self._editing_config(config_file) as config:
+                config["symbols"] = {symbol_id: symbol.to_dict() for symbol_id, symbol in self.symbols.items()}
 
             logger.info(f"💾 Saved {len(self.symbols)} symbol(s) to {gauge_name}.json")
             QMessageBox.information(self, "Saved", f"Saved {len(self.symbols)} symbol(s) for {gauge_name}!")
@@ -8,9 +8,14 @@ Each gauge can be independently configured and saved to JSON.
 import json
 import logging
 from pathlib import Path
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from typing import Dict, Optional, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,11 +26,11 @@ class CalibrationPoint:
     angle: float  # Rotation angle in degrees
     
     def to_dict(self):
-        return asdict(self)
+        return {"value": self.value, "angle": self.angle}
     
     @classmethod
     def from_dict(cls, data: dict):
-        return cls(**data)
+        return cls(value=data["value"], angle=data["angle"])
 
 
 @dataclass
@@ -38,16 +43,23 @@ class NeedleCalibration:
     calibration_points: List[CalibrationPoint] = field(default_factory=list)
     
     def to_dict(self):
-        data = asdict(self)
-        data['calibration_points'] = [p.to_dict() for p in self.calibration_points]
-        return data
+        return {
+            "needle_id": self.needle_id,
+            "needle_image_path": self.needle_image_path,
+            "rotation_center_x": self.rotation_center_x,
+            "rotation_center_y": self.rotation_center_y,
+            "calibration_points": [p.to_dict() for p in self.calibration_points],
+        }
     
     @classmethod
     def from_dict(cls, data: dict):
-        points = data.pop('calibration_points', [])
-        calib = cls(**data)
-        calib.calibration_points = [CalibrationPoint.from_dict(p) for p in points]
-        return calib
+        return cls(
+            needle_id=data.get("needle_id", "main"),
+            needle_image_path=data.get("needle_image_path"),
+            rotation_center_x=data.get("rotation_center_x", 0),
+            rotation_center_y=data.get("rotation_center_y", 0),
+            calibration_points=[CalibrationPoint.from_dict(p) for p in data.get("calibration_points", [])],
+        )
 
 
 @dataclass
@@ -62,7 +74,7 @@ class PositionCalibrationPoint:
     
     @classmethod
     def from_dict(cls, data: dict):
-        return cls(**data)
+        return cls(x=data["x"], y=data["y"], value=data["value"])
 
 
 @dataclass
@@ -107,11 +119,20 @@ class PositionBasedNeedleCalibration:
     
     @classmethod
     def from_dict(cls, data: dict):
-        data = data.copy()
-        points_data = data.pop("calibration_points", [])
-        calib = cls(**data)
-        calib.calibration_points = [PositionCalibrationPoint.from_dict(p) for p in points_data]
-        return calib
+        return cls(
+            needle_id=data.get("needle_id", "main"),
+            needle_image_path=data.get("needle_image_path"),
+            gauge_name=data.get("gauge_name"),
+            needle_pivot_x=data.get("needle_pivot_x", 0),
+            needle_pivot_y=data.get("needle_pivot_y", 0),
+            needle_end_x=data.get("needle_end_x", 0),
+            needle_end_y=data.get("needle_end_y", 0),
+            gauge_pivot_x=data.get("gauge_pivot_x", 0),
+            gauge_pivot_y=data.get("gauge_pivot_y", 0),
+            calibration_points=[PositionCalibrationPoint.from_dict(p) for p in data.get("calibration_points", [])],
+            min_value=data.get("min_value", 0),
+            max_value=data.get("max_value", 100),
+        )
 
 
 @dataclass
@@ -128,7 +149,35 @@ class NeedleConfig:
     enabled: bool = True
     
     def to_dict(self):
-        return asdict(self)
+        return {
+            "name": self.name,
+            "color_r": self.color_r,
+            "color_g": self.color_g,
+            "color_b": self.color_b,
+            "thickness": self.thickness,
+            "length_offset": self.length_offset,
+            "center_cap_size": self.center_cap_size,
+            "style": self.style,
+            "enabled": self.enabled,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            name=data.get("name", "Needle"),
+            color_r=data.get("color_r", 255),
+            color_g=data.get("color_g", 0),
+            color_b=data.get("color_b", 0),
+            thickness=data.get("thickness", 3.0),
+            length_offset=data.get("length_offset", 40),
+            center_cap_size=data.get("center_cap_size", 15),
+            style=data.get("style", "3d_pointer"),
+            enabled=data.get("enabled", True),
+        )
+
+
+def _default_needles() -> Dict[str, NeedleConfig]:
+    return {"main": NeedleConfig(name="Main", color_r=255, color_g=0, color_b=0)}
 
 
 @dataclass
@@ -151,9 +200,7 @@ class GaugeConfig:
     background_color_b: int = 215
     
     # Needles (can have multiple)
-    needles: Dict[str, NeedleConfig] = field(default_factory=lambda: {
-        "main": NeedleConfig(name="Main", color_r=255, color_g=0, color_b=0)
-    })
+    needles: Dict[str, NeedleConfig] = field(default_factory=_default_needles)
     
     # Background image
     background_image: Optional[str] = None
@@ -182,45 +229,83 @@ class GaugeConfig:
     needle_image_path: Optional[str] = None
     
     def to_dict(self):
-        """Convert to dictionary for JSON serialization"""
-        data = asdict(self)
-        # Convert NeedleConfig objects to dicts
-        data['needles'] = {k: v.to_dict() if hasattr(v, 'to_dict') else v 
-                          for k, v in self.needles.items()}
-        # Convert calibration_points to dicts
-        data['calibration_points'] = [p.to_dict() for p in self.calibration_points]
-        # Convert needle_calibrations to dicts
-        data['needle_calibrations'] = {
-            k: v.to_dict() if hasattr(v, 'to_dict') else v 
-            for k, v in self.needle_calibrations.items()
+        """Convert to dictionary for JSON serialization (keys in field order)"""
+        return {
+            "name": self.name,
+            "gauge_type": self.gauge_type,
+            "start_angle": self.start_angle,
+            "sweep_angle": self.sweep_angle,
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+            "background_color_r": self.background_color_r,
+            "background_color_g": self.background_color_g,
+            "background_color_b": self.background_color_b,
+            # NeedleConfig objects (plain dicts pass through)
+            "needles": {k: v.to_dict() if hasattr(v, 'to_dict') else v
+                        for k, v in self.needles.items()},
+            "background_image": self.background_image,
+            "image_offset_x": self.image_offset_x,
+            "image_offset_y": self.image_offset_y,
+            "show_numbers": self.show_numbers,
+            "number_interval": self.number_interval,
+            "text_size": self.text_size,
+            "night_mode_bg_r": self.night_mode_bg_r,
+            "night_mode_bg_g": self.night_mode_bg_g,
+            "night_mode_bg_b": self.night_mode_bg_b,
+            "night_mode_text_r": self.night_mode_text_r,
+            "night_mode_text_g": self.night_mode_text_g,
+            "night_mode_text_b": self.night_mode_text_b,
+            "needle_calibrations": {k: v.to_dict() if hasattr(v, 'to_dict') else v
+                                    for k, v in self.needle_calibrations.items()},
+            "rotation_center_x": self.rotation_center_x,
+            "rotation_center_y": self.rotation_center_y,
+            "calibration_points": [p.to_dict() for p in self.calibration_points],
+            "needle_image_path": self.needle_image_path,
         }
-        return data
     
     @classmethod
     def from_dict(cls, data: dict):
-        """Create from dictionary (JSON deserialization)"""
-        # Reconstruct NeedleConfig objects
-        needles = {}
-        if 'needles' in data:
-            for key, needle_data in data.get('needles', {}).items():
-                needles[key] = NeedleConfig(**needle_data)
-            data['needles'] = needles
+        """Create from dictionary (JSON deserialization)
         
-        # Reconstruct CalibrationPoint objects (legacy single-needle)
-        if 'calibration_points' in data:
-            calib_points = []
-            for point_data in data.get('calibration_points', []):
-                calib_points.append(CalibrationPoint.from_dict(point_data))
-            data['calibration_points'] = calib_points
-        
-        # Reconstruct NeedleCalibration objects (multi-needle)
-        if 'needle_calibrations' in data:
-            needle_calihs = {}
-            for key, calib_data in data.get('needle_calibrations', {}).items():
-                needle_calihs[key] = NeedleCalibration.from_dict(calib_data)
-            data['needle_calibrations'] = needle_calihs
-        
-        return cls(**data)
+        Missing keys take the field defaults; unknown keys are ignored.
+        """
+        needles = data.get("needles")
+        return cls(
+            name=data.get("name", "Gauge"),
+            gauge_type=data.get("gauge_type", "tachometer"),
+            start_angle=data.get("start_angle", 270),
+            sweep_angle=data.get("sweep_angle", 270),
+            min_value=data.get("min_value", 0),
+            max_value=data.get("max_value", 8000),
+            background_color_r=data.get("background_color_r", 245),
+            background_color_g=data.get("background_color_g", 235),
+            background_color_b=data.get("background_color_b", 215),
+            needles=_default_needles() if needles is None else {
+                key: NeedleConfig.from_dict(needle_data) for key, needle_data in needles.items()
+            },
+            background_image=data.get("background_image"),
+            image_offset_x=data.get("image_offset_x", 0),
+            image_offset_y=data.get("image_offset_y", 0),
+            show_numbers=data.get("show_numbers", True),
+            number_interval=data.get("number_interval", 1000),
+            text_size=data.get("text_size", 10),
+            night_mode_bg_r=data.get("night_mode_bg_r", 30),
+            night_mode_bg_g=data.get("night_mode_bg_g", 30),
+            night_mode_bg_b=data.get("night_mode_bg_b", 30),
+            night_mode_text_r=data.get("night_mode_text_r", 255),
+            night_mode_text_g=data.get("night_mode_text_g", 255),
+            night_mode_text_b=data.get("night_mode_text_b", 255),
+            # Multi-needle calibrations
+            needle_calibrations={
+                key: NeedleCalibration.from_dict(calib_data)
+                for key, calib_data in data.get("needle_calibrations", {}).items()
+            },
+            # Legacy single-needle calibration
+            rotation_center_x=data.get("rotation_center_x", 0),
+            rotation_center_y=data.get("rotation_center_y", 0),
+            calibration_points=[CalibrationPoint.from_dict(p) for p in data.get("calibration_points", [])],
+            needle_image_path=data.get("needle_image_path"),
+        )
 
 
 class ConfigManager:
@@ -234,8 +319,11 @@ class ConfigManager:
         """Save gauge configuration to JSON file"""
         try:
             filename = self.config_dir / f"{gauge_config.name.lower()}.json"
-            with open(filename, 'w') as f:
-                json.dump(gauge_config.to_dict(), f, indent=2)
+            data = gauge_config.to_dict()
+            if orjson is not None:
+                filename.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                filename.write_text(json.dumps(data, indent=2))
             logger.info(f"Saved gauge config: {filename}")
             return True
         except Exception as e:
@@ -250,8 +338,8 @@ class ConfigManager:
                 logger.warning(f"Gauge config not found: {filename}")
                 return None
             
-            with open(filename, 'r') as f:
-                data = json.load(f)
+            raw = filename.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             config = GaugeConfig.from_dict(data)
             logger.info(f"Loaded gauge config: {filename}")
@@ -8,13 +8,21 @@ of temperature/boost on fuel gauge.
 
 import math
 import logging
+import numpy as np
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtGui import QPainter, QColor, QPen, QFont, QBrush, QPainterPath, QGraphicsDropShadowEffect
-from PyQt5.QtCore import Qt, QPointF, QRectF, QSize
+from PyQt5.QtGui import QPainter, QColor, QPen, QFont, QBrush, QPainterPath, QPixmap
+from PyQt5.QtCore import Qt, QPointF, QRectF, QSize, QLineF, QTimer
 
 logger = logging.getLogger(__name__)
 
 
+def _tick_table(values, max_value: float, start_rad: float, sweep_rad: float):
+    """(cos, sin, value) per tick value on a clockwise dial; fixed for a given max_value"""
+    values = np.asarray(values)
+    rad = start_rad - sweep_rad * (values / max_value)  # Subtract for clockwise
+    return list(zip(np.cos(rad).tolist(), np.sin(rad).tolist(), values.tolist()))
+
+
 class BaseGauge(QWidget):
     """Base class for circular analog gauges"""
     
@@ -23,349 +31,464 @@ class BaseGauge(QWidget):
         self.value = 0
         self.target_value = 0  # Target value to smoothly interpolate toward
         self.smoothing_factor = 0.2  # 0-1, higher = faster smoothing (0.2 = smooth but responsive)
-        self.night_mode = False
+        self._night_mode = False
+        self._static_pixmap = None  # Face/ticks/labels layer, see _paint_static
+        self._static_key = None
+        self._dirty = False  # Something other than the needle changed since the last frame
+        self._frame_timer = QTimer(self)  # Runs only while there is something to draw
+        self._frame_timer.setInterval(self.FRAME_INTERVAL_MS)
+        self._frame_timer.timeout.connect(self._on_frame)
         self.setMinimumSize(400, 400)
     
     def sizeHint(self):
         """Return preferred size for layout (1080x1080 matches actual displays)"""
         return QSize(1080, 1080)
     
-    def _smooth_value(self):
-        """Smoothly interpolate current value toward target value"""
+    FRAME_INTERVAL_MS = 16  # ~60 Hz, however fast samples arrive
+    
+    def _request_frame(self):
+        """Make sure the frame timer is running while shown; smoothing and repaints happen on its ticks"""
+        if self.isVisible() and not self._frame_timer.isActive():
+            self._frame_timer.start()
+    
+    def _mark_dirty(self):
+        """Repaint on the next frame tick"""
+        self._dirty = True
+        self._request_frame()
+    
+    def _on_frame(self):
+        """Frame tick: step the needle and repaint while anything changed, else go idle"""
+        if not self.isVisible():
+            self._frame_timer.stop()  # showEvent restarts it
+            return
+        if self.value != self.target_value:
+            self._smooth_value()
+            self._dirty = True
+        if self._dirty:
+            self._dirty = False
+            self.update()
+        else:
+            self._frame_timer.stop()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._request_frame()  # Pick up targets set while hidden
+    
+    @property
+    def night_mode(self) -> bool:
+        return self._night_mode
+    
+    @night_mode.setter
+    def night_mode(self, enabled: bool):
+        # Frames stop once the needle has settled, so a toggle has to request one
+        if enabled != self._night_mode:
+            self._night_mode = enabled
+            self._mark_dirty()
+    
+    # Needle counts as settled within this fraction of full scale (well under a pixel at 1080px)
+    SETTLE_FRACTION = 1e-4
+    
+    def _set_target(self, target: float):
+        """Set the value to smooth toward; frames run only while the needle still has to move"""
+        self.target_value = target
+        if target != self.value:
+            self._request_frame()
+    
+    FULL_SCALE = 100  # Value range of the dial; gauges with an adjustable range override _full_scale
+    
+    def _full_scale(self) -> float:
+        """Value range of the dial, for SETTLE_FRACTION"""
+        return self.FULL_SCALE
+    
+    def _smooth_value(self) -> bool:
+        """Smoothly interpolate current value toward target value (one frame); False once settled on it"""
         delta = self.target_value - self.value
+        if abs(delta) <= self._full_scale() * self.SETTLE_FRACTION:
+            self.value = self.target_value  # Snap instead of creeping up on it forever
+            return False
         self.value += delta * self.smoothing_factor
+        return True
+    
+    # Color schemes as (r, g, b[, a]); QColor/QPen/QBrush objects are built from
+    # these once per night_mode and shared by every gauge instead of per paint.
+    DAY_COLORS = {
+        'background': (245, 235, 215),  # Cream/beige
+        'face': (245, 235, 215),
+        'text': (0, 0, 0),
+        'needle': (0, 0, 0),
+        'tick_major': (0, 0, 0),
+        'tick_minor': (80, 80, 80),
+        'center': (100, 100, 100),
+        'redline': (255, 0, 0),
+    }
+    NIGHT_COLORS = {
+        'background': (20, 20, 20),
+        'face': (30, 30, 30),
+        'text': (255, 255, 255),
+        'needle': (255, 255, 255),
+        'tick_major': (200, 200, 200),
+        'tick_minor': (100, 100, 100),
+        'center': (150, 150, 150),
+        'redline': (255, 0, 0),
+    }
+    GLOW_WIDTHS = (8, 6, 4)
+    
+    _colors_cache = {}  # night_mode -> colors dict
+    _pen_cache = {}  # (night_mode, color key, width) -> QPen
+    _brush_cache = {}  # (night_mode, color key) -> QBrush
+    _glow_pen_cache = {}  # night_mode -> [QPen] for the needle glow layers
     
     def _get_colors(self):
         """Get color scheme based on night mode"""
-        if self.night_mode:
-            return {
-                'background': QColor(20, 20, 20),
-                'face': QColor(30, 30, 30),
-                'text': QColor(255, 255, 255),
-                'needle': QColor(255, 255, 255),
-                'tick_major': QColor(200, 200, 200),
-                'tick_minor': QColor(100, 100, 100),
-                'center': QColor(150, 150, 150)
-            }
-        else:
-            return {
-                'background': QColor(245, 235, 215),  # Cream/beige
-                'face': QColor(245, 235, 215),
-                'text': QColor(0, 0, 0),
-                'needle': QColor(0, 0, 0),
-                'tick_major': QColor(0, 0, 0),
-                'tick_minor': QColor(80, 80, 80),
-                'center': QColor(100, 100, 100)
-            }
+        night = bool(self.night_mode)
+        colors = BaseGauge._colors_cache.get(night)
+        if colors is None:
+            scheme = self.NIGHT_COLORS if night else self.DAY_COLORS
+            colors = BaseGauge._colors_cache[night] = {key: QColor(*rgb) for key, rgb in scheme.items()}
+        return colors
+    
+    def _pen(self, color_key: str, width: float) -> QPen:
+        """Cached QPen in the current scheme's color"""
+        key = (bool(self.night_mode), color_key, width)
+        pen = BaseGauge._pen_cache.get(key)
+        if pen is None:
+            pen = BaseGauge._pen_cache[key] = QPen(self._get_colors()[color_key], width)
+        return pen
+    
+    def _brush(self, color_key: str) -> QBrush:
+        """Cached QBrush in the current scheme's color"""
+        key = (bool(self.night_mode), color_key)
+        brush = BaseGauge._brush_cache.get(key)
+        if brush is None:
+            brush = BaseGauge._brush_cache[key] = QBrush(self._get_colors()[color_key])
+        return brush
+    
+    def _glow_pens(self):
+        """Cached needle glow pens, widest (faintest) first"""
+        night = bool(self.night_mode)
+        pens = BaseGauge._glow_pen_cache.get(night)
+        if pens is None:
+            needle = self._get_colors()['needle']
+            pens = BaseGauge._glow_pen_cache[night] = [
+                QPen(QColor(needle.red(), needle.green(), needle.blue(), 80 - (8 - glow_width) * 15), glow_width)  # Fade out the glow layers
+                for glow_width in self.GLOW_WIDTHS
+            ]
+        return pens
     
     def _draw_gauge_face(self, painter: QPainter, center: QPointF, radius: float):
         """Draw base gauge face with ticks"""
-        colors = self._get_colors()
-        
         # Draw gauge background
-        painter.setBrush(QBrush(colors['face']))
+        painter.setBrush(self._brush('face'))
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(center, radius, radius)
+    
+    def _static_state(self):
+        """Values the static layer depends on besides size and night mode"""
+        return ()
+    
+    def _draw_static(self, painter: QPainter, center: QPointF, radius: float, colors: dict):
+        """Draw everything that doesn't move with the value (face, ticks, labels)"""
+        self._draw_gauge_face(painter, center, radius)
+    
+    def _paint_static(self, painter: QPainter, center: QPointF, radius: float, colors: dict):
+        """Blit the cached static layer, re-rendering it when size, night mode or range changed"""
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr, bool(self.night_mode), self._static_state())
+        if self._static_key != key:
+            pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            pixmap_painter = QPainter(pixmap)
+            pixmap_painter.setRenderHint(QPainter.Antialiasing)
+            self._draw_static(pixmap_painter, center, radius, colors)
+            pixmap_painter.end()
+            self._static_pixmap = pixmap
+            self._static_key = key
+        painter.drawPixmap(0, 0, self._static_pixmap)
+    
+    # Needle sweep, clockwise from START_ANGLE over the full scale; subclasses set their own dial
+    START_ANGLE = 225
+    SWEEP_ANGLE = 270
+    START_RAD = math.radians(START_ANGLE)
+    SWEEP_RAD = math.radians(SWEEP_ANGLE)
+    
+    def _angle_map(self):
+        """(intercept, slope) so the needle angle in radians is intercept + slope * value"""
+        return self.START_RAD, -self.SWEEP_RAD / self._full_scale()  # Subtract for clockwise
+    
+    def _draw_needle(self, painter: QPainter, center: QPointF, needle_length: float, width: float):
+        """Draw the needle for self.value with optional glow in night mode"""
+        intercept, slope = self._angle_map()
+        rad = intercept + slope * self.value
+        needle_end = QPointF(
+            center.x() + needle_length * math.cos(rad),
+            center.y() + needle_length * math.sin(rad)
+        )
+        
+        # Draw glow effect in night mode
+        if self.night_mode:
+            for glow_pen in self._glow_pens():
+                painter.setPen(glow_pen)
+                painter.drawLine(center, needle_end)
+        
+        painter.setPen(self._pen('needle', width))
+        painter.drawLine(center, needle_end)
 
 
 class TachometerWidget(BaseGauge):
     """Tachometer gauge (0-8000 RPM)"""
     
+    # Clockwise sweep: 0 RPM at 6 o'clock (270°), max RPM 10% past 3 o'clock
+    START_ANGLE = 270  # 6 o'clock position
+    SWEEP_ANGLE = 279  # 279° clockwise sweep (ends 10% past 3 o'clock)
+    START_RAD = math.radians(START_ANGLE)
+    SWEEP_RAD = math.radians(SWEEP_ANGLE)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.max_rpm = 8000
         self.redline = 7000
+        self._ticks = None  # _tick_table for _ticks_max, rebuilt when max_rpm changes
+        self._ticks_max = None
+        self._tick_font = QFont('Arial', 10)
     
     def set_rpm(self, rpm: float):
         """Update RPM value"""
-        self.target_value = max(0, min(rpm, self.max_rpm))
-        self.update()
+        self._set_target(max(0, min(rpm, self.max_rpm)))
     
     def paintEvent(self, event):
         """Render tachometer"""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Smooth the value toward target
-        self._smooth_value()
-        
         colors = self._get_colors()
         center = QPointF(self.width() / 2, self.height() / 2)
         radius = min(self.width(), self.height()) / 2 - 20
         
-        # Draw gauge face
-        self._draw_gauge_face(painter, center, radius)
-        
-        # Draw tick marks and numbers
-        self._draw_ticks(painter, center, radius, colors)
-        
-        # Draw redline zone
-        self._draw_redline(painter, center, radius, colors)
+        # Draw gauge face, tick marks, numbers and redline zone (cached)
+        self._paint_static(painter, center, radius, colors)
         
         # Draw needle
-        self._draw_needle(painter, center, radius, colors)
+        # NEEDLE SIZE: needle_length = radius - 40 (distance from center to tip), width 2
+        self._draw_needle(painter, center, radius - 40, 2)
         
         # Draw center cap
-        painter.setBrush(QBrush(colors['center']))
+        painter.setBrush(self._brush('center'))
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(center, 10, 10)
     
+    def _full_scale(self):
+        return self.max_rpm
+    
+    def _static_state(self):
+        return (self.max_rpm, self.redline)
+    
+    def _draw_static(self, painter: QPainter, center: QPointF, radius: float, colors: dict):
+        self._draw_gauge_face(painter, center, radius)
+        self._draw_ticks(painter, center, radius, colors)
+        self._draw_redline(painter, center, radius, colors)
+    
     def _draw_ticks(self, painter: QPainter, center: QPointF, radius: float, colors: dict):
         """Draw tick marks and RPM numbers"""
-        # Clockwise sweep: 0 RPM at 6 o'clock (270°), max RPM 10% past 3 o'clock
-        start_angle = 270  # 6 o'clock position
-        sweep_angle = 279  # 279° clockwise sweep (ends 10% past 3 o'clock)
-        
-        for rpm in range(0, self.max_rpm + 1, 1000):
-            angle_fraction = rpm / self.max_rpm
-            angle = start_angle - sweep_angle * angle_fraction  # Subtract for clockwise
-            rad = math.radians(angle)
-            
-            tick_start = QPointF(
-                center.x() + (radius - 20) * math.cos(rad),
-                center.y() + (radius - 20) * math.sin(rad)
-            )
-            tick_end = QPointF(
-                center.x() + radius * math.cos(rad),
-                center.y() + radius * math.sin(rad)
-            )
-            
-            pen = QPen(colors['tick_major'], 2)
-            painter.setPen(pen)
-            painter.drawLine(tick_start, tick_end)
-            
-            # Draw number
-            painter.setFont(QFont('Arial', 10))
-            number_distance = radius - 50
-            number_x = center.x() + number_distance * math.cos(rad)
-            number_y = center.y() + number_distance * math.sin(rad)
-            painter.drawText(int(number_x - 10), int(number_y + 5), 20, 15, Qt.AlignCenter, str(rpm // 1000))
+        if self._ticks_max != self.max_rpm:
+            self._ticks = [
+                (cos_a, sin_a, str(rpm // 1000))
+                for cos_a, sin_a, rpm in _tick_table(range(0, self.max_rpm + 1, 1000), self.max_rpm, self.START_RAD, self.SWEEP_RAD)
+            ]
+            self._ticks_max = self.max_rpm
+        
+        cx, cy = center.x(), center.y()
+        number_distance = radius - 50
+        painter.setFont(self._tick_font)
+        painter.setPen(self._pen('tick_major', 2))
+        painter.drawLines([
+            QLineF(cx + (radius - 20) * cos_a, cy + (radius - 20) * sin_a, cx + radius * cos_a, cy + radius * sin_a)
+            for cos_a, sin_a, _ in self._ticks
+        ])
+        
+        # Draw numbers
+        for cos_a, sin_a, label in self._ticks:
+            number_x = cx + number_distance * cos_a
+            number_y = cy + number_distance * sin_a
+            painter.drawText(int(number_x - 10), int(number_y + 5), 20, 15, Qt.AlignCenter, label)
     
     def _draw_redline(self, painter: QPainter, center: QPointF, radius: float, colors: dict):
         """Draw redline zone"""
-        start_angle = 270  # 6 o'clock
-        sweep_angle = 279  # 279° clockwise sweep (ends 10% past 3 o'clock)
-        
         redline_start_fraction = self.redline / self.max_rpm
-        redline_start_angle = start_angle - sweep_angle * redline_start_fraction
-        end_angle = start_angle - sweep_angle  # Full sweep end
+        redline_start_angle = self.START_ANGLE - self.SWEEP_ANGLE * redline_start_fraction
+        end_angle = self.START_ANGLE - self.SWEEP_ANGLE  # Full sweep end
         
         # Draw red arc from redline to max (clockwise)
-        redline_pen = QPen(QColor(255, 0, 0), 8)
-        painter.setPen(redline_pen)
+        painter.setPen(self._pen('redline', 8))
         
         rect = QRectF(center.x() - radius, center.y() - radius, radius * 2, radius * 2)
         # Arc angles: startAngle and spanAngle (negative span = clockwise)
         span_angle = end_angle - redline_start_angle
         painter.drawArc(rect, int(redline_start_angle * 16), int(span_angle * 16))
-    
-    def _draw_needle(self, painter: QPainter, center: QPointF, radius: float, colors: dict):
-        """Draw RPM needle with optional glow in night mode"""
-        # Clockwise sweep from 6 o'clock (270°) to 10% past 3 o'clock (351°)
-        start_angle = 270
-        sweep_angle = 279
-        
-        angle_fraction = self.value / self.max_rpm
-        angle = start_angle - sweep_angle * angle_fraction
-        rad = math.radians(angle)
-        
-        # NEEDLE SIZE: Change needle_length for length, pen width (below) for thickness
-        needle_length = radius - 40  # Distance from center to needle tip
-        needle_end = QPointF(
-            center.x() + needle_length * math.cos(rad),
-            center.y() + needle_length * math.sin(rad)
-        )
-        
-        # Draw glow effect in night mode
-        if self.night_mode:
-            for glow_width in [8, 6, 4]:
-                glow_alpha = 80 - (8 - glow_width) * 15  # Fade out the glow layers
-                glow_color = QColor(colors['needle'].red(), colors['needle'].green(), colors['needle'].blue(), glow_alpha)
-                glow_pen = QPen(glow_color, glow_width)
-                painter.setPen(glow_pen)
-                painter.drawLine(center, needle_end)
-        
-        # NEEDLE THICKNESS: Change the '2' to make needle thicker/thinner
-        pen = QPen(colors['needle'], 2)
-        painter.setPen(pen)
-        painter.drawLine(center, needle_end)
 
 
 class SpeedometerWidget(BaseGauge):
     """Speedometer gauge (0-260 km/h)"""
     
+    # Clockwise sweep: 0 km/h at 8 o'clock (240°)
+    START_ANGLE = 240  # 8 o'clock position
+    SWEEP_ANGLE = 300  # 300° clockwise sweep (ends ~7 o'clock after going around)
+    START_RAD = math.radians(START_ANGLE)
+    SWEEP_RAD = math.radians(SWEEP_ANGLE)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.max_speed = 260
+        self._ticks = None  # _tick_table for _ticks_max, rebuilt when max_speed changes
+        self._ticks_max = None
+        self._tick_font = QFont('Arial', 9)
     
     def set_speed(self, speed: float):
         """Update speed value"""
-        self.target_value = max(0, min(speed, self.max_speed))
-        self.update()
+        self._set_target(max(0, min(speed, self.max_speed)))
     
     def paintEvent(self, event):
         """Render speedometer"""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Smooth the value toward target
-        self._smooth_value()
-        
         colors = self._get_colors()
         center = QPointF(self.width() / 2, self.height() / 2)
         radius = min(self.width(), self.height()) / 2 - 20
         
-        # Draw gauge face
-        self._draw_gauge_face(painter, center, radius)
-        
-        # Draw tick marks and numbers
-        self._draw_ticks_speed(painter, center, radius, colors)
+        # Draw gauge face, tick marks and numbers (cached)
+        self._paint_static(painter, center, radius, colors)
         
         # Draw needle
-        self._draw_needle_speed(painter, center, radius, colors)
+        # NEEDLE SIZE: needle_length = radius - 40 (distance from center to tip), width 2
+        self._draw_needle(painter, center, radius - 40, 2)
         
         # Draw center cap
-        painter.setBrush(QBrush(colors['center']))
+        painter.setBrush(self._brush('center'))
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(center, 10, 10)
     
+    def _full_scale(self):
+        return self.max_speed
+    
+    def _static_state(self):
+        return (self.max_speed,)
+    
+    def _draw_static(self, painter: QPainter, center: QPointF, radius: float, colors: dict):
+        self._draw_gauge_face(painter, center, radius)
+        self._draw_ticks_speed(painter, center, radius, colors)
+    
     def _draw_ticks_speed(self, painter: QPainter, center: QPointF, radius: float, colors: dict):
         """Draw tick marks and speed numbers (0-260 km/h)"""
-        # Clockwise sweep: 0 km/h at 8 o'clock (240°), sweeping clockwise
-        start_angle = 240  # 8 o'clock position
-        sweep_angle = 300  # 300° clockwise sweep (ends ~7 o'clock after going around)
-        
-        for speed in range(0, int(self.max_speed) + 1, 20):
-            angle_fraction = speed / self.max_speed
-            angle = start_angle - sweep_angle * angle_fraction  # Subtract for clockwise
-            rad = math.radians(angle)
-            
-            # Major tick every 40 km/h
-            is_major = (speed % 40) == 0
-            tick_length = 30 if is_major else 15
-            tick_width = 3 if is_major else 1
-            
-            tick_start = QPointF(
-                center.x() + (radius - tick_length) * math.cos(rad),
-                center.y() + (radius - tick_length) * math.sin(rad)
-            )
-            tick_end = QPointF(
-                center.x() + radius * math.cos(rad),
-                center.y() + radius * math.sin(rad)
-            )
-            
-            painter.setPen(QPen(colors['tick_major'] if is_major else colors['tick_minor'], tick_width))
-            painter.drawLine(tick_start, tick_end)
-            
-            # Draw number for major ticks
-            if is_major:
-                painter.setFont(QFont('Arial', 9))
-                number_distance = radius - 50
-                number_x = center.x() + number_distance * math.cos(rad)
-                number_y = center.y() + number_distance * math.sin(rad)
-                painter.drawText(int(number_x - 15), int(number_y + 5), 30, 15, Qt.AlignCenter, str(speed))
-    
-    def _draw_needle_speed(self, painter: QPainter, center: QPointF, radius: float, colors: dict):
-        """Draw speed needle with optional glow in night mode"""
-        # Clockwise sweep from 8 o'clock (240°)
-        start_angle = 240
-        sweep_angle = 300  # 300° clockwise sweep
-        
-        angle_fraction = self.value / self.max_speed
-        angle = start_angle - sweep_angle * angle_fraction
-        rad = math.radians(angle)
-        
-        # NEEDLE SIZE: Change needle_length for length, pen width (below) for thickness
-        needle_length = radius - 40  # Distance from center to needle tip
-        needle_end = QPointF(
-            center.x() + needle_length * math.cos(rad),
-            center.y() + needle_length * math.sin(rad)
-        )
-        
-        # Draw glow effect in night mode
-        if self.night_mode:
-            for glow_width in [8, 6, 4]:
-                glow_alpha = 80 - (8 - glow_width) * 15  # Fade out the glow layers
-                glow_color = QColor(colors['needle'].red(), colors['needle'].green(), colors['needle'].blue(), glow_alpha)
-                glow_pen = QPen(glow_color, glow_width)
-                painter.setPen(glow_pen)
-                painter.drawLine(center, needle_end)
-        
-        # NEEDLE THICKNESS: Change the '2' to make needle thicker/thinner
-        pen = QPen(colors['needle'], 2)
-        painter.setPen(pen)
-        painter.drawLine(center, needle_end)
+        if self._ticks_max != self.max_speed:
+            self._ticks = _tick_table(range(0, int(self.max_speed) + 1, 20), self.max_speed, self.START_RAD, self.SWEEP_RAD)
+            self._ticks_max = self.max_speed
+        
+        cx, cy = center.x(), center.y()
+        number_distance = radius - 50
+        # Major tick every 40 km/h
+        major = [tick for tick in self._ticks if tick[2] % 40 == 0]
+        minor = [tick for tick in self._ticks if tick[2] % 40 != 0]
+        
+        painter.setPen(self._pen('tick_minor', 1))
+        painter.drawLines([
+            QLineF(cx + (radius - 15) * cos_a, cy + (radius - 15) * sin_a, cx + radius * cos_a, cy + radius * sin_a)
+            for cos_a, sin_a, _ in minor
+        ])
+        painter.setPen(self._pen('tick_major', 3))
+        painter.drawLines([
+            QLineF(cx + (radius - 30) * cos_a, cy + (radius - 30) * sin_a, cx + radius * cos_a, cy + radius * sin_a)
+            for cos_a, sin_a, _ in major
+        ])
+        
+        # Draw number for major ticks
+        painter.setFont(self._tick_font)
+        for cos_a, sin_a, speed in major:
+            number_x = cx + number_distance * cos_a
+            number_y = cy + number_distance * sin_a
+            painter.drawText(int(number_x - 15), int(number_y + 5), 30, 15, Qt.AlignCenter, str(speed))
 
 
 class FuelGaugeWidget(BaseGauge):
     """Fuel level gauge (E-F, 0-100%) with temperature and boost display"""
     
+    # Fuel gauge typically uses 90 degree sweep (left to right)
+    FULL_SCALE = 100  # Percent
+    EMPTY_ANGLE = 180  # E (empty) on left
+    FULL_ANGLE = 90  # F (full) on right
+    EMPTY_RAD = math.radians(EMPTY_ANGLE)
+    FULL_RAD = math.radians(FULL_ANGLE)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         # Value is percentage (0-100)
         self.temperature = 80
         self.boost = 0.0
+        self._label_font = QFont('Arial', 16, QFont.Bold)
+        self._info_font = QFont('Arial', 10)
     
     def set_fuel(self, percentage: float):
         """Update fuel level"""
-        self.target_value = max(0, min(percentage, 100))
-        self.update()
+        self._set_target(max(0, min(percentage, 100)))
     
     def set_temperature(self, temp: float):
         """Update coolant temperature"""
-        self.temperature = max(0, min(temp, 120))
+        temp = max(0, min(temp, 120))
+        if int(temp) != int(self.temperature):  # Only the whole degrees are shown
+            self._mark_dirty()
+        self.temperature = temp
     
     def set_boost(self, boost: float):
         """Update boost pressure"""
-        self.boost = max(0, min(boost, 2.5))
+        boost = max(0, min(boost, 2.5))
+        if f"{boost:.1f}" != f"{self.boost:.1f}":  # Shown to one decimal
+            self._mark_dirty()
+        self.boost = boost
     
     def paintEvent(self, event):
         """Render fuel gauge"""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Smooth the value toward target
-        self._smooth_value()
-        
         colors = self._get_colors()
         center = QPointF(self.width() / 2, self.height() / 2)
         radius = min(self.width(), self.height()) / 2 - 20
         
-        # Draw gauge face
-        self._draw_gauge_face(painter, center, radius)
-        
-        # Draw E and F marks
-        self._draw_fuel_labels(painter, center, radius, colors)
+        # Draw gauge face and E/F marks (cached)
+        self._paint_static(painter, center, radius, colors)
         
         # Draw needle
-        self._draw_needle_fuel(painter, center, radius, colors)
+        self._draw_needle(painter, center, radius - 30, 3)
         
         # Draw temperature and boost text
         self._draw_info_text(painter, center, colors)
         
         # Draw center cap
-        painter.setBrush(QBrush(colors['center']))
+        painter.setBrush(self._brush('center'))
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(center, 8, 8)
     
+    def _angle_map(self):
+        return self.EMPTY_RAD, (self.FULL_RAD - self.EMPTY_RAD) / 100  # Value is a percentage
+    
+    def _draw_static(self, painter: QPainter, center: QPointF, radius: float, colors: dict):
+        self._draw_gauge_face(painter, center, radius)
+        self._draw_fuel_labels(painter, center, radius, colors)
+    
     def _draw_fuel_labels(self, painter: QPainter, center: QPointF, radius: float, colors: dict):
         """Draw E (empty) and F (full) labels"""
-        # Fuel gauge typically uses 90 degree sweep (left to right)
-        left_angle = 180  # E (empty) on left
-        right_angle = 90  # F (full) on right
-        
         # Draw E (empty) label
-        e_rad = math.radians(left_angle)
+        e_rad = self.EMPTY_RAD
         e_pos = QPointF(
             center.x() + (radius - 60) * math.cos(e_rad),
             center.y() + (radius - 60) * math.sin(e_rad)
         )
         painter.setPen(colors['text'])
-        painter.setFont(QFont('Arial', 16, QFont.Bold))
+        painter.setFont(self._label_font)
         painter.drawText(int(e_pos.x() - 10), int(e_pos.y() + 5), "E")
         
         # Draw F (full) label
-        f_rad = math.radians(right_angle)
+        f_rad = self.FULL_RAD
         f_pos = QPointF(
             center.x() + (radius - 60) * math.cos(f_rad),
             center.y() + (radius - 60) * math.sin(f_rad)
@@ -373,53 +496,21 @@ class FuelGaugeWidget(BaseGauge):
         painter.drawText(int(f_pos.x() - 10), int(f_pos.y() + 5), "F")
         
         # Draw tick marks at E and F
-        for angle in [left_angle, right_angle]:
-            rad = math.radians(angle)
-            tick_start = QPointF(
+        tick_lines = []
+        for rad in [e_rad, f_rad]:
+            tick_lines.append(QLineF(
                 center.x() + (radius - 30) * math.cos(rad),
-                center.y() + (radius - 30) * math.sin(rad)
-            )
-            tick_end = QPointF(
+                center.y() + (radius - 30) * math.sin(rad),
                 center.x() + radius * math.cos(rad),
                 center.y() + radius * math.sin(rad)
-            )
-            pen = QPen(colors['tick_major'], 3)
-            painter.setPen(pen)
-            painter.drawLine(tick_start, tick_end)
-    
-    def _draw_needle_fuel(self, painter: QPainter, center: QPointF, radius: float, colors: dict):
-        """Draw fuel gauge needle with optional glow in night mode"""
-        # 90 degree sweep from E (180°) to F (90°)
-        left_angle = 180
-        right_angle = 90
-        
-        angle_fraction = self.value / 100  # percentage to fraction
-        angle = left_angle + (right_angle - left_angle) * angle_fraction
-        rad = math.radians(angle)
-        
-        needle_length = radius - 30
-        needle_end = QPointF(
-            center.x() + needle_length * math.cos(rad),
-            center.y() + needle_length * math.sin(rad)
-        )
-        
-        # Draw glow effect in night mode
-        if self.night_mode:
-            for glow_width in [8, 6, 4]:
-                glow_alpha = 80 - (8 - glow_width) * 15  # Fade out the glow layers
-                glow_color = QColor(colors['needle'].red(), colors['needle'].green(), colors['needle'].blue(), glow_alpha)
-                glow_pen = QPen(glow_color, glow_width)
-                painter.setPen(glow_pen)
-                painter.drawLine(center, needle_end)
-        
-        pen = QPen(colors['needle'], 3)
-        painter.setPen(pen)
-        painter.drawLine(center, needle_end)
+            ))
+        painter.setPen(self._pen('tick_major', 3))
+        painter.drawLines(tick_lines)
     
     def _draw_info_text(self, painter: QPainter, center: QPointF, colors: dict):
         """Draw temperature and boost information"""
-        painter.setPen(QPen(colors['text']))
-        painter.setFont(QFont('Arial', 10))
+        painter.setPen(self._pen('text', 1))
+        painter.setFont(self._info_font)
         
         # Temperature display (top)
         temp_text = f"T:{int(self.temperature)}°C"
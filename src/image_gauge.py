@@ -178,7 +178,7 @@ class ImageBasedGauge(QWidget):
                         if needle_end_x or needle_end_y:
                             dx = needle_end_x - needle_piv_x
                             dy = needle_end_y - needle_piv_y
-                            self.needle_length_px = (dx * dx + dy * dy) ** 0.5
+                            self.needle_length_px = math.hypot(dx, dy)
                             self.needle_base_angle = (math.degrees(math.atan2(dy, dx)) + 360) % 360
                         else:
                             self.needle_length_px = None
@@ -192,7 +192,7 @@ class ImageBasedGauge(QWidget):
                         if needle_end_x or needle_end_y:
                             dx = needle_end_x - needle_piv_x
                             dy = needle_end_y - needle_piv_y
-                            self.needle_length_px = (dx * dx + dy * dy) ** 0.5
+                            self.needle_length_px = math.hypot(dx, dy)
                             self.needle_base_angle = (math.degrees(math.atan2(dy, dx)) + 360) % 360
                         else:
                             self.needle_length_px = None
@@ -222,7 +222,7 @@ class ImageBasedGauge(QWidget):
                         py = point.get('y', 0)
                         dx = px - gauge_pivot_x
                         dy = py - gauge_pivot_y
-                        distances.append((dx * dx + dy * dy) ** 0.5)
+                        distances.append(math.hypot(dx, dy))
                     if distances:
                         self.desired_tip_radius_px = sum(distances) / len(distances)
                 
@@ -255,8 +255,7 @@ class ImageBasedGauge(QWidget):
             needle_id: Which needle to load
         """
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config = json.loads(Path(config_path).read_bytes())
             
             needle_calibrations = config.get('needle_calibrations', {})
             return self.load_v2_calibration(needle_calibrations, needle_id)
@@ -273,8 +272,7 @@ class ImageBasedGauge(QWidget):
             main_needle_id: The primary needle ID to use for the main gauge needle
         """
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config = json.loads(Path(config_path).read_bytes())
             
             needle_calibrations = config.get('needle_calibrations', {})
             
@@ -352,8 +350,8 @@ class ImageBasedGauge(QWidget):
         """Save all needle configurations to a JSON file"""
         try:
             # Load existing config
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config_path = Path(config_path)
+            config = json.loads(config_path.read_bytes())
             
             # Update needle calibrations with any modifications
             # (This preserves existing calibrations while allowing scale changes)
@@ -378,8 +376,7 @@ class ImageBasedGauge(QWidget):
                     config['needle_calibrations'][needle_name]['needle_scale'] = needle_data.get('scale', 1.0)
             
             # Write back
-            with open(config_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            config_path.write_text(json.dumps(config, indent=2))
             
             logger.info(f"✅ Saved needle config to {config_path}")
             return True
@@ -786,7 +783,7 @@ class ImageFuelGauge(ImageBasedGauge):
                 if needle_end_x or needle_end_y:
                     dx = needle_end_x - needle_piv_x
                     dy = needle_end_y - needle_piv_y
-                    self.water_needle_length_px = (dx * dx + dy * dy) ** 0.5
+                    self.water_needle_length_px = math.hypot(dx, dy)
                     self.water_base_angle = (math.degrees(math.atan2(dy, dx)) + 360) % 360
                 else:
                     self.water_needle_length_px = None
@@ -805,7 +802,7 @@ class ImageFuelGauge(ImageBasedGauge):
                         py = point.get('y', 0)
                         dx = px - gauge_pivot_x
                         dy = py - gauge_pivot_y
-                        distances.append((dx * dx + dy * dy) ** 0.5)
+                        distances.append(math.hypot(dx, dy))
                     if distances:
                         self.water_tip_radius_px = sum(distances) / len(distances)
                 
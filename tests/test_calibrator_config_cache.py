@@ -0,0 +1,244 @@
+"""
+Tests for Gauge Calibrator v2 config persistence
+
+Covers the in-memory config cache (edits, mtime invalidation, autosave/close
+flushing) and the payload-hash check that skips rewriting unchanged configs.
+"""
+
+import json
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt5.QtCore import QThreadPool
+from PyQt5.QtWidgets import QApplication
+
+from src.gauge_calibrator_v2 import GaugeCalibratorV2, NeedleCalibration, _dumps
+
+MAIN_NEEDLE = {"needle_id": "main", "gauge_name": "Tachometer", "calibration_points": []}
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def calibrator(qapp, tmp_path):
+    """Calibrator window whose configs live in tmp_path instead of the repo's config/"""
+    window = GaugeCalibratorV2()
+    window.config_dir = tmp_path
+    window._config_cache.clear()
+    window._dirty_configs.clear()
+    window._last_write_hash.clear()
+    window._autosave_dirty = False
+    yield window
+    window._autosave_timer.stop()
+    window._write_pool.waitForDone()
+    QThreadPool.globalInstance().waitForDone()
+    window.deleteLater()
+    qapp.processEvents()
+
+
+def _settle(window):
+    """Wait for background config writes and deliver their results"""
+    window._write_pool.waitForDone()
+    QApplication.processEvents()
+
+
+def _write_tachometer(config_dir, **values):
+    cal = NeedleCalibration(needle_id="main", needle_image_path="", gauge_name="Tachometer", **values)
+    (config_dir / "tachometer.json").write_bytes(
+        _dumps({"name": "Tachometer", "needle_calibrations": {"main": cal.to_dict()}}))
+
+
+def _file_id(path):
+    stat = path.stat()
+    return stat.st_ino, stat.st_mtime_ns
+
+
+def test_edit_then_flush_persists(calibrator):
+    config_file = calibrator._config_file("Tachometer")
+    with calibrator._editing_config(config_file, "Tachometer") as config:
+        config["needle_calibrations"]["main"] = MAIN_NEEDLE
+
+    on_disk = json.loads(config_file.read_text())
+    assert on_disk["name"] == "Tachometer"
+    assert on_disk["needle_calibrations"]["main"] == MAIN_NEEDLE
+    assert config_file not in calibrator._dirty_configs
+
+
+def test_deferred_edit_is_written_by_autosave_flush(calibrator):
+    config_file = calibrator._config_file("Tachometer")
+    with calibrator._editing_config(config_file, "Tachometer", flush=False) as config:
+        config["needle_calibrations"]["main"] = MAIN_NEEDLE
+    assert not config_file.exists()
+    assert config_file in calibrator._dirty_configs
+
+    calibrator._flush_dirty_configs()
+    _settle(calibrator)
+
+    assert json.loads(config_file.read_text())["needle_calibrations"]["main"] == MAIN_NEEDLE
+    # The background write's mtime is adopted, so the next read is served from the cache
+    assert calibrator._config_cache[config_file][0] == config_file.stat().st_mtime_ns
+
+
+def test_external_change_invalidates_cache(calibrator):
+    config_file = calibrator._config_file("Tachometer")
+    with calibrator._editing_config(config_file, "Tachometer") as config:
+        config["needle_calibrations"]["main"] = MAIN_NEEDLE
+
+    external = {"name": "Tachometer", "needle_calibrations": {"redline": {"needle_id": "redline"}}}
+    config_file.write_text(json.dumps(external))
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))  # Coarse-mtime filesystems
+
+    assert calibrator._get_config(config_file)["needle_calibrations"] == external["needle_calibrations"]
+
+
+def test_unsaved_edits_win_over_external_change(calibrator):
+    config_file = calibrator._config_file("Tachometer")
+    with calibrator._editing_config(config_file, "Tachometer", flush=False) as config:
+        config["needle_calibrations"]["main"] = MAIN_NEEDLE
+    config_file.write_text(json.dumps({"name": "Tachometer", "needle_calibrations": {}}))
+
+    assert calibrator._get_config(config_file)["needle_calibrations"]["main"] == MAIN_NEEDLE
+
+
+
+def test_failed_edit_is_not_written_later(calibrator):
+    config_file = calibrator._config_file("Tachometer")
+    with calibrator._editing_config(config_file, "Tachometer") as config:
+        config["needle_calibrations"]["main"] = MAIN_NEEDLE
+
+    with pytest.raises(ValueError):
+        with calibrator._editing_config(config_file, "Tachometer") as config:
+            config["needle_calibrations"]["main"] = {"needle_id": "half-applied"}
+            raise ValueError
+    with calibrator._editing_config(config_file, "Tachometer") as config:
+        config["needle_calibrations"]["redline"] = {"needle_id": "redline"}
+
+    on_disk = json.loads(config_file.read_text())["needle_calibrations"]
+    assert on_disk == {"main": MAIN_NEEDLE, "redline": {"needle_id": "redline"}}
+
+
+def test_failed_edit_keeps_earlier_unsaved_edits(calibrator):
+    config_file = calibrator._config_file("Tachometer")
+    with calibrator._editing_config(config_file, "Tachometer", flush=False) as config:
+        config["needle_calibrations"]["main"] = MAIN_NEEDLE
+
+    with pytest.raises(ValueError):
+        with calibrator._editing_config(config_file, "Tachometer") as config:
+            del config["needle_calibrations"]["main"]
+            raise ValueError
+
+    assert config_file in calibrator._dirty_configs
+    calibrator._flush_dirty_configs()
+    _settle(calibrator)
+    assert json.loads(config_file.read_text())["needle_calibrations"] == {"main": MAIN_NEEDLE}
+
+def test_close_flushes_pending_writes(calibrator):
+    tach_file = calibrator._config_file("Tachometer")
+    fuel_file = calibrator._config_file("Fuel")
+    # One edit already queued on the background writer, one still waiting for autosave
+    with calibrator._editing_config(tach_file, "Tachometer", flush=False) as config:
+        config["needle_calibrations"]["main"] = MAIN_NEEDLE
+    calibrator._flush_dirty_configs()
+    with calibrator._editing_config(fuel_file, "Fuel", flush=False) as config:
+        config["needle_calibrations"]["fuel"] = {"needle_id": "fuel"}
+
+    calibrator.close()
+
+    assert json.loads(tach_file.read_text())["needle_calibrations"]["main"] == MAIN_NEEDLE
+    assert json.loads(fuel_file.read_text())["needle_calibrations"]["fuel"] == {"needle_id": "fuel"}
+    assert not calibrator._dirty_configs
+
+
+
+def test_needle_switch_loads_config_in_background(calibrator, tmp_path):
+    _write_tachometer(tmp_path, needle_pivot_x=12.0, gauge_pivot_x=340.0)
+
+    calibrator.on_needle_changed("main")
+    assert calibrator._load_pending
+
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+
+    assert not calibrator._load_pending
+    assert calibrator.current_calibration.needle_pivot_x == 12.0
+    assert calibrator.gauge_pivot_x_spin.value() == 340
+    # Installed in the cache, so switching back is served from memory
+    assert calibrator._cached_config(tmp_path / "tachometer.json") is not None
+    assert calibrator.load_calibration_sets_for_needle("tachometer", "main")
+
+
+def test_superseded_load_is_dropped(calibrator, tmp_path):
+    _write_tachometer(tmp_path, needle_pivot_x=12.0)
+    assert not calibrator.load_calibration_sets_for_needle("tachometer", "main")
+
+    # A switch to a gauge without a config file completes at once and wins
+    assert calibrator.load_calibration_sets_for_needle("fuel", "main")
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+
+    assert calibrator.current_calibration.gauge_name == "fuel"
+    assert calibrator.current_calibration.needle_pivot_x == 0
+
+
+def test_autosave_waits_for_pending_load(calibrator, tmp_path):
+    _write_tachometer(tmp_path, needle_pivot_x=12.0)
+    before = _file_id(tmp_path / "tachometer.json")
+
+    calibrator.on_needle_changed("main")
+    calibrator._autosave_dirty = True
+    calibrator._do_autosave()  # Must not store the placeholder over the saved calibration
+    _settle(calibrator)
+
+    assert _file_id(tmp_path / "tachometer.json") == before
+
+
+def test_unchanged_payload_is_not_rewritten(calibrator):
+    config_file = calibrator._config_file("Tachometer")
+    with calibrator._editing_config(config_file, "Tachometer") as config:
+        config["needle_calibrations"]["main"] = MAIN_NEEDLE
+    before = _file_id(config_file)
+
+    with calibrator._editing_config(config_file, "Tachometer") as config:
+        config["needle_calibrations"]["main"] = dict(MAIN_NEEDLE)  # Equal content
+    calibrator._mark_config_dirty(config_file)
+    calibrator._flush_dirty_configs()
+    _settle(calibrator)
+
+    assert _file_id(config_file) == before
+
+
+def test_changed_payload_is_rewritten(calibrator):
+    config_file = calibrator._config_file("Tachometer")
+    with calibrator._editing_config(config_file, "Tachometer") as config:
+        config["needle_calibrations"]["main"] = MAIN_NEEDLE
+    before = _file_id(config_file)
+
+    with calibrator._editing_config(config_file, "Tachometer") as config:
+        config["needle_calibrations"]["main"] = {**MAIN_NEEDLE, "max_value": 9000}
+
+    assert _file_id(config_file) != before
+    assert json.loads(config_file.read_text())["needle_calibrations"]["main"]["max_value"] == 9000
+
+
+def test_hash_seeded_on_read_only_skips_identical_payload(calibrator):
+    """A file read from disk seeds the write hash; that must not swallow the first real edit"""
+    config_file = calibrator._config_file("Tachometer")
+    config_file.write_bytes(_dumps({"name": "Tachometer", "needle_calibrations": {"main": MAIN_NEEDLE}}))
+    before = _file_id(config_file)
+
+    # Saving what was read is a no-op...
+    with calibrator._editing_config(config_file, "Tachometer"):
+        pass
+    assert _file_id(config_file) == before
+
+    # ...but the first actual change is written
+    with calibrator._editing_config(config_file, "Tachometer") as config:
+        config["needle_calibrations"]["main"] = {**MAIN_NEEDLE, "min_value": 500}
+    assert _file_id(config_file) != before
+    assert json.loads(config_file.read_text())["needle_calibrations"]["main"]["min_value"] == 500
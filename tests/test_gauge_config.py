@@ -0,0 +1,54 @@
+"""
+Tests for gauge_config - from_dict round trips
+"""
+
+import copy
+import json
+from dataclasses import MISSING, fields
+
+from src.gauge_config import (
+    CalibrationPoint, NeedleCalibration, NeedleConfig, GaugeConfig, ConfigManager,
+    PositionBasedNeedleCalibration, PositionCalibrationPoint
+)
+
+
+def _sample_gauge(config_dir):
+    gauge = ConfigManager(str(config_dir)).get_default_fuel()
+    gauge.calibration_points = [CalibrationPoint(0, 180), CalibrationPoint(100, 90)]
+    gauge.needle_calibrations = {
+        "fuel": NeedleCalibration("fuel", "gauges/needle.svg", 12, 80, [CalibrationPoint(0, 180), CalibrationPoint(50, 135)])
+    }
+    return gauge
+
+
+def test_from_dict_round_trip(tmp_path):
+    """to_dict -> JSON -> from_dict gives back an equal object, without touching the input dict"""
+    gauge = _sample_gauge(tmp_path)
+    data = json.loads(json.dumps(gauge.to_dict()))
+    snapshot = copy.deepcopy(data)
+    assert GaugeConfig.from_dict(data) == gauge
+    assert data == snapshot
+    
+    position = PositionBasedNeedleCalibration(
+        needle_id="fuel", gauge_name="Fuel", needle_pivot_x=128, gauge_pivot_y=256,
+        calibration_points=[PositionCalibrationPoint(256, 150, 0), PositionCalibrationPoint(256, 360, 100)]
+    )
+    assert PositionBasedNeedleCalibration.from_dict(position.to_dict()) == position
+
+
+def test_from_dict_defaults_match_dataclass_fields():
+    """The hand-written from_dict defaults must track the field defaults they duplicate"""
+    for cls in (NeedleCalibration, PositionBasedNeedleCalibration, NeedleConfig, GaugeConfig):
+        loaded = cls.from_dict({})
+        for f in fields(cls):
+            default = f.default_factory() if f.default is MISSING else f.default
+            assert getattr(loaded, f.name) == default, f"{cls.__name__}.{f.name}"
+    assert GaugeConfig.from_dict({"name": "Boost"}) == GaugeConfig(name="Boost")
+
+
+def test_from_dict_ignores_unknown_keys(tmp_path):
+    """Keys a newer or older version wrote are skipped rather than failing the load"""
+    gauge = _sample_gauge(tmp_path)
+    assert GaugeConfig.from_dict({**gauge.to_dict(), "bogus": 1}) == gauge
+    assert NeedleConfig.from_dict({"name": "Main", "colour": "red"}) == NeedleConfig(name="Main")
+    assert CalibrationPoint.from_dict({"value": 0, "angle": 0, "x": 1}) == CalibrationPoint(0, 0)